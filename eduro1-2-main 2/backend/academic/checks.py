@@ -0,0 +1,27 @@
+from django.conf import settings
+from django.core.checks import Tags, Warning, register
+
+
+PROCESS_LOCAL_CACHES = (
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+)
+
+
+@register(Tags.caches)
+def check_shared_cache(app_configs, **kwargs):
+    """Warn when the hierarchy's version stamp cannot reach other workers."""
+    backend = settings.CACHES.get('default', {}).get('BACKEND')
+    if backend not in PROCESS_LOCAL_CACHES:
+        return []
+    return [
+        Warning(
+            'The default cache is not shared between processes.',
+            hint=(
+                'Academic snapshot version stamps are bumped in the cache, so other '
+                'workers keep serving a stale snapshot until ACADEMIC_HIERARCHY_MAX_AGE. '
+                'Set CACHE_REDIS_URL or use the database cache.'
+            ),
+            id='academic.W001',
+        )
+    ]
@@ -0,0 +1,317 @@
+import threading
+import time
+import uuid
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import time as clock_time
+from operator import attrgetter
+from types import MappingProxyType
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+
+VERSION_CACHE_KEY = 'academic:hierarchy:version'
+
+
+@dataclass(frozen=True)
+class DepartmentNode:
+    id: int
+    name: str
+    code: str
+
+
+@dataclass(frozen=True)
+class CourseNode:
+    id: int
+    department_id: int
+    name: str
+    duration_years: int
+
+
+@dataclass(frozen=True)
+class SemesterNode:
+    id: int
+    course_id: int
+    semester_number: int
+    academic_year: str
+
+
+@dataclass(frozen=True)
+class SubjectNode:
+    id: int
+    semester_id: int
+    name: str
+    code: str
+    credits: int
+
+
+@dataclass(frozen=True)
+class SlotNode:
+    id: int
+    subject_id: int
+    semester_id: int
+    teacher_id: int
+    weekday: int
+    start_time: clock_time
+    end_time: clock_time
+    room: str
+
+
+def _keys(slot):
+    keys = [('teacher', slot.teacher_id, slot.weekday), ('semester', slot.semester_id, slot.weekday)]
+    if slot.room:
+        keys.append(('room', slot.room, slot.weekday))
+    return keys
+
+
+class Timetable:
+    """Interval index over timetable slots.
+
+    Slots are filed under their teacher, semester and room for each weekday,
+    sorted by start time, next to the running maximum of their end times.
+    "What is on at T" and "does this slot clash" bisect to the last slot
+    starting in time and walk back only while that maximum still reaches
+    past the point asked about. create_slots() and TimetableSlot.clean()
+    keep slots under one key from overlapping, so the walk is normally a
+    single step; rows written around them are still found. Treat it as
+    read-only once it is part of a snapshot.
+    """
+
+    def __init__(self, slots=()):
+        self.starts = defaultdict(list)
+        self.slots = defaultdict(list)
+        self.reach = defaultdict(list)
+        for slot in sorted(slots, key=attrgetter('start_time')):
+            self.add(slot)
+
+    def add(self, slot):
+        for key in _keys(slot):
+            index = bisect_right(self.starts[key], slot.start_time)
+            self.starts[key].insert(index, slot.start_time)
+            self.slots[key].insert(index, slot)
+            reach = self.reach[key]
+            reach.insert(index, None)
+            running = reach[index - 1] if index else None
+            for position in range(index, len(reach)):
+                end_time = self.slots[key][position].end_time
+                running = end_time if running is None else max(running, end_time)
+                reach[position] = running
+
+    def day(self, kind, owner, weekday):
+        """Slots of a teacher, semester or room on a weekday, in time order."""
+        return tuple(self.slots.get((kind, owner, weekday), ()))
+
+    def _walk_back(self, key, index, moment):
+        """The latest-starting slot at or before `index` that ends after `moment`."""
+        slots, reach = self.slots[key], self.reach[key]
+        while index >= 0 and reach[index] > moment:
+            if slots[index].end_time > moment:
+                return slots[index]
+            index -= 1
+        return None
+
+    def at(self, kind, owner, weekday, moment):
+        """The slot running at `moment`, or None."""
+        key = (kind, owner, weekday)
+        starts = self.starts.get(key)
+        if not starts:
+            return None
+        return self._walk_back(key, bisect_right(starts, moment) - 1, moment)
+
+    def conflicts(self, slot):
+        """Existing slots clashing with `slot`, as {'teacher'|'semester'|'room': slot}."""
+        found = {}
+        for key in _keys(slot):
+            starts = self.starts.get(key)
+            if not starts:
+                continue
+            # Only slots starting before `slot` ends can overlap it.
+            other = self._walk_back(key, bisect_left(starts, slot.end_time) - 1, slot.start_time)
+            if other is not None:
+                found[key[0]] = other
+        return found
+
+
+@dataclass(frozen=True)
+class ScheduleEntry:
+    """A timetable slot with its labels resolved, ready to serialize."""
+    slot_id: int
+    weekday: int
+    start_time: clock_time
+    end_time: clock_time
+    room: str
+    teacher_id: int
+    subject_id: int
+    subject_code: str
+    subject_name: str
+    semester_id: int
+    semester_label: str
+
+
+class AcademicHierarchy:
+    """Immutable snapshot of departments, courses, semesters, subjects,
+    assignments and the timetable.
+
+    Nodes are looked up by id, and children and assignments through indexes
+    of ids in the order they were created. Every teacher's schedule for each
+    weekday is resolved up front. Nothing here touches the database once
+    built.
+    """
+
+    def __init__(self, version, departments, courses, semesters, subjects, assignments, slots=()):
+        self.version = version
+        self.built_at = time.monotonic()
+        self.departments = _by_id(departments)
+        self.courses = _by_id(courses)
+        self.semesters = _by_id(semesters)
+        self.subjects = _by_id(subjects)
+        self.courses_by_department = _index(courses, 'department_id')
+        self.semesters_by_course = _index(semesters, 'course_id')
+        self.subjects_by_semester = _index(subjects, 'semester_id')
+
+        subjects_by_teacher = defaultdict(list)
+        teachers_by_subject = defaultdict(list)
+        for teacher_id, subject_id in assignments:
+            subjects_by_teacher[teacher_id].append(subject_id)
+            teachers_by_subject[subject_id].append(teacher_id)
+        self.subjects_by_teacher = _freeze(subjects_by_teacher)
+        self.teachers_by_subject = _freeze(teachers_by_subject)
+
+        self.timetable = Timetable(
+            SlotNode(slot_id, subject_id, self.subjects[subject_id].semester_id, *rest)
+            for slot_id, subject_id, *rest in slots
+            if subject_id in self.subjects
+        )
+        self.schedule_entries = MappingProxyType({
+            slot.id: self._schedule_entry(slot)
+            for (kind, _, _), day in self.timetable.slots.items() if kind == 'teacher'
+            for slot in day
+        })
+
+    def _schedule_entry(self, slot):
+        subject = self.subjects[slot.subject_id]
+        return ScheduleEntry(
+            slot_id=slot.id,
+            weekday=slot.weekday,
+            start_time=slot.start_time,
+            end_time=slot.end_time,
+            room=slot.room,
+            teacher_id=slot.teacher_id,
+            subject_id=subject.id,
+            subject_code=subject.code,
+            subject_name=subject.name,
+            semester_id=subject.semester_id,
+            semester_label=self.semester_label(subject.semester_id),
+        )
+
+    def schedule(self, kind, owner, weekday):
+        """Schedule entries of a teacher, semester or room on a weekday, in time order."""
+        return tuple(self.schedule_entries[slot.id] for slot in self.timetable.day(kind, owner, weekday))
+
+    @classmethod
+    def load(cls, version):
+        from .models import Department, Course, Semester, Subject, TeacherSubjectAssignment, TimetableSlot
+
+        return cls(
+            version,
+            [DepartmentNode(*row) for row in Department.objects.order_by('id').values_list('id', 'name', 'code')],
+            [CourseNode(*row) for row in Course.objects.order_by('id').values_list('id', 'department_id', 'name', 'duration_years')],
+            [SemesterNode(*row) for row in Semester.objects.order_by('id').values_list('id', 'course_id', 'semester_number', 'academic_year')],
+            [SubjectNode(*row) for row in Subject.objects.order_by('id').values_list('id', 'semester_id', 'name', 'code', 'credits')],
+            TeacherSubjectAssignment.objects.order_by('id').values_list('teacher_id', 'subject_id'),
+            TimetableSlot.objects.values_list('id', 'subject_id', 'teacher_id', 'weekday', 'start_time', 'end_time', 'room'),
+        )
+
+    def course_label(self, course_id):
+        course = self.courses.get(course_id)
+        department = course and self.departments.get(course.department_id)
+        if department is None:
+            return None
+        return f"{course.name} - {department.code}"
+
+    def semester_label(self, semester_id):
+        semester = self.semesters.get(semester_id)
+        course = semester and self.courses.get(semester.course_id)
+        if course is None:
+            return None
+        return f"Semester {semester.semester_number} - {course.name} ({semester.academic_year})"
+
+    def subject_label(self, subject_id):
+        subject = self.subjects.get(subject_id)
+        if subject is None:
+            return None
+        return f"{subject.code} - {subject.name}"
+
+
+def _by_id(nodes):
+    return MappingProxyType({node.id: node for node in nodes})
+
+
+def _index(nodes, attribute):
+    children = defaultdict(list)
+    for node in nodes:
+        children[getattr(node, attribute)].append(node.id)
+    return _freeze(children)
+
+
+def _freeze(index):
+    return MappingProxyType({key: tuple(values) for key, values in index.items()})
+
+
+_hierarchy = None
+_checked_at = 0.0
+_lock = threading.Lock()
+
+
+def get_hierarchy():
+    """Return the current snapshot, rebuilding it when the version stamp has moved.
+
+    The stamp lives in the shared cache (see CACHES) and is read at most
+    once every ACADEMIC_HIERARCHY_CHECK_INTERVAL seconds, so every worker
+    picks up a change within that interval; check academic.W001 flags a
+    per-process cache. Snapshots older than ACADEMIC_HIERARCHY_MAX_AGE are
+    rebuilt regardless, as a backstop for a write that was rolled back
+    after bumping the stamp.
+    """
+    global _hierarchy, _checked_at
+    hierarchy = _hierarchy
+    now = time.monotonic()
+    if hierarchy is not None and now - _checked_at < settings.ACADEMIC_HIERARCHY_CHECK_INTERVAL:
+        return hierarchy
+
+    with _lock:
+        # The stamp is read before the rows, so a write landing mid-build
+        # leaves a newer stamp behind and triggers another rebuild.
+        version = cache.get(VERSION_CACHE_KEY)
+        if version is None:
+            version = uuid.uuid4().hex
+            cache.add(VERSION_CACHE_KEY, version, None)
+            version = cache.get(VERSION_CACHE_KEY, version)
+        if (
+            _hierarchy is None
+            or _hierarchy.version != version
+            or now - _hierarchy.built_at > settings.ACADEMIC_HIERARCHY_MAX_AGE
+        ):
+            _hierarchy = AcademicHierarchy.load(version)
+        _checked_at = time.monotonic()
+        return _hierarchy
+
+
+def bump_hierarchy_version():
+    """Invalidate every worker's snapshot now and again once the write commits.
+
+    The immediate bump lets this connection see its own uncommitted change;
+    the second one stops other workers keeping a snapshot they rebuilt
+    before the commit. A rolled-back write gets no second bump, so a
+    snapshot built in between may show it until it reaches its max age.
+    """
+    _bump()
+    transaction.on_commit(_bump)
+
+
+def _bump():
+    global _hierarchy
+    cache.set(VERSION_CACHE_KEY, uuid.uuid4().hex, None)
+    _hierarchy = None
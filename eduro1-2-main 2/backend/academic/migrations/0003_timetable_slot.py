@@ -0,0 +1,39 @@
+# Generated by Django 4.2.7 on 2026-10-18 15:18
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0001_initial'),
+        ('academic', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TimetableSlot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('weekday', models.PositiveSmallIntegerField(choices=[(0, 'Monday'), (1, 'Tuesday'), (2, 'Wednesday'), (3, 'Thursday'), (4, 'Friday'), (5, 'Saturday'), (6, 'Sunday')])),
+                ('start_time', models.TimeField()),
+                ('end_time', models.TimeField()),
+                ('room', models.CharField(blank=True, max_length=50)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('subject', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='timetable_slots', to='academic.subject')),
+                ('teacher', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='timetable_slots', to='authentication.teacher')),
+            ],
+            options={
+                'verbose_name': 'Timetable Slot',
+                'verbose_name_plural': 'Timetable Slots',
+                'db_table': 'timetable_slots',
+                'indexes': [models.Index(fields=['teacher', 'weekday', 'start_time'], name='timetable_s_teacher_686668_idx'), models.Index(fields=['subject', 'weekday'], name='timetable_s_subject_8f602b_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='timetableslot',
+            constraint=models.CheckConstraint(check=models.Q(('end_time__gt', models.F('start_time'))), name='timetable_slot_ends_after_start'),
+        ),
+    ]
@@ -1,4 +1,6 @@
+from django.core.exceptions import ValidationError
 from django.db import models
+from .hierarchy import get_hierarchy
 
 
 class Department(models.Model):
@@ -34,7 +36,9 @@ class Course(models.Model):
         verbose_name_plural = 'Courses'
 
     def __str__(self):
-        return f"{self.name} - {self.department.code}"
+        department = get_hierarchy().departments.get(self.department_id)
+        code = department.code if department else self.department.code
+        return f"{self.name} - {code}"
 
 
 class Semester(models.Model):
@@ -55,7 +59,8 @@ class Semester(models.Model):
         ]
 
     def __str__(self):
-        return f"Semester {self.semester_number} - {self.course.name} ({self.academic_year})"
+        course = get_hierarchy().courses.get(self.course_id) or self.course
+        return f"Semester {self.semester_number} - {course.name} ({self.academic_year})"
 
 
 class Subject(models.Model):
@@ -94,4 +99,63 @@ class TeacherSubjectAssignment(models.Model):
         unique_together = [['teacher', 'subject']]
 
     def __str__(self):
-        return f"{self.teacher.full_name} - {self.subject.code}"
+        subject = get_hierarchy().subjects.get(self.subject_id) or self.subject
+        return f"{self.teacher.full_name} - {subject.code}"
+
+
+class TimetableSlot(models.Model):
+    """A weekly recurring lecture of a subject, taught by one teacher."""
+    WEEKDAY_CHOICES = [
+        (0, 'Monday'),
+        (1, 'Tuesday'),
+        (2, 'Wednesday'),
+        (3, 'Thursday'),
+        (4, 'Friday'),
+        (5, 'Saturday'),
+        (6, 'Sunday'),
+    ]
+
+    subject = models.ForeignKey(Subject, on_delete=models.CASCADE, related_name='timetable_slots')
+    teacher = models.ForeignKey('authentication.Teacher', on_delete=models.CASCADE, related_name='timetable_slots')
+    weekday = models.PositiveSmallIntegerField(choices=WEEKDAY_CHOICES)
+    start_time = models.TimeField()
+    end_time = models.TimeField()
+    room = models.CharField(max_length=50, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'timetable_slots'
+        verbose_name = 'Timetable Slot'
+        verbose_name_plural = 'Timetable Slots'
+        indexes = [
+            models.Index(fields=['teacher', 'weekday', 'start_time']),
+            models.Index(fields=['subject', 'weekday']),
+        ]
+        constraints = [
+            models.CheckConstraint(check=models.Q(end_time__gt=models.F('start_time')), name='timetable_slot_ends_after_start'),
+        ]
+
+    def __str__(self):
+        subject = get_hierarchy().subjects.get(self.subject_id) or self.subject
+        return f"{subject.code} - {self.get_weekday_display()} {self.start_time:%H:%M}-{self.end_time:%H:%M}"
+
+    def clean(self):
+        """Reject a slot overlapping its teacher's, semester's or room's other slots.
+
+        save() runs this too, so forms and plain saves cannot slip an overlap
+        into the timetable; create_slots() checks its bulk inserts itself.
+        """
+        from .timetable import slot_clashes
+
+        if None in (self.subject_id, self.teacher_id, self.weekday, self.start_time, self.end_time):
+            return
+        if self.end_time <= self.start_time:
+            raise ValidationError({'end_time': 'End time must be after the start time.'})
+        clashes = slot_clashes(self)
+        if clashes:
+            raise ValidationError(clashes)
+
+    def save(self, *args, **kwargs):
+        self.clean()
+        super().save(*args, **kwargs)
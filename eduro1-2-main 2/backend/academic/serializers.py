@@ -0,0 +1,34 @@
+from rest_framework import serializers
+from .models import TimetableSlot
+
+
+class TimetableSlotEntrySerializer(serializers.Serializer):
+    subject_id = serializers.IntegerField()
+    teacher_id = serializers.IntegerField()
+    weekday = serializers.ChoiceField(choices=TimetableSlot.WEEKDAY_CHOICES)
+    start_time = serializers.TimeField()
+    end_time = serializers.TimeField()
+    room = serializers.CharField(max_length=50, required=False, allow_blank=True)
+
+    def validate(self, data):
+        if data['end_time'] <= data['start_time']:
+            raise serializers.ValidationError('end_time must be after start_time.')
+        return data
+
+
+class TimetableBulkCreateSerializer(serializers.Serializer):
+    slots = TimetableSlotEntrySerializer(many=True, allow_empty=False)
+
+
+class TimetableQuerySerializer(serializers.Serializer):
+    teacher_id = serializers.IntegerField(required=False)
+    semester_id = serializers.IntegerField(required=False)
+    weekday = serializers.ChoiceField(choices=TimetableSlot.WEEKDAY_CHOICES, required=False)
+    at = serializers.TimeField(required=False)
+
+    def validate(self, data):
+        if ('teacher_id' in data) == ('semester_id' in data):
+            raise serializers.ValidationError('Provide exactly one of teacher_id or semester_id.')
+        if 'at' in data and 'weekday' not in data:
+            raise serializers.ValidationError('weekday is required with at.')
+        return data
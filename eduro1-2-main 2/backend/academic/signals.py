@@ -0,0 +1,20 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from .hierarchy import bump_hierarchy_version
+from .models import Department, Course, Semester, Subject, TeacherSubjectAssignment, TimetableSlot
+
+
+@receiver(post_save, sender=Department)
+@receiver(post_save, sender=Course)
+@receiver(post_save, sender=Semester)
+@receiver(post_save, sender=Subject)
+@receiver(post_save, sender=TeacherSubjectAssignment)
+@receiver(post_save, sender=TimetableSlot)
+@receiver(post_delete, sender=Department)
+@receiver(post_delete, sender=Course)
+@receiver(post_delete, sender=Semester)
+@receiver(post_delete, sender=Subject)
+@receiver(post_delete, sender=TeacherSubjectAssignment)
+@receiver(post_delete, sender=TimetableSlot)
+def hierarchy_changed(sender, instance, **kwargs):
+    bump_hierarchy_version()
@@ -1,3 +1,154 @@
-from django.test import TestCase
+from datetime import time
+from django.core.exceptions import ValidationError
+from django.test import SimpleTestCase, TestCase, override_settings
+from authentication.models import Teacher
+from backend.testing import QueryBudgetMixin
+from .checks import check_shared_cache
+from .hierarchy import SlotNode, Timetable, bump_hierarchy_version, get_hierarchy
+from .models import Department, Course, Semester, Subject, TeacherSubjectAssignment, TimetableSlot
+from .timetable import create_slots
 
-# Create your tests here.
+
+class AcademicHierarchyTests(QueryBudgetMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.department = Department.objects.create(name='Computer Science', code='CS')
+        cls.course = Course.objects.create(department=cls.department, name='B.Tech', duration_years=4)
+        cls.semester = Semester.objects.create(course=cls.course, semester_number=3, academic_year='2024-2025')
+        cls.subject = Subject.objects.create(semester=cls.semester, name='Data Structures', code='CS301')
+        cls.teacher = Teacher.objects.create(
+            email='teacher@sims.edu', full_name='Teacher', employee_id='T0001', department=cls.department,
+        )
+        cls.assignment = TeacherSubjectAssignment.objects.create(teacher=cls.teacher, subject=cls.subject)
+
+    def setUp(self):
+        # Writes rolled back at the end of another test never bump the stamp.
+        bump_hierarchy_version()
+
+    def test_lookups_and_labels_cost_no_queries(self):
+        get_hierarchy()
+        with self.assertMaxQueries(0):
+            hierarchy = get_hierarchy()
+            self.assertEqual(hierarchy.semester_label(self.semester.id), 'Semester 3 - B.Tech (2024-2025)')
+            self.assertEqual(hierarchy.subjects_by_semester[self.semester.id], (self.subject.id,))
+            self.assertEqual(hierarchy.subjects_by_teacher[self.teacher.id], (self.subject.id,))
+            self.assertEqual(hierarchy.course_label(self.course.id), 'B.Tech - CS')
+
+    def test_str_uses_snapshot_for_parents(self):
+        course = Course.objects.get(pk=self.course.pk)
+        semester = Semester.objects.get(pk=self.semester.pk)
+        assignment = TeacherSubjectAssignment.objects.select_related('teacher').get(pk=self.assignment.pk)
+        get_hierarchy()
+        with self.assertMaxQueries(0):
+            self.assertEqual(str(course), 'B.Tech - CS')
+            self.assertEqual(str(semester), 'Semester 3 - B.Tech (2024-2025)')
+            self.assertEqual(str(assignment), 'Teacher - CS301')
+
+    def test_save_and_delete_refresh_snapshot(self):
+        get_hierarchy()
+        self.course.name = 'B.E.'
+        self.course.save()
+        self.assertEqual(get_hierarchy().semester_label(self.semester.id), 'Semester 3 - B.E. (2024-2025)')
+
+        subject_id = self.subject.id
+        self.subject.delete()
+        hierarchy = get_hierarchy()
+        self.assertNotIn(subject_id, hierarchy.subjects)
+        self.assertNotIn(self.teacher.id, hierarchy.subjects_by_teacher)
+
+
+class TimetableIndexTests(TestCase):
+    def slot(self, slot_id, start, end, teacher_id=1, semester_id=1, room=''):
+        return SlotNode(slot_id, 1, semester_id, teacher_id, 0, time(start), time(end), room)
+
+    def test_lookup_at_time(self):
+        timetable = Timetable([self.slot(1, 9, 10), self.slot(2, 11, 12)])
+        self.assertEqual(timetable.at('teacher', 1, 0, time(9, 30)).id, 1)
+        self.assertIsNone(timetable.at('teacher', 1, 0, time(10, 30)))
+        self.assertEqual(timetable.at('semester', 1, 0, time(11)).id, 2)
+        self.assertIsNone(timetable.at('teacher', 1, 0, time(12)))
+
+    def test_overlapping_slots_are_still_found(self):
+        # A long slot written around create_slots() hides behind a short one.
+        timetable = Timetable([self.slot(1, 9, 13), self.slot(2, 10, 11)])
+        self.assertEqual(timetable.at('teacher', 1, 0, time(12)).id, 1)
+        self.assertEqual(timetable.at('teacher', 1, 0, time(10, 30)).id, 2)
+        self.assertEqual(timetable.conflicts(self.slot(None, 12, 14))['teacher'].id, 1)
+        self.assertEqual(timetable.conflicts(self.slot(None, 13, 14)), {})
+
+    def test_conflicts(self):
+        timetable = Timetable([self.slot(1, 9, 10, room='A1'), self.slot(2, 11, 12)])
+        self.assertEqual(timetable.conflicts(self.slot(None, 10, 11, teacher_id=2, semester_id=2)), {})
+        clashes = timetable.conflicts(self.slot(None, 8, 13, teacher_id=2, semester_id=2, room='A1'))
+        self.assertEqual({kind: slot.id for kind, slot in clashes.items()}, {'room': 1})
+        clashes = timetable.conflicts(self.slot(None, 9, 12))
+        self.assertEqual({kind: slot.id for kind, slot in clashes.items()}, {'teacher': 2, 'semester': 2})
+
+
+class TimetableTestData:
+    @classmethod
+    def setUpTestData(cls):
+        department = Department.objects.create(name='Computer Science', code='CS')
+        course = Course.objects.create(department=department, name='B.Tech', duration_years=4)
+        semester = Semester.objects.create(course=course, semester_number=3, academic_year='2024-2025')
+        cls.subject = Subject.objects.create(semester=semester, name='Data Structures', code='CS301')
+        cls.teacher = Teacher.objects.create(
+            email='teacher@sims.edu', full_name='Teacher', employee_id='T0001', department=department,
+        )
+        TeacherSubjectAssignment.objects.create(teacher=cls.teacher, subject=cls.subject)
+        TimetableSlot.objects.create(
+            subject=cls.subject, teacher=cls.teacher, weekday=0, start_time=time(9), end_time=time(10), room='A1',
+        )
+
+
+class CreateSlotsTests(TimetableTestData, TestCase):
+    def entry(self, start, end, weekday=0, room=''):
+        return {
+            'subject_id': self.subject.id, 'teacher_id': self.teacher.id, 'weekday': weekday,
+            'start_time': time(start), 'end_time': time(end), 'room': room,
+        }
+
+    def test_clashes_reject_the_whole_batch(self):
+        slots, errors = create_slots([self.entry(11, 12), self.entry(9, 11), self.entry(11, 13, weekday=1)])
+        self.assertEqual(slots, [])
+        self.assertEqual([error['index'] for error in errors], [1])
+        self.assertEqual(TimetableSlot.objects.count(), 1)
+
+        _, errors = create_slots([self.entry(11, 13), self.entry(12, 14)])
+        self.assertEqual([error['index'] for error in errors], [1])
+
+    def test_valid_batch_is_inserted_and_indexed(self):
+        bump_hierarchy_version()
+        slots, errors = create_slots([self.entry(10, 11, room='A1'), self.entry(9, 10, weekday=1)])
+        self.assertEqual((len(slots), errors), (2, []))
+        self.assertEqual(
+            [slot.start_time for slot in get_hierarchy().timetable.day('teacher', self.teacher.id, 0)],
+            [time(9), time(10)],
+        )
+
+class TimetableSlotSaveTests(TimetableTestData, TestCase):
+    def slot(self, start, end, **kwargs):
+        return TimetableSlot(
+            subject=self.subject, teacher=self.teacher, weekday=0, start_time=time(start), end_time=time(end), **kwargs
+        )
+
+    def test_plain_save_rejects_overlaps(self):
+        with self.assertRaises(ValidationError):
+            self.slot(9, 11).save()
+        self.slot(10, 11).save()
+        self.assertEqual(TimetableSlot.objects.count(), 2)
+
+    def test_moving_a_slot_ignores_its_old_position(self):
+        slot = TimetableSlot.objects.get()
+        slot.end_time = time(10, 30)
+        slot.save()
+        self.assertEqual(TimetableSlot.objects.get().end_time, time(10, 30))
+
+
+class SharedCacheCheckTests(SimpleTestCase):
+    def test_configured_cache_is_shared(self):
+        self.assertEqual(check_shared_cache(None), [])
+
+    @override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+    def test_process_local_cache_is_flagged(self):
+        self.assertEqual([warning.id for warning in check_shared_cache(None)], ['academic.W001'])
@@ -0,0 +1,113 @@
+from django.db import transaction
+from django.db.models import Q
+from authentication.models import Teacher
+from .hierarchy import SlotNode, Timetable, bump_hierarchy_version, get_hierarchy
+from .models import Semester, Subject, TeacherSubjectAssignment, TimetableSlot
+
+
+KIND_LABELS = {'teacher': 'Teacher', 'semester': 'Semester', 'room': 'Room'}
+WEEKDAYS = dict(TimetableSlot.WEEKDAY_CHOICES)
+
+
+def create_slots(entries):
+    """Check a batch of new slots against the timetable and each other, then insert them.
+
+    Only the existing slots of the teachers, semesters and rooms involved
+    are loaded. Returns (slots, errors); nothing is inserted when any entry
+    has errors, which are reported per entry index.
+    """
+    teacher_ids = sorted({entry['teacher_id'] for entry in entries})
+    rooms = {entry['room'] for entry in entries if entry.get('room')}
+
+    with transaction.atomic():
+        # Lock the teachers and semesters involved, in id order, so that
+        # overlapping batches for any of them are checked one after the
+        # other; otherwise both could pass the check and book the same hour.
+        list(Teacher.objects.select_for_update().filter(id__in=teacher_ids).order_by('id').values_list('id'))
+        subject_semesters = dict(
+            Subject.objects.filter(id__in={entry['subject_id'] for entry in entries}).values_list('id', 'semester_id')
+        )
+        list(
+            Semester.objects.select_for_update().filter(id__in=set(subject_semesters.values()))
+            .order_by('id').values_list('id')
+        )
+
+        assigned = set(
+            TeacherSubjectAssignment.objects.filter(subject_id__in=subject_semesters).values_list('teacher_id', 'subject_id')
+        )
+        timetable = load_timetable(teacher_ids, set(subject_semesters.values()), rooms)
+
+        errors = []
+        for index, entry in enumerate(entries):
+            semester_id = subject_semesters.get(entry['subject_id'])
+            if semester_id is None:
+                errors.append({'index': index, 'errors': {'subject_id': ['Subject not found.']}})
+                continue
+            if (entry['teacher_id'], entry['subject_id']) not in assigned:
+                errors.append({'index': index, 'errors': {'teacher_id': ['Subject is not assigned to this teacher.']}})
+                continue
+
+            slot = SlotNode(
+                None, entry['subject_id'], semester_id, entry['teacher_id'], entry['weekday'],
+                entry['start_time'], entry['end_time'], entry.get('room', ''),
+            )
+            clashes = timetable.conflicts(slot)
+            if clashes:
+                errors.append({'index': index, 'errors': {
+                    'non_field_errors': [_clash_message(kind, other) for kind, other in clashes.items()],
+                }})
+                continue
+            timetable.add(slot)
+
+        if errors:
+            return [], errors
+
+        slots = TimetableSlot.objects.bulk_create([
+            TimetableSlot(
+                subject_id=entry['subject_id'],
+                teacher_id=entry['teacher_id'],
+                weekday=entry['weekday'],
+                start_time=entry['start_time'],
+                end_time=entry['end_time'],
+                room=entry.get('room', ''),
+            )
+            for entry in entries
+        ])
+        # bulk_create skips the signals that would refresh the snapshot.
+        bump_hierarchy_version()
+    return slots, []
+
+
+def load_timetable(teacher_ids, semester_ids, rooms, exclude_id=None):
+    """Index the existing slots of the given teachers, semesters and rooms."""
+    existing = TimetableSlot.objects.filter(
+        Q(teacher_id__in=teacher_ids) | Q(subject__semester_id__in=semester_ids) | Q(room__in=rooms)
+    )
+    if exclude_id is not None:
+        existing = existing.exclude(pk=exclude_id)
+    return Timetable(
+        SlotNode(*row) for row in existing.values_list(
+            'id', 'subject_id', 'subject__semester_id', 'teacher_id', 'weekday', 'start_time', 'end_time', 'room',
+        )
+    )
+
+
+def slot_clashes(instance):
+    """Clash messages for a TimetableSlot about to be saved, against every other slot."""
+    semester_id = Subject.objects.filter(pk=instance.subject_id).values_list('semester_id', flat=True).first()
+    rooms = [instance.room] if instance.room else []
+    timetable = load_timetable([instance.teacher_id], [semester_id], rooms, exclude_id=instance.pk)
+    slot = SlotNode(
+        instance.pk, instance.subject_id, semester_id, instance.teacher_id, instance.weekday,
+        instance.start_time, instance.end_time, instance.room,
+    )
+    return [_clash_message(kind, other) for kind, other in timetable.conflicts(slot).items()]
+
+
+def _clash_message(kind, other):
+    subject = get_hierarchy().subjects.get(other.subject_id)
+    code = subject.code if subject else f'subject {other.subject_id}'
+    return (
+        f"{KIND_LABELS[kind]} is already booked for {code} on {WEEKDAYS[other.weekday]} "
+        f"{other.start_time:%H:%M}-{other.end_time:%H:%M}."
+    )
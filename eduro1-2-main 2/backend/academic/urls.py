@@ -0,0 +1,7 @@
+from django.urls import path
+from .views import TimetableSlotDetailView, TimetableView
+
+urlpatterns = [
+    path('admin/timetable', TimetableView.as_view(), name='admin-timetable'),
+    path('admin/timetable/<int:slot_id>', TimetableSlotDetailView.as_view(), name='admin-timetable-slot'),
+]
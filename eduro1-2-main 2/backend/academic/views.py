@@ -1,3 +1,62 @@
-from django.shortcuts import render
+from dataclasses import asdict
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from authentication.permissions import IsAdmin
+from .hierarchy import get_hierarchy
+from .models import TimetableSlot
+from .serializers import TimetableBulkCreateSerializer, TimetableQuerySerializer
+from .timetable import create_slots
 
-# Create your views here.
+
+class TimetableView(APIView):
+    """Read a teacher's or semester's weekly timetable, or add slots in bulk.
+
+    GET takes teacher_id or semester_id, optionally narrowed to a weekday;
+    with `at` as well it returns only the slot running at that time. Reads
+    come from the in-process snapshot and run no queries.
+    """
+    permission_classes = [IsAdmin]
+
+    def get(self, request):
+        query = TimetableQuerySerializer(data=request.query_params)
+        if not query.is_valid():
+            return Response({'error': 'Invalid filters', 'details': query.errors}, status=status.HTTP_400_BAD_REQUEST)
+
+        data = query.validated_data
+        kind, owner = ('teacher', data['teacher_id']) if 'teacher_id' in data else ('semester', data['semester_id'])
+        hierarchy = get_hierarchy()
+
+        if 'at' in data:
+            slot = hierarchy.timetable.at(kind, owner, data['weekday'], data['at'])
+            return Response({'slot': asdict(hierarchy.schedule_entries[slot.id]) if slot else None})
+
+        weekdays = [data['weekday']] if 'weekday' in data else range(7)
+        return Response({
+            'slots': [asdict(entry) for weekday in weekdays for entry in hierarchy.schedule(kind, owner, weekday)],
+        })
+
+    def post(self, request):
+        serializer = TimetableBulkCreateSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response({'error': 'Invalid data', 'details': serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
+
+        slots, errors = create_slots(serializer.validated_data['slots'])
+        if errors:
+            return Response({'error': 'Timetable conflicts', 'details': errors}, status=status.HTTP_400_BAD_REQUEST)
+
+        entries = get_hierarchy().schedule_entries
+        return Response({
+            'created': len(slots),
+            'slots': [asdict(entries[slot.id]) for slot in slots if slot.id in entries],
+        }, status=status.HTTP_201_CREATED)
+
+
+class TimetableSlotDetailView(APIView):
+    permission_classes = [IsAdmin]
+
+    def delete(self, request, slot_id):
+        deleted, _ = TimetableSlot.objects.filter(id=slot_id).delete()
+        if not deleted:
+            return Response({'error': 'Timetable slot not found'}, status=status.HTTP_404_NOT_FOUND)
+        return Response(status=status.HTTP_204_NO_CONTENT)
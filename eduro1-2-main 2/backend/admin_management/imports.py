@@ -0,0 +1,326 @@
+import csv
+import io
+import logging
+import threading
+import zipfile
+from datetime import timedelta
+from itertools import islice
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.db import connection, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+from openpyxl import load_workbook
+from openpyxl.utils.exceptions import InvalidFileException
+from academic.models import Semester
+from authentication.hashers import make_passwords, password_hashing_executor
+from authentication.models import Student
+from reports.dashboards import invalidate_dashboards
+from .models import StudentImport, StudentImportErrors
+from .serializers import StudentImportRowSerializer
+
+
+logger = logging.getLogger(__name__)
+
+REQUIRED_COLUMNS = ('email', 'full_name', 'roll_number', 'enrollment_year')
+
+
+class ImportFileError(ValueError):
+    """Raised when an uploaded file cannot be read or lacks required columns."""
+
+
+def read_rows(handle, file_format):
+    """Stream a CSV or XLSX file as (row_number, values) pairs, one at a time.
+
+    The first pair is (1, column names); after it come the non-empty data
+    rows as dicts without their blank cells. Row numbers are the ones a
+    spreadsheet shows.
+    """
+    if file_format == 'xlsx':
+        workbook = load_workbook(handle, read_only=True, data_only=True)
+        try:
+            yield from _rows_with_header(workbook.active.iter_rows(values_only=True))
+        finally:
+            workbook.close()
+    else:
+        text = io.TextIOWrapper(handle, encoding='utf-8-sig', newline='')
+        try:
+            yield from _rows_with_header(csv.reader(text))
+        finally:
+            # Hand the binary file back to its owner instead of closing it.
+            if not handle.closed:
+                text.detach()
+
+
+def _rows_with_header(rows):
+    header = next(rows, None)
+    if header is None:
+        return
+    columns = [_column_name(name) for name in header]
+    yield 1, columns
+    for number, row in enumerate(rows, start=2):
+        values = {}
+        for column, value in zip(columns, row):
+            value = _cell(value)
+            if column and value is not None:
+                values[column] = value
+        if values:
+            yield number, values
+
+
+def _column_name(name):
+    if name is None:
+        return None
+    return str(name).strip().lower().replace(' ', '_') or None
+
+
+def _cell(value):
+    if value is None:
+        return None
+    # Spreadsheets store roll numbers, phones and years as floats.
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value).strip() or None
+
+
+def data_rows(handle, file_format, after=0):
+    """Data rows of a file, skipping the header and any row up to `after`."""
+    rows = read_rows(handle, file_format)
+    next(rows, None)
+    return (row for row in rows if row[0] > after)
+
+
+def scan_upload(upload, file_format, default_password=None):
+    """Check an upload's header and count its data rows in one streaming pass."""
+    upload.seek(0)
+    try:
+        rows = read_rows(upload, file_format)
+        _, columns = next(rows, (None, []))
+        total = sum(1 for _ in rows)
+    except (csv.Error, UnicodeDecodeError, zipfile.BadZipFile, InvalidFileException, KeyError):
+        raise ImportFileError('Could not read the file.')
+    finally:
+        upload.seek(0)
+
+    missing = [column for column in REQUIRED_COLUMNS if column not in columns]
+    if missing:
+        raise ImportFileError(f"Missing columns: {', '.join(missing)}")
+    if 'password' not in columns and not default_password:
+        raise ImportFileError('Add a password column or a default password.')
+    if not total:
+        raise ImportFileError('The file has no student rows.')
+    return total
+
+
+def create_import(upload, file_format, admin_id=None, semester=None, default_password=None):
+    """Store an uploaded file and record its import; rows are processed after commit.
+
+    Students without a password of their own all get `default_password`, so
+    it is hashed once here and never stored in plain text.
+    """
+    total = scan_upload(upload, file_format, default_password)
+    job = StudentImport.objects.create(
+        file=upload,
+        file_name=upload.name,
+        file_format=file_format,
+        semester=semester,
+        uploaded_by_id=admin_id,
+        default_password_hash=make_password(default_password) if default_password else '',
+        total_rows=total,
+    )
+    if settings.STUDENT_IMPORT_IN_PROCESS:
+        transaction.on_commit(lambda: start_import_thread(job.pk))
+    return job
+
+
+def start_import_thread(import_id):
+    thread = threading.Thread(target=_process_in_thread, args=(import_id,), name=f'student-import-{import_id}', daemon=True)
+    thread.start()
+    return thread
+
+
+def _process_in_thread(import_id):
+    try:
+        process_student_import(import_id)
+    finally:
+        connection.close()
+
+
+def claim_import(import_id):
+    """Atomically take ownership of an import that is not already running."""
+    now = timezone.now()
+    stale = now - timedelta(seconds=settings.STUDENT_IMPORT_LOCK_TIMEOUT)
+    claimed = StudentImport.objects.filter(pk=import_id).filter(
+        Q(status__in=['PENDING', 'FAILED']) | Q(status='RUNNING', locked_at__lt=stale)
+    ).update(status='RUNNING', locked_at=now, attempts=F('attempts') + 1, updated_at=now)
+    if not claimed:
+        return None
+    return StudentImport.objects.get(pk=import_id)
+
+
+def resume_import(job):
+    """Queue a failed or abandoned import again. Returns False while it is still running."""
+    stale = timezone.now() - timedelta(seconds=settings.STUDENT_IMPORT_LOCK_TIMEOUT)
+    if job.status == 'RUNNING' and job.locked_at and job.locked_at >= stale:
+        return False
+
+    StudentImport.objects.filter(pk=job.pk, status='FAILED').update(status='PENDING', updated_at=timezone.now())
+    if settings.STUDENT_IMPORT_IN_PROCESS:
+        start_import_thread(job.pk)
+    return True
+
+
+def validate_rows(job, rows):
+    """Split a chunk of rows into new students and per-row errors.
+
+    Emails, roll numbers and semesters are each checked with one query for
+    the whole chunk. Earlier chunks are already in the table, so duplicates
+    further up the file are caught the same way. Students come back on the
+    default password hash; those with their own password are also listed in
+    `own_passwords` for hashing.
+    """
+    errors = []
+    valid = []
+    for number, values in rows:
+        serializer = StudentImportRowSerializer(data=values)
+        if serializer.is_valid():
+            valid.append((number, serializer.validated_data))
+        else:
+            errors.append({'row': number, 'errors': _plain_errors(serializer.errors)})
+
+    emails = [data['email'] for _, data in valid]
+    roll_numbers = [data['roll_number'] for _, data in valid]
+    taken_emails = set(Student.objects.filter(email__in=emails).values_list('email', flat=True))
+    taken_roll_numbers = set(Student.objects.filter(roll_number__in=roll_numbers).values_list('roll_number', flat=True))
+    semester_ids = {data.get('semester_id') or job.semester_id for _, data in valid} - {None}
+    known_semesters = set(Semester.objects.filter(id__in=semester_ids).values_list('id', flat=True))
+
+    accepted = []
+    own_passwords = []
+    for number, data in valid:
+        semester_id = data.get('semester_id') or job.semester_id
+        row_errors = {}
+        if data['email'] in taken_emails:
+            row_errors['email'] = ['A student with this email already exists.']
+        if data['roll_number'] in taken_roll_numbers:
+            row_errors['roll_number'] = ['A student with this roll number already exists.']
+        if semester_id is not None and semester_id not in known_semesters:
+            row_errors['semester_id'] = ['Semester not found.']
+        if not data.get('password') and not job.default_password_hash:
+            row_errors['password'] = ['This field is required when no default password is set.']
+        if row_errors:
+            errors.append({'row': number, 'errors': row_errors})
+            continue
+
+        taken_emails.add(data['email'])
+        taken_roll_numbers.add(data['roll_number'])
+        # Students without a password of their own share one hash of the
+        # default password, salt included. It was hashed once at upload, so
+        # the plain text is never stored; every such student should be made
+        # to change it at first login.
+        student = Student(
+            email=data['email'],
+            full_name=data['full_name'],
+            roll_number=data['roll_number'],
+            phone=data.get('phone'),
+            semester_id=semester_id,
+            enrollment_year=data['enrollment_year'],
+            password=job.default_password_hash,
+        )
+        accepted.append(student)
+        if data.get('password'):
+            own_passwords.append((student, data['password']))
+
+    errors.sort(key=lambda error: error['row'])
+    return accepted, own_passwords, errors
+
+
+def _plain_errors(errors):
+    return {field: [str(message) for message in messages] for field, messages in errors.items()}
+
+
+def run_student_import(job, chunk_size=None, progress=None):
+    """Import a claimed file chunk by chunk, resuming after its cursor row.
+
+    Each chunk is validated, has its own passwords hashed on a process pool
+    outside any transaction, and is then inserted with one bulk_create in
+    the same transaction that records its errors and advances the cursor. A row written elsewhere
+    in the meantime fails the chunk; resuming checks it again.
+    """
+    chunk_size = chunk_size or settings.STUDENT_IMPORT_CHUNK_SIZE
+    executor = None
+
+    try:
+        with job.file.open('rb') as handle:
+            rows = data_rows(handle, job.file_format, after=job.cursor_row)
+            while True:
+                chunk = list(islice(rows, chunk_size))
+                if not chunk:
+                    break
+
+                students, own_passwords, errors = validate_rows(job, chunk)
+                if own_passwords:
+                    executor = executor or password_hashing_executor(settings.STUDENT_IMPORT_HASH_WORKERS)
+                    encoded = make_passwords([raw for _, raw in own_passwords], executor)
+                    for (student, _), password in zip(own_passwords, encoded):
+                        student.password = password
+
+                with transaction.atomic():
+                    Student.objects.bulk_create(students)
+                    if errors:
+                        StudentImportErrors.objects.create(student_import=job, first_row=chunk[0][0], errors=errors)
+                    now = timezone.now()
+                    StudentImport.objects.filter(pk=job.pk).update(
+                        cursor_row=chunk[-1][0],
+                        processed_rows=F('processed_rows') + len(chunk),
+                        created_count=F('created_count') + len(students),
+                        error_count=F('error_count') + len(errors),
+                        locked_at=now,
+                        updated_at=now,
+                    )
+                    if students:
+                        invalidate_dashboards(semester_ids={student.semester_id for student in students} - {None})
+
+                job.refresh_from_db()
+                if progress:
+                    progress(job)
+    except Exception as exc:
+        StudentImport.objects.filter(pk=job.pk).update(
+            status='FAILED', last_error=str(exc), locked_at=None, updated_at=timezone.now(),
+        )
+        raise
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    now = timezone.now()
+    StudentImport.objects.filter(pk=job.pk).update(
+        status='DONE', last_error=None, locked_at=None, finished_at=now, updated_at=now,
+    )
+    job.refresh_from_db()
+    return job
+
+
+def process_student_import(import_id, chunk_size=None):
+    """Claim and run one import. Returns False if it is owned elsewhere or fails."""
+    job = claim_import(import_id)
+    if job is None:
+        return False
+
+    try:
+        run_student_import(job, chunk_size)
+    except Exception:
+        logger.exception('Student import %s failed', import_id)
+        return False
+    return True
+
+
+def process_pending_imports(chunk_size=None):
+    """Run every pending or abandoned import, oldest first. Returns imports completed."""
+    stale = timezone.now() - timedelta(seconds=settings.STUDENT_IMPORT_LOCK_TIMEOUT)
+    import_ids = list(
+        StudentImport.objects.filter(Q(status='PENDING') | Q(status='RUNNING', locked_at__lt=stale))
+        .order_by('created_at')
+        .values_list('id', flat=True)
+    )
+    return sum(1 for import_id in import_ids if process_student_import(import_id, chunk_size))
@@ -0,0 +1,37 @@
+import time
+from django.core.management.base import BaseCommand, CommandError
+from admin_management.imports import claim_import, process_pending_imports, run_student_import
+
+
+class Command(BaseCommand):
+    help = 'Run pending student imports, resuming any that were interrupted'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--import', dest='import_id', type=int, default=None,
+                            help='Run this import only, including one that failed')
+        parser.add_argument('--chunk-size', type=int, default=None)
+        parser.add_argument('--loop', action='store_true', help='Keep polling for new imports')
+        parser.add_argument('--interval', type=float, default=5, help='Seconds between polls with --loop')
+
+    def handle(self, *args, **options):
+        if options['import_id']:
+            job = claim_import(options['import_id'])
+            if job is None:
+                raise CommandError(f'Import {options["import_id"]} does not exist, is done or is running elsewhere.')
+            self.stdout.write(f'Importing {job.file_name} from row {job.cursor_row + 1}...')
+            job = run_student_import(job, options['chunk_size'], progress=self.report)
+            self.stdout.write(self.style.SUCCESS(
+                f'Created {job.created_count} students; {job.error_count} rows rejected.'
+            ))
+            return
+
+        while True:
+            completed = process_pending_imports(options['chunk_size'])
+            if completed:
+                self.stdout.write(self.style.SUCCESS(f'Completed {completed} student imports.'))
+            if not options['loop']:
+                break
+            time.sleep(options['interval'])
+
+    def report(self, job):
+        self.stdout.write(f'  {job.processed_rows}/{job.total_rows} rows ({job.progress}%)')
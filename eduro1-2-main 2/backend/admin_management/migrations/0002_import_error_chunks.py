@@ -0,0 +1,45 @@
+# Generated by Django 4.2.7 on 2026-10-18 15:50
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def move_errors(apps, schema_editor):
+    StudentImport = apps.get_model('admin_management', 'StudentImport')
+    StudentImportErrors = apps.get_model('admin_management', 'StudentImportErrors')
+    StudentImportErrors.objects.bulk_create(
+        StudentImportErrors(student_import_id=job_id, first_row=errors[0]['row'], errors=errors)
+        for job_id, errors in StudentImport.objects.exclude(errors=[]).values_list('id', 'errors')
+        if errors
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admin_management', '0001_student_import'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StudentImportErrors',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('first_row', models.IntegerField()),
+                ('errors', models.JSONField(default=list)),
+                ('student_import', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='error_chunks', to='admin_management.studentimport')),
+            ],
+            options={
+                'verbose_name': 'Student Import Errors',
+                'verbose_name_plural': 'Student Import Errors',
+                'db_table': 'student_import_errors',
+                'ordering': ['first_row'],
+                'indexes': [models.Index(fields=['student_import', 'first_row'], name='student_imp_student_a82d3b_idx')],
+            },
+        ),
+        migrations.RunPython(move_errors, migrations.RunPython.noop),
+        migrations.RemoveField(
+            model_name='studentimport',
+            name='errors',
+        ),
+    ]
@@ -1,3 +1,80 @@
 from django.db import models
 
-# Create your models here.
+
+class StudentImport(models.Model):
+    """A CSV or XLSX file of students being imported in chunks.
+
+    `cursor_row` is the last file row handled, so a crashed or restarted
+    import resumes after it instead of starting over.
+    """
+    FORMAT_CHOICES = [
+        ('csv', 'CSV'),
+        ('xlsx', 'Excel'),
+    ]
+
+    STATUS_CHOICES = [
+        ('PENDING', 'Pending'),
+        ('RUNNING', 'Running'),
+        ('DONE', 'Done'),
+        ('FAILED', 'Failed'),
+    ]
+
+    file = models.FileField(upload_to='imports/students/')
+    file_name = models.CharField(max_length=255)
+    file_format = models.CharField(max_length=4, choices=FORMAT_CHOICES)
+    semester = models.ForeignKey('academic.Semester', on_delete=models.SET_NULL, null=True, blank=True, related_name='student_imports')
+    uploaded_by = models.ForeignKey('authentication.AdminUser', on_delete=models.SET_NULL, null=True, blank=True, related_name='student_imports')
+    default_password_hash = models.CharField(max_length=255, blank=True)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='PENDING')
+    total_rows = models.IntegerField(default=0)
+    processed_rows = models.IntegerField(default=0)
+    cursor_row = models.IntegerField(default=0)
+    created_count = models.IntegerField(default=0)
+    error_count = models.IntegerField(default=0)
+    attempts = models.IntegerField(default=0)
+    last_error = models.TextField(blank=True, null=True)
+    locked_at = models.DateTimeField(blank=True, null=True)
+    finished_at = models.DateTimeField(blank=True, null=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'student_imports'
+        verbose_name = 'Student Import'
+        verbose_name_plural = 'Student Imports'
+        indexes = [
+            models.Index(fields=['status', 'created_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.file_name} - {self.status}"
+
+    @property
+    def progress(self):
+        """Percentage of the file's data rows handled so far."""
+        if not self.total_rows:
+            return 100 if self.status == 'DONE' else 0
+        return round(self.processed_rows / self.total_rows * 100, 1)
+
+
+class StudentImportErrors(models.Model):
+    """Per-row validation errors of one chunk of a student import.
+
+    Each chunk writes its own row, so recording errors costs the same on
+    the last chunk as on the first.
+    """
+    student_import = models.ForeignKey(StudentImport, on_delete=models.CASCADE, related_name='error_chunks')
+    first_row = models.IntegerField()
+    errors = models.JSONField(default=list)
+
+    class Meta:
+        db_table = 'student_import_errors'
+        verbose_name = 'Student Import Errors'
+        verbose_name_plural = 'Student Import Errors'
+        ordering = ['first_row']
+        indexes = [
+            models.Index(fields=['student_import', 'first_row']),
+        ]
+
+    def __str__(self):
+        return f"Import {self.student_import_id} from row {self.first_row}"
@@ -0,0 +1,44 @@
+import os
+from rest_framework import serializers
+from .models import StudentImport
+
+
+IMPORT_FORMATS = {'.csv': 'csv', '.xlsx': 'xlsx'}
+
+
+class StudentImportRowSerializer(serializers.Serializer):
+    """One data row of a student import file."""
+    email = serializers.EmailField(max_length=255)
+    full_name = serializers.CharField(max_length=255)
+    roll_number = serializers.CharField(max_length=50)
+    phone = serializers.CharField(max_length=20, required=False, allow_null=True)
+    semester_id = serializers.IntegerField(required=False, allow_null=True)
+    enrollment_year = serializers.RegexField(r'^\d{4}$', error_messages={'invalid': 'Enter a four-digit year.'})
+    password = serializers.CharField(min_length=8, max_length=128, required=False, trim_whitespace=False)
+
+
+class StudentBulkUploadSerializer(serializers.Serializer):
+    file = serializers.FileField()
+    semester_id = serializers.IntegerField(required=False, allow_null=True)
+    default_password = serializers.CharField(min_length=8, max_length=128, required=False, trim_whitespace=False)
+
+    def validate_file(self, value):
+        extension = os.path.splitext(value.name)[1].lower()
+        if extension not in IMPORT_FORMATS:
+            raise serializers.ValidationError('Upload a .csv or .xlsx file.')
+        value.file_format = IMPORT_FORMATS[extension]
+        return value
+
+
+class StudentImportSerializer(serializers.ModelSerializer):
+    errors = serializers.SerializerMethodField()
+
+    class Meta:
+        model = StudentImport
+        fields = [
+            'id', 'file_name', 'file_format', 'semester', 'status', 'total_rows', 'processed_rows',
+            'created_count', 'error_count', 'progress', 'errors', 'last_error', 'created_at', 'finished_at',
+        ]
+
+    def get_errors(self, obj):
+        return [error for chunk in obj.error_chunks.all() for error in chunk.errors]
@@ -1,3 +1,170 @@
-from django.test import TestCase
+import shutil
+import tempfile
+from unittest import mock
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+from academic.hierarchy import get_hierarchy
+from academic.models import Department, Course, Semester
+from authentication.models import AdminUser, Teacher, Student
+from backend.testing import QueryBudgetMixin
+from .imports import ImportFileError, claim_import, create_import, run_student_import
+from .serializers import StudentImportSerializer
 
-# Create your tests here.
+
+def auth_header(user, user_type):
+    refresh = RefreshToken()
+    refresh['user_id'] = user.id
+    refresh['user_type'] = user_type
+    return {'HTTP_AUTHORIZATION': f'Bearer {refresh.access_token}'}
+
+
+class AdminListQueryBudgetTests(QueryBudgetMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = AdminUser.objects.create(email='admin@sims.edu', full_name='Admin')
+        cls.departments = [
+            Department.objects.create(name=f'Department {i}', code=f'D{i}') for i in range(3)
+        ]
+        course = Course.objects.create(department=cls.departments[0], name='B.Tech', duration_years=4)
+        cls.semesters = [
+            Semester.objects.create(course=course, semester_number=i, academic_year='2024-2025') for i in range(1, 4)
+        ]
+
+    def setUp(self):
+        self.headers = auth_header(self.admin, 'ADMIN')
+        # Warm the principal cache and the academic snapshot so only the
+        # list queries are counted.
+        self.client.get('/api/admin/students', **self.headers)
+        get_hierarchy()
+
+    def add_students(self, count):
+        start = Student.objects.count()
+        for i in range(start, start + count):
+            Student.objects.create(
+                email=f'student{i}@sims.edu', full_name=f'Student {i}', roll_number=f'R{i:04d}',
+                semester=self.semesters[i % 3], enrollment_year='2024',
+            )
+
+    def add_teachers(self, count):
+        start = Teacher.objects.count()
+        for i in range(start, start + count):
+            Teacher.objects.create(
+                email=f'teacher{i}@sims.edu', full_name=f'Teacher {i}', employee_id=f'T{i:04d}',
+                department=self.departments[i % 3],
+            )
+
+    def test_student_list_queries_do_not_grow_with_page_size(self):
+        self.add_students(5)
+        self.assertQueryCountStable(
+            lambda: self.client.get('/api/admin/students', **self.headers),
+            lambda: self.add_students(45),
+        )
+
+    def test_student_list_query_budget(self):
+        self.add_students(50)
+        with self.assertMaxQueries(2):
+            response = self.client.get('/api/admin/students', **self.headers)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data['results']), 50)
+        self.assertTrue(response.data['results'][0]['semester_info'].startswith('Semester'))
+
+    def test_teacher_list_queries_do_not_grow_with_page_size(self):
+        self.add_teachers(5)
+        self.assertQueryCountStable(
+            lambda: self.client.get('/api/admin/teachers', **self.headers),
+            lambda: self.add_teachers(45),
+        )
+
+    def test_teacher_list_query_budget(self):
+        self.add_teachers(50)
+        with self.assertMaxQueries(2):
+            response = self.client.get('/api/admin/teachers', **self.headers)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['results'][0]['department_name'], 'Department 0')
+
+    def test_list_requires_admin(self):
+        student = Student.objects.create(
+            email='s@sims.edu', full_name='S', roll_number='RX', semester=self.semesters[0], enrollment_year='2024',
+        )
+        response = self.client.get('/api/admin/students', **auth_header(student, 'STUDENT'))
+        self.assertEqual(response.status_code, 403)
+
+
+@override_settings(STUDENT_IMPORT_IN_PROCESS=False, PASSWORD_HASH_ITERATIONS=1000)
+class StudentImportTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = AdminUser.objects.create(email='admin@sims.edu', full_name='Admin')
+        department = Department.objects.create(name='Computer Science', code='CS')
+        course = Course.objects.create(department=department, name='B.Tech', duration_years=4)
+        cls.semester = Semester.objects.create(course=course, semester_number=1, academic_year='2024-2025')
+        Student.objects.create(email='taken@sims.edu', full_name='Taken', roll_number='R0099', enrollment_year='2023')
+
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        settings = override_settings(MEDIA_ROOT=media_root)
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+    def upload(self, *rows, header='email,full_name,roll_number,enrollment_year,password'):
+        content = '\n'.join((header,) + rows).encode()
+        upload = SimpleUploadedFile('students.csv', content, content_type='text/csv')
+        return create_import(upload, 'csv', self.admin.id, self.semester, default_password='welcome123')
+
+    def run_import(self, job, chunk_size=2):
+        return run_student_import(claim_import(job.pk), chunk_size=chunk_size)
+
+    def valid_rows(self, count):
+        return [f'new{i}@sims.edu,New {i},N{i:04d},2024,' for i in range(count)]
+
+    def test_chunks_collect_per_row_errors(self):
+        job = self.run_import(self.upload(
+            'new0@sims.edu,New 0,N0000,2024,',
+            'not-an-email,Bad,N0001,2024,',
+            'other@sims.edu,Other,R0099,2024,',
+            'new3@sims.edu,New 3,N0003,2024,own-password',
+            'new0@sims.edu,Again,N0004,2024,',
+            'new5@sims.edu,New 5,N0005,24,',
+        ))
+
+        self.assertEqual(
+            (job.status, job.total_rows, job.processed_rows, job.cursor_row, job.created_count, job.error_count),
+            ('DONE', 6, 6, 7, 2, 4),
+        )
+        errors = StudentImportSerializer(job).data['errors']
+        self.assertEqual([error['row'] for error in errors], [3, 4, 6, 7])
+        self.assertEqual(errors[1]['errors'], {'roll_number': ['A student with this roll number already exists.']})
+        self.assertEqual(list(errors[2]['errors']), ['email'])
+        self.assertEqual(list(job.error_chunks.values_list('first_row', flat=True)), [2, 4, 6])
+
+        students = {student.email: student for student in Student.objects.filter(email__startswith='new')}
+        self.assertEqual(sorted(students), ['new0@sims.edu', 'new3@sims.edu'])
+        self.assertEqual(students['new0@sims.edu'].semester, self.semester)
+        self.assertTrue(students['new0@sims.edu'].check_password('welcome123'))
+        self.assertTrue(students['new3@sims.edu'].check_password('own-password'))
+
+    def test_failed_chunk_resumes_after_cursor(self):
+        job = self.upload(*self.valid_rows(5))
+        with mock.patch('admin_management.imports.invalidate_dashboards', side_effect=[None, RuntimeError('boom')]):
+            with self.assertRaises(RuntimeError):
+                self.run_import(job)
+
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.cursor_row, job.created_count, job.last_error), ('FAILED', 3, 2, 'boom'))
+        self.assertEqual(Student.objects.filter(email__startswith='new').count(), 2)
+
+        job = self.run_import(job)
+        self.assertEqual((job.status, job.processed_rows, job.created_count, job.error_count), ('DONE', 5, 5, 0))
+        self.assertEqual(job.attempts, 2)
+        self.assertEqual(Student.objects.filter(email__startswith='new').count(), 5)
+
+    def test_running_import_is_not_claimed_twice(self):
+        job = self.upload(*self.valid_rows(1))
+        self.assertIsNotNone(claim_import(job.pk))
+        self.assertIsNone(claim_import(job.pk))
+
+    def test_missing_columns_are_rejected(self):
+        with self.assertRaisesMessage(ImportFileError, 'Missing columns: roll_number'):
+            self.upload('new0@sims.edu,New 0,2024', header='email,full_name,enrollment_year')
@@ -0,0 +1,12 @@
+from django.urls import path
+from .views import (
+    StudentBulkUploadView, StudentImportResumeView, StudentImportStatusView, StudentListView, TeacherListView,
+)
+
+urlpatterns = [
+    path('admin/students', StudentListView.as_view(), name='admin-student-list'),
+    path('admin/students/bulk-upload', StudentBulkUploadView.as_view(), name='admin-student-bulk-upload'),
+    path('admin/students/bulk-upload/<int:import_id>', StudentImportStatusView.as_view(), name='admin-student-import-status'),
+    path('admin/students/bulk-upload/<int:import_id>/resume', StudentImportResumeView.as_view(), name='admin-student-import-resume'),
+    path('admin/teachers', TeacherListView.as_view(), name='admin-teacher-list'),
+]
@@ -1,3 +1,82 @@
-from django.shortcuts import render
+from rest_framework import generics, status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from academic.models import Semester
+from authentication.models import Teacher, Student
+from authentication.permissions import IsAdmin
+from authentication.serializers import TeacherSerializer, StudentSerializer
+from backend.routers import ReplicaReadMixin
+from backend.serializers import EagerLoadingViewMixin, SerializeTimingViewMixin
+from .imports import ImportFileError, create_import, resume_import
+from .models import StudentImport
+from .serializers import StudentBulkUploadSerializer, StudentImportSerializer
 
-# Create your views here.
+
+class StudentListView(ReplicaReadMixin, EagerLoadingViewMixin, SerializeTimingViewMixin, generics.ListAPIView):
+    permission_classes = [IsAdmin]
+    serializer_class = StudentSerializer
+    queryset = Student.objects.order_by('roll_number')
+
+
+class TeacherListView(ReplicaReadMixin, EagerLoadingViewMixin, SerializeTimingViewMixin, generics.ListAPIView):
+    permission_classes = [IsAdmin]
+    serializer_class = TeacherSerializer
+    queryset = Teacher.objects.order_by('employee_id')
+
+
+class StudentBulkUploadView(APIView):
+    """Accept a CSV or XLSX file of students and import it in the background.
+
+    Columns: email, full_name, roll_number, enrollment_year, and optionally
+    phone, semester_id and password. The response is the import record;
+    poll its status endpoint for progress and the per-row error report.
+    """
+    permission_classes = [IsAdmin]
+
+    def post(self, request):
+        serializer = StudentBulkUploadSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response({'error': 'Invalid data', 'details': serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
+
+        data = serializer.validated_data
+        semester = None
+        if data.get('semester_id'):
+            semester = Semester.objects.filter(id=data['semester_id']).first()
+            if semester is None:
+                return Response({'error': 'Semester not found'}, status=status.HTTP_404_NOT_FOUND)
+
+        upload = data['file']
+        try:
+            job = create_import(upload, upload.file_format, request.user.id, semester, data.get('default_password'))
+        except ImportFileError as exc:
+            return Response({'error': str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(StudentImportSerializer(job).data, status=status.HTTP_202_ACCEPTED)
+
+
+class StudentImportStatusView(APIView):
+    permission_classes = [IsAdmin]
+
+    def get(self, request, import_id):
+        try:
+            job = StudentImport.objects.get(id=import_id)
+        except StudentImport.DoesNotExist:
+            return Response({'error': 'Import not found'}, status=status.HTTP_404_NOT_FOUND)
+        return Response(StudentImportSerializer(job).data)
+
+
+class StudentImportResumeView(APIView):
+    """Restart a failed or abandoned import from the row after its cursor."""
+    permission_classes = [IsAdmin]
+
+    def post(self, request, import_id):
+        try:
+            job = StudentImport.objects.get(id=import_id)
+        except StudentImport.DoesNotExist:
+            return Response({'error': 'Import not found'}, status=status.HTTP_404_NOT_FOUND)
+
+        if job.status == 'DONE':
+            return Response(StudentImportSerializer(job).data)
+        if not resume_import(job):
+            return Response({'error': 'Import is already running'}, status=status.HTTP_409_CONFLICT)
+        job.refresh_from_db()
+        return Response(StudentImportSerializer(job).data, status=status.HTTP_202_ACCEPTED)
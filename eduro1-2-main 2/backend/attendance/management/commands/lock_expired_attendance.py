@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+from attendance.utils import lock_expired_attendance
+
+
+class Command(BaseCommand):
+    help = 'Lock attendance records whose 24-hour edit window has passed (run periodically)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=5000)
+
+    def handle(self, *args, **options):
+        locked = lock_expired_attendance(options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'Locked {locked} attendance records.'))
@@ -0,0 +1,17 @@
+from datetime import date
+from django.core.management.base import BaseCommand
+from attendance.utils import rebuild_attendance_rollup
+
+
+class Command(BaseCommand):
+    help = 'Backfill the daily attendance rollup from the raw attendance records'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--date-from', type=date.fromisoformat, help='First day to rebuild (YYYY-MM-DD)')
+        parser.add_argument('--date-to', type=date.fromisoformat, help='Last day to rebuild (YYYY-MM-DD)')
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        self.stdout.write('Rebuilding daily attendance rollup...')
+        written = rebuild_attendance_rollup(options['date_from'], options['date_to'], options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt {written} daily rollup rows.'))
@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+from attendance.utils import rebuild_attendance_summary
+
+
+class Command(BaseCommand):
+    help = 'Recompute attendance summaries from the raw attendance records'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--subject', type=int, action='append', dest='subjects',
+                            help='Only rebuild this subject id (can be repeated)')
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        self.stdout.write('Rebuilding attendance summaries...')
+        written = rebuild_attendance_summary(options['subjects'], options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt {written} attendance summaries.'))
@@ -3,6 +3,29 @@ from django.utils import timezone
 from datetime import timedelta
 
 
+EDIT_WINDOW = timedelta(hours=24)
+
+
+class AttendanceQuerySet(models.QuerySet):
+    """Editability is derived from marked_at at query time, so reads never write."""
+
+    def editable(self):
+        return self.filter(is_editable=True, marked_at__gte=timezone.now() - EDIT_WINDOW)
+
+    def expired(self):
+        """Rows past the edit window that have not been locked yet."""
+        return self.filter(is_editable=True, marked_at__lt=timezone.now() - EDIT_WINDOW)
+
+    def with_editability(self):
+        return self.annotate(
+            editable=models.Case(
+                models.When(is_editable=True, marked_at__gte=timezone.now() - EDIT_WINDOW, then=models.Value(True)),
+                default=models.Value(False),
+                output_field=models.BooleanField(),
+            )
+        )
+
+
 class Attendance(models.Model):
     """Attendance model for tracking lecture-wise attendance."""
     STATUS_CHOICES = [
@@ -21,6 +44,8 @@ class Attendance(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = AttendanceQuerySet.as_manager()
+
     class Meta:
         db_table = 'attendance'
         verbose_name = 'Attendance'
@@ -36,9 +61,67 @@ class Attendance(models.Model):
         return f"{self.student.roll_number} - {self.subject.code} - {self.date} - {self.status}"
 
     def check_editability(self):
-        """Check if attendance is still editable (within 24 hours)."""
-        time_diff = timezone.now() - self.marked_at
-        if time_diff > timedelta(hours=24):
-            self.is_editable = False
-            self.save()
-        return self.is_editable
+        """Check if attendance is still editable (within 24 hours).
+
+        This never writes; expired rows are locked in bulk by the
+        lock_expired_attendance command.
+        """
+        return self.is_editable and timezone.now() - self.marked_at <= EDIT_WINDOW
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the stored status so edits can adjust AttendanceSummary.
+        instance._loaded_status = instance.__dict__.get('status')
+        return instance
+
+
+class AttendanceSummary(models.Model):
+    """Running attendance totals per student and subject, kept in sync with Attendance."""
+    student = models.ForeignKey('authentication.Student', on_delete=models.CASCADE, related_name='attendance_summaries')
+    subject = models.ForeignKey('academic.Subject', on_delete=models.CASCADE, related_name='attendance_summaries')
+    present_count = models.IntegerField(default=0)
+    total_count = models.IntegerField(default=0)
+    last_date = models.DateField(blank=True, null=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'attendance_summaries'
+        verbose_name = 'Attendance Summary'
+        verbose_name_plural = 'Attendance Summaries'
+        unique_together = [['student', 'subject']]
+
+    def __str__(self):
+        return f"{self.student_id} - {self.subject_id} - {self.present_count}/{self.total_count}"
+
+    @property
+    def percentage(self):
+        """Attendance percentage for this student in this subject."""
+        if not self.total_count:
+            return 0
+        return round(self.present_count / self.total_count * 100, 2)
+
+
+class AttendanceDailyRollup(models.Model):
+    """Present/total counts per day, subject and semester for trend charts."""
+    date = models.DateField()
+    subject = models.ForeignKey('academic.Subject', on_delete=models.CASCADE, related_name='attendance_rollups')
+    semester = models.ForeignKey('academic.Semester', on_delete=models.CASCADE, related_name='attendance_rollups')
+    present_count = models.IntegerField(default=0)
+    total_count = models.IntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'attendance_daily_rollups'
+        verbose_name = 'Attendance Daily Rollup'
+        verbose_name_plural = 'Attendance Daily Rollups'
+        unique_together = [['date', 'subject', 'semester']]
+        indexes = [
+            models.Index(fields=['semester', 'date']),
+            models.Index(fields=['subject', 'date']),
+        ]
+
+    def __str__(self):
+        return f"{self.date} - {self.subject_id} - {self.present_count}/{self.total_count}"
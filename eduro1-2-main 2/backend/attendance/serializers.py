@@ -0,0 +1,51 @@
+from rest_framework import serializers
+from academic.hierarchy import get_hierarchy
+from backend.serializers import EagerLoadingMixin
+from .models import Attendance
+
+
+class AttendanceEntrySerializer(serializers.Serializer):
+    student_id = serializers.IntegerField()
+    status = serializers.ChoiceField(choices=Attendance.STATUS_CHOICES)
+
+
+class AttendanceMarkSerializer(serializers.Serializer):
+    subject_id = serializers.IntegerField()
+    date = serializers.DateField()
+    lecture_time = serializers.TimeField()
+    records = AttendanceEntrySerializer(many=True, allow_empty=False)
+
+    def validate_records(self, value):
+        student_ids = [record['student_id'] for record in value]
+        if len(student_ids) != len(set(student_ids)):
+            raise serializers.ValidationError('Each student can only be marked once per lecture.')
+        return value
+
+
+class AttendanceRecordSerializer(EagerLoadingMixin, serializers.ModelSerializer):
+    roll_number = serializers.CharField(source='student.roll_number', read_only=True)
+    student_name = serializers.CharField(source='student.full_name', read_only=True)
+    subject_code = serializers.SerializerMethodField()
+    subject_name = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Attendance
+        fields = [
+            'id', 'student', 'roll_number', 'student_name', 'subject', 'subject_code', 'subject_name',
+            'date', 'lecture_time', 'status', 'marked_at',
+        ]
+
+    def get_subject_code(self, obj):
+        return self._subject(obj).code
+
+    def get_subject_name(self, obj):
+        return self._subject(obj).name
+
+    def _subject(self, obj):
+        return get_hierarchy().subjects.get(obj.subject_id) or obj.subject
+
+
+class AttendanceListFilterSerializer(serializers.Serializer):
+    subject_id = serializers.IntegerField(required=False)
+    date_from = serializers.DateField(required=False)
+    date_to = serializers.DateField(required=False)
@@ -0,0 +1,26 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from .models import Attendance
+from .utils import apply_summary_changes
+
+
+@receiver(post_save, sender=Attendance)
+def attendance_saved(sender, instance, created, raw=False, **kwargs):
+    """Keep AttendanceSummary in step with single-row saves."""
+    if raw:
+        return
+
+    present = 1 if instance.status == 'PRESENT' else 0
+    previous = getattr(instance, '_loaded_status', None)
+    if created:
+        apply_summary_changes([(instance.student_id, instance.subject_id, instance.date, present, 1)])
+    elif previous is not None and previous != instance.status:
+        was_present = 1 if previous == 'PRESENT' else 0
+        apply_summary_changes([(instance.student_id, instance.subject_id, instance.date, present - was_present, 0)])
+    instance._loaded_status = instance.status
+
+
+@receiver(post_delete, sender=Attendance)
+def attendance_deleted(sender, instance, **kwargs):
+    present = 1 if instance.status == 'PRESENT' else 0
+    apply_summary_changes([(instance.student_id, instance.subject_id, instance.date, -present, -1)])
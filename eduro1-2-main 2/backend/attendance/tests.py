@@ -1,3 +1,184 @@
+from datetime import date, time, timedelta
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from academic.models import Department, Course, Semester, Subject
+from authentication.models import Teacher, Student
+from .models import EDIT_WINDOW, Attendance, AttendanceDailyRollup, AttendanceSummary
+from .utils import lock_expired_attendance, mark_lecture_attendance, rebuild_attendance_summary
 
-# Create your tests here.
+
+LECTURE_DATE = date(2024, 9, 2)
+LECTURE_TIME = time(9, 0)
+
+
+class AttendanceTestData:
+    @classmethod
+    def setUpTestData(cls):
+        department = Department.objects.create(name='Computer Science', code='CS')
+        course = Course.objects.create(department=department, name='B.Tech', duration_years=4)
+        cls.semester = Semester.objects.create(course=course, semester_number=3, academic_year='2024-2025')
+        other_semester = Semester.objects.create(course=course, semester_number=5, academic_year='2024-2025')
+        cls.subject = Subject.objects.create(semester=cls.semester, name='Data Structures', code='CS301')
+        cls.teacher = Teacher.objects.create(
+            email='teacher@sims.edu', full_name='Teacher', employee_id='T0001', department=department,
+        )
+        cls.students = [
+            Student.objects.create(
+                email=f'student{i}@sims.edu', full_name=f'Student {i}', roll_number=f'R{i:04d}',
+                semester=cls.semester, enrollment_year='2024',
+            )
+            for i in range(3)
+        ]
+        cls.outsider = Student.objects.create(
+            email='outsider@sims.edu', full_name='Outsider', roll_number='R9999',
+            semester=other_semester, enrollment_year='2022',
+        )
+
+
+class MarkLectureAttendanceTests(AttendanceTestData, TestCase):
+    def mark(self, statuses):
+        records = [{'student_id': student_id, 'status': status} for student_id, status in statuses.items()]
+        outcomes = mark_lecture_attendance(self.teacher.id, self.subject, LECTURE_DATE, LECTURE_TIME, records)
+        return {outcome['student_id']: outcome['outcome'] for outcome in outcomes}
+
+    def summary(self, student):
+        row = AttendanceSummary.objects.get(student=student, subject=self.subject)
+        return row.present_count, row.total_count
+
+    def rollup(self):
+        row = AttendanceDailyRollup.objects.get(date=LECTURE_DATE, subject=self.subject)
+        return row.present_count, row.total_count
+
+    def test_first_marking_creates_rows_and_counts(self):
+        first, second, third = self.students
+        outcomes = self.mark({first.id: 'PRESENT', second.id: 'ABSENT', third.id: 'PRESENT'})
+
+        self.assertEqual(set(outcomes.values()), {'created'})
+        self.assertEqual(Attendance.objects.filter(subject=self.subject).count(), 3)
+        self.assertEqual(self.summary(first), (1, 1))
+        self.assertEqual(self.summary(second), (0, 1))
+        self.assertEqual(self.rollup(), (2, 3))
+
+    def test_remarking_classifies_and_applies_only_deltas(self):
+        first, second, third = self.students
+        self.mark({first.id: 'PRESENT', second.id: 'ABSENT', third.id: 'PRESENT'})
+        outcomes = self.mark({first.id: 'PRESENT', second.id: 'PRESENT', third.id: 'ABSENT'})
+
+        self.assertEqual(outcomes, {first.id: 'unchanged', second.id: 'updated', third.id: 'updated'})
+        self.assertEqual(self.summary(first), (1, 1))
+        self.assertEqual(self.summary(second), (1, 1))
+        self.assertEqual(self.summary(third), (0, 1))
+        self.assertEqual(self.rollup(), (2, 3))
+
+    def test_rows_past_edit_window_are_locked(self):
+        first = self.students[0]
+        self.mark({first.id: 'ABSENT'})
+        Attendance.objects.filter(student=first).update(marked_at=timezone.now() - EDIT_WINDOW - timedelta(minutes=1))
+
+        self.assertEqual(self.mark({first.id: 'PRESENT'}), {first.id: 'locked'})
+        self.assertEqual(Attendance.objects.get(student=first).status, 'ABSENT')
+        self.assertEqual(self.summary(first), (0, 1))
+
+    def test_students_outside_the_semester_are_rejected(self):
+        first = self.students[0]
+        inactive = self.students[1]
+        Student.objects.filter(pk=inactive.pk).update(is_active=False)
+        outcomes = self.mark({first.id: 'PRESENT', inactive.id: 'PRESENT', self.outsider.id: 'PRESENT'})
+
+        self.assertEqual(outcomes, {first.id: 'created', inactive.id: 'invalid_student', self.outsider.id: 'invalid_student'})
+        self.assertFalse(Attendance.objects.filter(student__in=[inactive, self.outsider]).exists())
+        self.assertFalse(AttendanceSummary.objects.filter(student=self.outsider).exists())
+        self.assertEqual(self.rollup(), (1, 1))
+
+
+class AttendanceSummaryTests(AttendanceTestData, TestCase):
+    def attend(self, student, day, status):
+        return Attendance.objects.create(
+            student=student, subject=self.subject, teacher=self.teacher,
+            date=day, lecture_time=LECTURE_TIME, status=status,
+        )
+
+    def summary(self, student):
+        row = AttendanceSummary.objects.get(student=student, subject=self.subject)
+        return row.present_count, row.total_count, row.last_date
+
+    def test_single_row_writes_keep_summary_in_step(self):
+        student = self.students[0]
+        first = self.attend(student, LECTURE_DATE, 'PRESENT')
+        second = self.attend(student, LECTURE_DATE + timedelta(days=1), 'ABSENT')
+        self.assertEqual(self.summary(student), (1, 2, LECTURE_DATE + timedelta(days=1)))
+
+        second = Attendance.objects.get(pk=second.pk)
+        second.status = 'PRESENT'
+        second.save()
+        self.assertEqual(self.summary(student), (2, 2, LECTURE_DATE + timedelta(days=1)))
+
+        second.delete()
+        self.assertEqual(self.summary(student), (1, 1, LECTURE_DATE))
+        first.delete()
+        self.assertEqual(self.summary(student), (0, 0, None))
+
+    def test_rebuild_matches_incremental_totals(self):
+        for day in range(3):
+            self.attend(self.students[0], LECTURE_DATE + timedelta(days=day), 'PRESENT' if day else 'ABSENT')
+            self.attend(self.students[1], LECTURE_DATE + timedelta(days=day), 'PRESENT')
+        incremental = {student.id: self.summary(student) for student in self.students[:2]}
+
+        self.assertEqual(rebuild_attendance_summary(), 2)
+        self.assertEqual({student.id: self.summary(student) for student in self.students[:2]}, incremental)
+
+
+class EditabilityTests(AttendanceTestData, TestCase):
+    def setUp(self):
+        # Six rows, alternating fresh and expired, so every id window mixes both.
+        self.rows = []
+        for day in range(2):
+            for student in self.students:
+                row = Attendance.objects.create(
+                    student=student, subject=self.subject, teacher=self.teacher,
+                    date=LECTURE_DATE + timedelta(days=day), lecture_time=LECTURE_TIME, status='PRESENT',
+                )
+                self.rows.append(row)
+        self.expired_ids = {row.id for row in self.rows[::2]}
+        Attendance.objects.filter(id__in=self.expired_ids).update(
+            marked_at=timezone.now() - EDIT_WINDOW - timedelta(minutes=1)
+        )
+
+    def test_querysets_split_rows_at_the_edit_window(self):
+        editable = dict(Attendance.objects.with_editability().values_list('id', 'editable'))
+
+        self.assertEqual({row_id for row_id, flag in editable.items() if not flag}, self.expired_ids)
+        self.assertEqual(set(Attendance.objects.expired().values_list('id', flat=True)), self.expired_ids)
+        self.assertEqual(
+            set(Attendance.objects.editable().values_list('id', flat=True)),
+            {row.id for row in self.rows} - self.expired_ids,
+        )
+
+    def test_locked_rows_are_neither_editable_nor_expired(self):
+        row_id = min(self.expired_ids)
+        Attendance.objects.filter(id=row_id).update(is_editable=False)
+
+        self.assertFalse(Attendance.objects.with_editability().get(id=row_id).editable)
+        self.assertNotIn(row_id, Attendance.objects.expired().values_list('id', flat=True))
+
+    def test_lock_walks_id_windows_and_touches_only_expired_rows(self):
+        with CaptureQueriesContext(connection) as queries:
+            locked = lock_expired_attendance(batch_size=2)
+
+        updates = [query for query in queries.captured_queries if query['sql'].startswith('UPDATE')]
+        self.assertGreater(len(updates), 1)
+        self.assertEqual(locked, len(self.expired_ids))
+        self.assertEqual(set(Attendance.objects.filter(is_editable=False).values_list('id', flat=True)), self.expired_ids)
+        self.assertFalse(Attendance.objects.expired().exists())
+        self.assertEqual(lock_expired_attendance(batch_size=2), 0)
+
+    def test_check_editability_does_not_write(self):
+        expired = Attendance.objects.get(id=self.rows[0].id)
+        fresh = Attendance.objects.get(id=self.rows[1].id)
+
+        with self.assertNumQueries(0):
+            self.assertTrue(fresh.check_editability())
+            self.assertFalse(expired.check_editability())
+        self.assertTrue(Attendance.objects.get(id=expired.id).is_editable)
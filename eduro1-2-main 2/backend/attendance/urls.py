@@ -0,0 +1,8 @@
+from django.urls import path
+from .views import MarkAttendanceView, StudentAttendanceView, SubjectAttendanceView
+
+urlpatterns = [
+    path('teacher/attendance/mark', MarkAttendanceView.as_view(), name='mark-attendance'),
+    path('teacher/attendance/subject/<int:subject_id>', SubjectAttendanceView.as_view(), name='subject-attendance'),
+    path('student/attendance/my-attendance', StudentAttendanceView.as_view(), name='student-attendance'),
+]
@@ -0,0 +1,280 @@
+from collections import defaultdict
+from django.db import transaction
+from django.db.models import Count, F, Max, Min, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce, Greatest
+from django.dispatch import Signal
+from django.utils import timezone
+from academic.hierarchy import get_hierarchy
+from academic.models import Subject
+from authentication.models import Student
+from .models import EDIT_WINDOW, Attendance, AttendanceDailyRollup, AttendanceSummary
+
+
+# Sent after a lecture is marked in bulk, since bulk writes skip post_save.
+# Receives subject_id, date and student_ids (those created or updated).
+attendance_marked = Signal()
+
+
+def mark_lecture_attendance(teacher_id, subject, date, lecture_time, records):
+    """Mark attendance for a whole lecture with one batched insert-or-update.
+
+    `records` is a list of {'student_id', 'status'} dicts. Returns one outcome
+    per record: created, updated, unchanged, locked or invalid_student; only
+    active students of the subject's semester are valid.
+    """
+    student_ids = [record['student_id'] for record in records]
+    valid_ids = set(
+        Student.objects.filter(
+            id__in=student_ids, is_active=True, semester_id=subject.semester_id
+        ).values_list('id', flat=True)
+    )
+    cutoff = timezone.now() - EDIT_WINDOW
+
+    outcomes = []
+    to_write = []
+    changes = []
+    with transaction.atomic():
+        # Lock the subject so overlapping submissions for it are classified
+        # one after the other; otherwise both would see a row as created and
+        # count it twice in the summaries.
+        list(Subject.objects.select_for_update().filter(pk=subject.pk).values_list('pk'))
+        existing = {
+            row.student_id: row
+            for row in Attendance.objects.filter(
+                subject=subject, date=date, lecture_time=lecture_time, student_id__in=valid_ids
+            ).only('id', 'student_id', 'status', 'marked_at', 'is_editable')
+        }
+
+        for record in records:
+            student_id = record['student_id']
+            status = record['status']
+            current = existing.get(student_id)
+            if student_id not in valid_ids:
+                outcome = 'invalid_student'
+            elif current is None:
+                outcome = 'created'
+            elif not current.is_editable or current.marked_at < cutoff:
+                outcome = 'locked'
+            elif current.status == status:
+                outcome = 'unchanged'
+            else:
+                outcome = 'updated'
+
+            if outcome in ('created', 'updated'):
+                to_write.append(Attendance(
+                    student_id=student_id,
+                    subject=subject,
+                    teacher_id=teacher_id,
+                    date=date,
+                    lecture_time=lecture_time,
+                    status=status,
+                ))
+            outcomes.append({'student_id': student_id, 'status': status, 'outcome': outcome})
+
+            present = 1 if status == 'PRESENT' else 0
+            if outcome == 'created':
+                changes.append((student_id, subject.id, date, present, 1))
+            elif outcome == 'updated':
+                changes.append((student_id, subject.id, date, 1 if present else -1, 0))
+
+        if to_write:
+            Attendance.objects.bulk_create(
+                to_write,
+                update_conflicts=True,
+                unique_fields=['student', 'subject', 'date', 'lecture_time'],
+                update_fields=['status', 'teacher', 'updated_at'],
+            )
+        apply_summary_changes(changes)
+
+        if changes:
+            attendance_marked.send(
+                sender=Attendance, subject_id=subject.id, date=date,
+                student_ids=[change[0] for change in changes],
+            )
+
+    return outcomes
+
+
+def apply_summary_changes(changes):
+    """Apply attendance deltas to AttendanceSummary and the daily rollup.
+
+    `changes` is a list of (student_id, subject_id, date, present_delta,
+    total_delta) tuples. Rows sharing a subject, date and delta are updated
+    together, so a whole lecture costs one UPDATE per distinct delta.
+    """
+    if not changes:
+        return
+
+    # Only new attendance can need a fresh summary row; edits and deletes
+    # always find one already there.
+    new_keys = {(change[0], change[1]) for change in changes if change[4] > 0}
+    if new_keys:
+        AttendanceSummary.objects.bulk_create(
+            [AttendanceSummary(student_id=student_id, subject_id=subject_id) for student_id, subject_id in new_keys],
+            ignore_conflicts=True,
+        )
+
+    groups = defaultdict(list)
+    for student_id, subject_id, date, present_delta, total_delta in changes:
+        groups[(subject_id, date, present_delta, total_delta)].append(student_id)
+
+    for (subject_id, date, present_delta, total_delta), student_ids in groups.items():
+        updates = {
+            'present_count': F('present_count') + present_delta,
+            'total_count': F('total_count') + total_delta,
+            'updated_at': timezone.now(),
+        }
+        if total_delta > 0:
+            updates['last_date'] = Greatest(Coalesce('last_date', Value(date)), Value(date))
+        elif total_delta < 0:
+            updates['last_date'] = Subquery(
+                Attendance.objects.filter(student=OuterRef('student'), subject=OuterRef('subject'))
+                .values('student')
+                .annotate(latest=Max('date'))
+                .values('latest')[:1]
+            )
+        AttendanceSummary.objects.filter(
+            subject_id=subject_id, student_id__in=student_ids
+        ).update(**updates)
+
+    apply_rollup_changes(changes)
+
+
+def apply_rollup_changes(changes):
+    """Fold attendance deltas into AttendanceDailyRollup, one UPDATE per day and subject."""
+    totals = defaultdict(lambda: [0, 0])
+    for student_id, subject_id, date, present_delta, total_delta in changes:
+        totals[(date, subject_id)][0] += present_delta
+        totals[(date, subject_id)][1] += total_delta
+    totals = {key: deltas for key, deltas in totals.items() if any(deltas)}
+    if not totals:
+        return
+
+    subjects = get_hierarchy().subjects
+    semesters = {subject_id: subjects[subject_id].semester_id for _, subject_id in totals if subject_id in subjects}
+    missing = {subject_id for _, subject_id in totals} - semesters.keys()
+    if missing:
+        semesters.update(Subject.objects.filter(id__in=missing).values_list('id', 'semester_id'))
+    new_rows = [
+        AttendanceDailyRollup(date=date, subject_id=subject_id, semester_id=semesters[subject_id])
+        for (date, subject_id), (_, total_delta) in totals.items()
+        if total_delta > 0 and subject_id in semesters
+    ]
+    if new_rows:
+        AttendanceDailyRollup.objects.bulk_create(new_rows, ignore_conflicts=True)
+
+    for (date, subject_id), (present_delta, total_delta) in totals.items():
+        AttendanceDailyRollup.objects.filter(date=date, subject_id=subject_id).update(
+            present_count=F('present_count') + present_delta,
+            total_count=F('total_count') + total_delta,
+            updated_at=timezone.now(),
+        )
+
+
+def rebuild_attendance_summary(subject_ids=None, batch_size=1000):
+    """Recompute AttendanceSummary from the raw attendance table.
+
+    Returns the number of summary rows written.
+    """
+    records = Attendance.objects.all()
+    summaries = AttendanceSummary.objects.all()
+    if subject_ids:
+        records = records.filter(subject_id__in=subject_ids)
+        summaries = summaries.filter(subject_id__in=subject_ids)
+
+    totals = (
+        records.values('student_id', 'subject_id')
+        .annotate(
+            present=Count('id', filter=Q(status='PRESENT')),
+            total=Count('id'),
+            latest=Max('date'),
+        )
+        .order_by()
+    )
+
+    written = 0
+    batch = []
+    with transaction.atomic():
+        summaries.delete()
+        for row in totals.iterator(chunk_size=batch_size):
+            batch.append(AttendanceSummary(
+                student_id=row['student_id'],
+                subject_id=row['subject_id'],
+                present_count=row['present'],
+                total_count=row['total'],
+                last_date=row['latest'],
+            ))
+            if len(batch) >= batch_size:
+                AttendanceSummary.objects.bulk_create(batch)
+                written += len(batch)
+                batch = []
+        if batch:
+            AttendanceSummary.objects.bulk_create(batch)
+            written += len(batch)
+
+    return written
+
+
+def rebuild_attendance_rollup(date_from=None, date_to=None, batch_size=1000):
+    """Recompute AttendanceDailyRollup from the raw attendance table.
+
+    Only days inside the optional date range are touched. Returns the number
+    of rollup rows written.
+    """
+    records = Attendance.objects.all()
+    rollups = AttendanceDailyRollup.objects.all()
+    if date_from:
+        records = records.filter(date__gte=date_from)
+        rollups = rollups.filter(date__gte=date_from)
+    if date_to:
+        records = records.filter(date__lte=date_to)
+        rollups = rollups.filter(date__lte=date_to)
+
+    totals = (
+        records.values('date', 'subject_id', 'subject__semester_id')
+        .annotate(present=Count('id', filter=Q(status='PRESENT')), total=Count('id'))
+        .order_by()
+    )
+
+    written = 0
+    batch = []
+    with transaction.atomic():
+        rollups.delete()
+        for row in totals.iterator(chunk_size=batch_size):
+            batch.append(AttendanceDailyRollup(
+                date=row['date'],
+                subject_id=row['subject_id'],
+                semester_id=row['subject__semester_id'],
+                present_count=row['present'],
+                total_count=row['total'],
+            ))
+            if len(batch) >= batch_size:
+                AttendanceDailyRollup.objects.bulk_create(batch)
+                written += len(batch)
+                batch = []
+        if batch:
+            AttendanceDailyRollup.objects.bulk_create(batch)
+            written += len(batch)
+
+    return written
+
+
+def lock_expired_attendance(batch_size=5000):
+    """Flip is_editable off for every row past the edit window.
+
+    Walks the primary key range in fixed-size windows so each batch is a
+    single UPDATE statement. Returns the number of rows locked.
+    """
+    expired = Attendance.objects.expired()
+    bounds = expired.aggregate(low=Min('id'), high=Max('id'))
+    if bounds['low'] is None:
+        return 0
+
+    locked = 0
+    start = bounds['low']
+    while start <= bounds['high']:
+        locked += expired.filter(id__gte=start, id__lt=start + batch_size).update(
+            is_editable=False, updated_at=timezone.now()
+        )
+        start += batch_size
+    return locked
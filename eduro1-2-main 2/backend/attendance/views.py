@@ -1,3 +1,90 @@
-from django.shortcuts import render
+from collections import Counter
+from rest_framework import generics
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+from authentication.permissions import IsTeacher, IsStudent
+from academic.models import Subject, TeacherSubjectAssignment
+from backend.pagination import KeysetPagination
+from backend.serializers import SerializeTimingViewMixin
+from .models import Attendance
+from .serializers import AttendanceListFilterSerializer, AttendanceMarkSerializer, AttendanceRecordSerializer
+from .utils import mark_lecture_attendance
 
-# Create your views here.
+
+class MarkAttendanceView(APIView):
+    permission_classes = [IsTeacher]
+
+    def post(self, request):
+        serializer = AttendanceMarkSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response({'error': 'Invalid data', 'details': serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
+
+        data = serializer.validated_data
+
+        try:
+            subject = Subject.objects.get(id=data['subject_id'])
+        except Subject.DoesNotExist:
+            return Response({'error': 'Subject not found'}, status=status.HTTP_404_NOT_FOUND)
+
+        teacher_id = request.user.id
+        if not TeacherSubjectAssignment.objects.filter(teacher_id=teacher_id, subject=subject).exists():
+            return Response({'error': 'Subject is not assigned to this teacher'}, status=status.HTTP_403_FORBIDDEN)
+
+        outcomes = mark_lecture_attendance(
+            teacher_id, subject, data['date'], data['lecture_time'], data['records']
+        )
+
+        return Response({
+            'subject_id': subject.id,
+            'date': data['date'],
+            'lecture_time': data['lecture_time'],
+            'summary': Counter(outcome['outcome'] for outcome in outcomes),
+            'results': outcomes,
+        })
+
+
+class AttendancePagination(KeysetPagination):
+    ordering = ('-date', '-id')
+
+
+class AttendanceListView(SerializeTimingViewMixin, generics.ListAPIView):
+    """Newest-first attendance, optionally filtered by subject_id, date_from and date_to."""
+    serializer_class = AttendanceRecordSerializer
+    pagination_class = AttendancePagination
+
+    def list(self, request, *args, **kwargs):
+        filters = AttendanceListFilterSerializer(data=request.query_params)
+        if not filters.is_valid():
+            return Response({'error': 'Invalid filters', 'details': filters.errors}, status=status.HTTP_400_BAD_REQUEST)
+        self.filters = filters.validated_data
+        return super().list(request, *args, **kwargs)
+
+    def get_queryset(self):
+        queryset = self.get_records()
+        if 'subject_id' in self.filters:
+            queryset = queryset.filter(subject_id=self.filters['subject_id'])
+        if 'date_from' in self.filters:
+            queryset = queryset.filter(date__gte=self.filters['date_from'])
+        if 'date_to' in self.filters:
+            queryset = queryset.filter(date__lte=self.filters['date_to'])
+        return self.get_serializer_class().setup_eager_loading(queryset)
+
+
+class StudentAttendanceView(AttendanceListView):
+    permission_classes = [IsStudent]
+
+    def get_records(self):
+        return Attendance.objects.filter(student_id=self.request.user.id)
+
+
+class SubjectAttendanceView(AttendanceListView):
+    permission_classes = [IsTeacher]
+
+    def list(self, request, subject_id):
+        if not TeacherSubjectAssignment.objects.filter(teacher_id=request.user.id, subject_id=subject_id).exists():
+            return Response({'error': 'Subject is not assigned to this teacher'}, status=status.HTTP_403_FORBIDDEN)
+        return super().list(request, subject_id)
+
+    def get_records(self):
+        return Attendance.objects.filter(subject_id=self.kwargs['subject_id'])
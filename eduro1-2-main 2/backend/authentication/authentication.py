@@ -0,0 +1,144 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from django.conf import settings
+from rest_framework.authentication import BaseAuthentication, get_authorization_header
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.tokens import AccessToken
+from .models import AdminUser, Teacher, Student
+
+
+USER_MODELS = {
+    'ADMIN': AdminUser,
+    'TEACHER': Teacher,
+    'STUDENT': Student,
+}
+
+
+@dataclass(frozen=True)
+class AuthenticatedUser:
+    """Immutable principal attached to request.user for JWT-authenticated calls.
+
+    Carries just enough to authorize a request; call get_user() when the full
+    model instance is actually needed.
+    """
+    id: int
+    user_type: str
+    email: str
+    full_name: str
+
+    is_authenticated = True
+    is_anonymous = False
+
+    @property
+    def pk(self):
+        return self.id
+
+    @property
+    def is_admin(self):
+        return self.user_type == 'ADMIN'
+
+    @property
+    def is_teacher(self):
+        return self.user_type == 'TEACHER'
+
+    @property
+    def is_student(self):
+        return self.user_type == 'STUDENT'
+
+    def get_user(self):
+        return USER_MODELS[self.user_type].objects.get(pk=self.id)
+
+
+class PrincipalCache:
+    """Thread-safe TTL + LRU cache of AuthenticatedUser keyed by (user_type, id)."""
+
+    def __init__(self, maxsize, ttl):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        self.entries = OrderedDict()
+
+    def get(self, user_type, user_id):
+        key = (user_type, user_id)
+        now = time.monotonic()
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                principal, expires_at = entry
+                if expires_at > now:
+                    self.entries.move_to_end(key)
+                    return principal
+                del self.entries[key]
+
+        principal = self.load(user_type, user_id)
+        if principal is not None:
+            with self.lock:
+                self.entries[key] = (principal, now + self.ttl)
+                self.entries.move_to_end(key)
+                while len(self.entries) > self.maxsize:
+                    self.entries.popitem(last=False)
+        return principal
+
+    def load(self, user_type, user_id):
+        model = USER_MODELS.get(user_type)
+        if model is None:
+            return None
+        row = model.objects.filter(pk=user_id, is_active=True).values('id', 'email', 'full_name').first()
+        if row is None:
+            return None
+        return AuthenticatedUser(user_type=user_type, **row)
+
+    def invalidate(self, user_type, user_id):
+        with self.lock:
+            self.entries.pop((user_type, user_id), None)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+
+principal_cache = PrincipalCache(
+    maxsize=getattr(settings, 'JWT_PRINCIPAL_CACHE_SIZE', 10000),
+    ttl=getattr(settings, 'JWT_PRINCIPAL_CACHE_TTL', 60),
+)
+
+
+def authenticate_token(raw_token):
+    """Validate an access token and resolve its principal, or raise AuthenticationFailed."""
+    try:
+        token = AccessToken(raw_token)
+    except TokenError:
+        raise AuthenticationFailed('Invalid or expired token')
+
+    principal = principal_cache.get(token.get('user_type'), token.get('user_id'))
+    if principal is None:
+        raise AuthenticationFailed('User not found or inactive')
+    return principal, token
+
+
+class JWTAuthentication(BaseAuthentication):
+    """Authenticate the Bearer tokens minted by the login views.
+
+    Signature and expiry checks are pure CPU; the user behind the token comes
+    from principal_cache, so a warm request does not touch the database.
+    """
+    keyword = b'bearer'
+
+    def authenticate(self, request):
+        header = get_authorization_header(request).split()
+        if not header or header[0].lower() != self.keyword:
+            return None
+        if len(header) != 2:
+            raise AuthenticationFailed('Invalid authorization header')
+
+        try:
+            raw_token = header[1].decode()
+        except UnicodeError:
+            raise AuthenticationFailed('Invalid authorization header')
+        return authenticate_token(raw_token)
+
+    def authenticate_header(self, request):
+        return 'Bearer realm="api"'
@@ -0,0 +1,151 @@
+import asyncio
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from itertools import repeat
+from django.conf import settings
+from django.contrib.auth.hashers import PBKDF2PasswordHasher, check_password, get_hasher, make_password
+from backend.metrics import registry
+
+
+logger = logging.getLogger(__name__)
+
+
+class ConfiguredPBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    """PBKDF2 hasher whose cost comes from settings.PASSWORD_HASH_ITERATIONS.
+
+    Listed first in PASSWORD_HASHERS, so any stored hash with a different
+    algorithm or iteration count is upgraded on the next successful login.
+    """
+
+    @property
+    def iterations(self):
+        return getattr(settings, 'PASSWORD_HASH_ITERATIONS', PBKDF2PasswordHasher.iterations)
+
+
+class PasswordHashOverloaded(Exception):
+    """Raised when the hashing pool is saturated and the login should be shed."""
+
+
+class PasswordHashPool:
+    """Bounded thread pool for password verification with admission control.
+
+    At most `workers + queue_size` verifications are admitted at once; any
+    more are rejected immediately instead of piling up behind the CPU.
+    hashlib releases the GIL while hashing, so threads run in parallel.
+    """
+
+    def __init__(self, workers, queue_size):
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='password-hash')
+        self.slots = threading.BoundedSemaphore(workers + queue_size)
+
+    def submit(self, raw_password, encoded):
+        """Queue a verification; the future resolves to (is_valid, new_encoded)."""
+        if not self.slots.acquire(blocking=False):
+            registry.inc('password_hash_requests_total', {'outcome': 'rejected'})
+            raise PasswordHashOverloaded()
+
+        registry.inc('password_hash_requests_total', {'outcome': 'queued'})
+        future = self.executor.submit(self._verify, raw_password, encoded, time.perf_counter())
+        future.add_done_callback(lambda future: self.slots.release())
+        return future
+
+    def _verify(self, raw_password, encoded, queued_at):
+        started = time.perf_counter()
+        rehashed = []
+        is_valid = check_password(raw_password, encoded, setter=lambda raw: rehashed.append(make_password(raw)))
+        finished = time.perf_counter()
+
+        # Reported on /metrics, merged across workers like the request timings.
+        registry.observe('password_hash_queue_seconds', {}, started - queued_at)
+        registry.observe('password_hash_duration_seconds', {}, finished - started)
+        logger.debug('Password verified in %.1f ms after %.1f ms queued',
+                     (finished - started) * 1000, (started - queued_at) * 1000)
+        return is_valid, rehashed[0] if rehashed else None
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_hash_pool():
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = PasswordHashPool(settings.PASSWORD_HASH_WORKERS, settings.PASSWORD_HASH_QUEUE_SIZE)
+    return _pool
+
+
+def _store_rehash(user, encoded):
+    user.password = encoded
+    type(user).objects.filter(pk=user.pk).update(password=encoded)
+
+
+def verify_password(user, raw_password):
+    """Check a user's password on the hashing pool, upgrading the hash if needed.
+
+    Raises PasswordHashOverloaded when the pool is full or the check does not
+    finish within settings.PASSWORD_HASH_TIMEOUT seconds.
+    """
+    future = get_hash_pool().submit(raw_password, user.password)
+    try:
+        is_valid, new_encoded = future.result(timeout=settings.PASSWORD_HASH_TIMEOUT)
+    except FutureTimeoutError:
+        registry.inc('password_hash_requests_total', {'outcome': 'timed_out'})
+        raise PasswordHashOverloaded()
+
+    if is_valid and new_encoded:
+        _store_rehash(user, new_encoded)
+    return is_valid
+
+
+async def averify_password(user, raw_password):
+    """Async counterpart of verify_password that never blocks the event loop."""
+    future = get_hash_pool().submit(raw_password, user.password)
+    try:
+        is_valid, new_encoded = await asyncio.wait_for(
+            asyncio.wrap_future(future), timeout=settings.PASSWORD_HASH_TIMEOUT
+        )
+    except asyncio.TimeoutError:
+        registry.inc('password_hash_requests_total', {'outcome': 'timed_out'})
+        raise PasswordHashOverloaded()
+
+    if is_valid and new_encoded:
+        user.password = new_encoded
+        await type(user).objects.filter(pk=user.pk).aupdate(password=new_encoded)
+    return is_valid
+
+
+def password_hashing_executor(workers=None):
+    """Process pool for hashing batches of new passwords with make_passwords()."""
+    # Spawned rather than forked: imports run on background threads, and
+    # forking a process that has other threads running can deadlock.
+    return ProcessPoolExecutor(
+        max_workers=workers or os.cpu_count() or 1,
+        mp_context=multiprocessing.get_context('spawn'),
+    )
+
+
+def _encode_pbkdf2(raw_password, iterations):
+    hasher = PBKDF2PasswordHasher()
+    return hasher.encode(raw_password, hasher.salt(), iterations)
+
+
+def make_passwords(raw_passwords, executor):
+    """Hash new passwords on `executor`, returning encoded values in order.
+
+    Workers only run PBKDF2 with the iteration count read here, so they need
+    neither settings nor a database. Any other default hasher is run in
+    this process instead.
+    """
+    raw_passwords = list(raw_passwords)
+    hasher = get_hasher()
+    if hasher.algorithm != PBKDF2PasswordHasher.algorithm or len(raw_passwords) < 2:
+        return [make_password(raw_password) for raw_password in raw_passwords]
+
+    chunksize = max(1, len(raw_passwords) // ((os.cpu_count() or 1) * 4))
+    return list(executor.map(_encode_pbkdf2, raw_passwords, repeat(hasher.iterations), chunksize=chunksize))
@@ -0,0 +1,65 @@
+import io
+import json
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import setup_test_environment, teardown_test_environment
+from backend.benchmarks import BENCHMARK_PASSWORD, build_scenarios, compare_reports, run_benchmarks
+
+
+class Command(BaseCommand):
+    help = 'Benchmark the hot endpoints against a generated dataset in a throwaway test database'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--students', type=int, default=1000)
+        parser.add_argument('--teachers', type=int, default=20)
+        parser.add_argument('--semesters', type=int, default=8)
+        parser.add_argument('--days', type=int, default=30)
+        parser.add_argument('--seed', type=int, default=42)
+        parser.add_argument('--iterations', type=int, default=10)
+        parser.add_argument('--only', action='append',
+                            help='Only run scenarios whose name starts with this prefix (can be repeated)')
+        parser.add_argument('--output', default='benchmark-report.json', help='Where to write the JSON report')
+        parser.add_argument('--compare', help='Baseline JSON report to check for regressions')
+        parser.add_argument('--threshold', type=float, default=0.2,
+                            help='Allowed relative growth in median time and peak memory (default 0.2)')
+
+    def handle(self, *args, **options):
+        dataset = {key: options[key] for key in ('students', 'teachers', 'semesters', 'days', 'seed')}
+
+        setup_test_environment()
+        old_name = connection.settings_dict['NAME']
+        connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+        try:
+            self.stdout.write('Generating dataset...')
+            call_command('seed_load_data', precomputed_hash=True, password=BENCHMARK_PASSWORD,
+                         stdout=io.StringIO(), **dataset)
+            scenarios = build_scenarios()
+
+            self.stdout.write(f'{"scenario":<32}{"p50 ms":>10}{"p95 ms":>10}{"queries":>9}{"peak KB":>11}')
+            report = run_benchmarks(scenarios, options['iterations'], dataset, options['only'], self.log_result)
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+            teardown_test_environment()
+
+        with open(options['output'], 'w') as handle:
+            json.dump(report, handle, indent=2)
+        self.stdout.write(self.style.SUCCESS(f'Report written to {options["output"]}'))
+
+        if options['compare']:
+            with open(options['compare']) as handle:
+                baseline = json.load(handle)
+            if baseline['meta'].get('dataset') != dataset:
+                self.stdout.write(self.style.WARNING('Baseline was measured on a different dataset; numbers may not compare.'))
+            regressions = compare_reports(baseline, report, options['threshold'])
+            if regressions:
+                for regression in regressions:
+                    self.stdout.write(self.style.ERROR(regression))
+                raise CommandError(f'{len(regressions)} regression(s) against {options["compare"]}')
+            self.stdout.write(self.style.SUCCESS(f'No regressions against {options["compare"]}'))
+
+    def log_result(self, name, result):
+        self.stdout.write(
+            f'{name:<32}{result["wall_ms"]["p50"]:>10.2f}{result["wall_ms"]["p95"]:>10.2f}'
+            f'{result["queries"]:>9}{result["peak_memory_kb"]:>11.1f}'
+        )
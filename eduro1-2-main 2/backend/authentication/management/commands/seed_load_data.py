@@ -0,0 +1,239 @@
+import math
+import random
+import time as clock
+from datetime import date, time, timedelta
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from authentication.models import Teacher, Student
+from academic.hierarchy import bump_hierarchy_version
+from academic.models import Department, Course, Semester, Subject, TeacherSubjectAssignment
+from attendance.models import Attendance, AttendanceDailyRollup, AttendanceSummary
+from attendance.utils import rebuild_attendance_rollup, rebuild_attendance_summary
+from reports.dashboards import invalidate_dashboards
+from results.models import Result
+from results.utils import compute_result_fields
+
+
+DEPARTMENT_CODE = 'LOAD'
+SEMESTERS_PER_COURSE = 8
+
+
+class Command(BaseCommand):
+    help = 'Generate a large, deterministic dataset for load testing'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--students', type=int, default=1000)
+        parser.add_argument('--teachers', type=int, default=50)
+        parser.add_argument('--semesters', type=int, default=8)
+        parser.add_argument('--subjects-per-semester', type=int, default=5)
+        parser.add_argument('--days', type=int, default=90,
+                            help='Days of attendance to generate, ending today (Sundays are skipped)')
+        parser.add_argument('--published-ratio', type=float, default=0.8,
+                            help='Share of subjects whose results are published')
+        parser.add_argument('--seed', type=int, default=42)
+        parser.add_argument('--batch-size', type=int, default=5000)
+        parser.add_argument('--password', default='password123')
+        parser.add_argument('--precomputed-hash', action='store_true',
+                            help='Hash the password once and reuse it for every generated user')
+        parser.add_argument('--flush', action='store_true',
+                            help='Delete a previously generated dataset first')
+
+    def handle(self, *args, **options):
+        self.rng = random.Random(options['seed'])
+        self.batch_size = options['batch_size']
+        started = clock.monotonic()
+
+        if options['flush']:
+            self.flush()
+        elif Department.objects.filter(code=DEPARTMENT_CODE).exists():
+            raise CommandError('Load data already exists; pass --flush to regenerate it.')
+
+        self.stdout.write('Generating load data...')
+        with transaction.atomic():
+            subjects = self.create_academics(options['semesters'], options['subjects_per_semester'])
+            teachers = self.create_teachers(options['teachers'], options['password'], options['precomputed_hash'])
+            assignments = self.assign_subjects(subjects, teachers)
+            # bulk_create skips the signals that would refresh the snapshot.
+            bump_hierarchy_version()
+            students = self.create_students(options['students'], subjects, options['password'], options['precomputed_hash'])
+
+        today = date.today()
+        days = [today - timedelta(days=offset) for offset in range(options['days'])]
+        days = [day for day in reversed(days) if day.weekday() != 6]
+
+        attendance = self.write_batches(Attendance, self.generate_attendance(subjects, assignments, students, days))
+        self.stdout.write(f'  {attendance} attendance records')
+        results = self.write_batches(Result, self.generate_results(subjects, assignments, students, options['published_ratio']))
+        self.stdout.write(f'  {results} results')
+
+        self.stdout.write('Rebuilding attendance summaries...')
+        rebuild_attendance_summary([subject.id for subject in subjects], self.batch_size)
+        if days:
+            rebuild_attendance_rollup(days[0], days[-1], self.batch_size)
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Load data generated in {clock.monotonic() - started:.1f}s '
+            f'(password for every user: {options["password"]}).'
+        ))
+
+    def flush(self):
+        """Remove everything a previous run created.
+
+        Records and students are cleared with plain DELETE statements; a
+        cascading delete would load every row to fire its post_delete signal.
+        Teachers and the academic tree are few and go through the ORM.
+        """
+        self.stdout.write('Flushing previous load data...')
+        subjects = Subject.objects.filter(semester__course__department__code=DEPARTMENT_CODE)
+        students = Student.objects.filter(roll_number__startswith=DEPARTMENT_CODE)
+        with transaction.atomic():
+            for model in (Attendance, AttendanceSummary, AttendanceDailyRollup, Result):
+                self.raw_delete(model.objects.filter(subject__in=subjects))
+            for model in (Attendance, AttendanceSummary, Result):
+                self.raw_delete(model.objects.filter(student__in=students))
+            self.raw_delete(students)
+            # The skipped Student signals would only have dropped dashboards of
+            # users that no longer exist; the admin counts still change.
+            invalidate_dashboards()
+            Teacher.objects.filter(employee_id__startswith=DEPARTMENT_CODE).delete()
+            Department.objects.filter(code=DEPARTMENT_CODE).delete()
+
+    def raw_delete(self, queryset):
+        queryset._raw_delete(queryset.db)
+
+    def hasher(self, password, precomputed):
+        if precomputed:
+            encoded = make_password(password)
+            return lambda: encoded
+        return lambda: make_password(password)
+
+    def create_academics(self, semester_count, subjects_per_semester):
+        department = Department.objects.create(code=DEPARTMENT_CODE, name='Load Testing')
+        courses = Course.objects.bulk_create([
+            Course(department=department, name=f'Load Course {number + 1}', duration_years=4)
+            for number in range(math.ceil(semester_count / SEMESTERS_PER_COURSE))
+        ])
+        Semester.objects.bulk_create([
+            Semester(
+                course=courses[index // SEMESTERS_PER_COURSE],
+                semester_number=index % SEMESTERS_PER_COURSE + 1,
+                academic_year='2024-2025',
+            )
+            for index in range(semester_count)
+        ])
+        semesters = list(Semester.objects.filter(course__department=department).order_by('id'))
+
+        Subject.objects.bulk_create([
+            Subject(
+                semester=semester,
+                code=f'{DEPARTMENT_CODE}{index + 1:03d}{number + 1:02d}',
+                name=f'Load Subject {index + 1}.{number + 1}',
+                credits=self.rng.choice([3, 4]),
+            )
+            for index, semester in enumerate(semesters)
+            for number in range(subjects_per_semester)
+        ])
+        return list(Subject.objects.filter(semester__in=semesters).order_by('id'))
+
+    def create_teachers(self, count, password, precomputed):
+        department = Department.objects.get(code=DEPARTMENT_CODE)
+        encode = self.hasher(password, precomputed)
+        Teacher.objects.bulk_create([
+            Teacher(
+                email=f'{DEPARTMENT_CODE.lower()}.t{number:06d}@sims.edu',
+                full_name=f'Teacher {number}',
+                employee_id=f'{DEPARTMENT_CODE}{number:06d}',
+                department=department,
+                password=encode(),
+            )
+            for number in range(1, max(count, 1) + 1)
+        ], batch_size=self.batch_size)
+        teachers = list(Teacher.objects.filter(employee_id__startswith=DEPARTMENT_CODE).order_by('id').values_list('id', flat=True))
+        self.stdout.write(f'  {len(teachers)} teachers')
+        return teachers
+
+    def assign_subjects(self, subjects, teachers):
+        """Round-robin subjects across teachers; returns {subject_id: teacher_id}."""
+        assignments = {subject.id: teachers[index % len(teachers)] for index, subject in enumerate(subjects)}
+        TeacherSubjectAssignment.objects.bulk_create([
+            TeacherSubjectAssignment(teacher_id=teacher_id, subject_id=subject_id)
+            for subject_id, teacher_id in assignments.items()
+        ], batch_size=self.batch_size)
+        return assignments
+
+    def create_students(self, count, subjects, password, precomputed):
+        """Spread students evenly over the semesters; returns {semester_id: [(id, attendance_rate)]}."""
+        semester_ids = sorted({subject.semester_id for subject in subjects})
+        encode = self.hasher(password, precomputed)
+        batch = []
+        for number in range(1, count + 1):
+            batch.append(Student(
+                email=f'{DEPARTMENT_CODE.lower()}.s{number:07d}@sims.edu',
+                full_name=f'Student {number}',
+                roll_number=f'{DEPARTMENT_CODE}{number:07d}',
+                semester_id=semester_ids[number % len(semester_ids)],
+                enrollment_year='2023',
+                password=encode(),
+            ))
+            if len(batch) >= self.batch_size:
+                Student.objects.bulk_create(batch)
+                batch = []
+        if batch:
+            Student.objects.bulk_create(batch)
+        self.stdout.write(f'  {count} students')
+
+        students = {semester_id: [] for semester_id in semester_ids}
+        for student_id, semester_id in (
+            Student.objects.filter(roll_number__startswith=DEPARTMENT_CODE).order_by('id').values_list('id', 'semester_id')
+        ):
+            students[semester_id].append((student_id, self.rng.uniform(0.55, 0.98)))
+        return students
+
+    def generate_attendance(self, subjects, assignments, students, days):
+        for day in days:
+            for subject in subjects:
+                for student_id, rate in students[subject.semester_id]:
+                    yield Attendance(
+                        student_id=student_id,
+                        subject_id=subject.id,
+                        teacher_id=assignments[subject.id],
+                        date=day,
+                        lecture_time=time(9 + subject.id % 8, 0),
+                        status='PRESENT' if self.rng.random() < rate else 'ABSENT',
+                        is_editable=False,
+                    )
+
+    def generate_results(self, subjects, assignments, students, published_ratio):
+        for subject in subjects:
+            published = self.rng.random() < published_ratio
+            entries = [
+                {
+                    'student_id': student_id,
+                    'internal_marks': round(min(30, max(0, self.rng.gauss(21, 4) * rate / 0.8))),
+                    'external_marks': round(min(70, max(0, self.rng.gauss(48, 12)))),
+                }
+                for student_id, rate in students[subject.semester_id]
+            ]
+            for entry in compute_result_fields(entries):
+                yield Result(
+                    subject_id=subject.id,
+                    entered_by_teacher_id=assignments[subject.id],
+                    is_published=published,
+                    **entry,
+                )
+
+    def write_batches(self, model, objects):
+        """Insert a generator of unsaved rows in fixed-size bulk_create batches."""
+        written = 0
+        batch = []
+        for obj in objects:
+            batch.append(obj)
+            if len(batch) >= self.batch_size:
+                model.objects.bulk_create(batch)
+                written += len(batch)
+                batch = []
+        if batch:
+            model.objects.bulk_create(batch)
+            written += len(batch)
+        return written
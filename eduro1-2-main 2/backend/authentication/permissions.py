@@ -0,0 +1,17 @@
+from rest_framework.permissions import BasePermission
+
+
+class IsAdmin(BasePermission):
+    def has_permission(self, request, view):
+        return getattr(request.user, 'user_type', None) == 'ADMIN'
+
+
+class IsTeacher(BasePermission):
+    def has_permission(self, request, view):
+        return getattr(request.user, 'user_type', None) == 'TEACHER'
+
+
+class IsStudent(BasePermission):
+    def has_permission(self, request, view):
+        return getattr(request.user, 'user_type', None) == 'STUDENT'
+
@@ -1,4 +1,6 @@
 from rest_framework import serializers
+from academic.hierarchy import get_hierarchy
+from backend.serializers import EagerLoadingMixin
 from .models import AdminUser, Teacher, Student
 
 
@@ -13,15 +15,21 @@ class AdminUserSerializer(serializers.ModelSerializer):
         fields = ['id', 'email', 'full_name', 'phone', 'is_active']
 
 
-class TeacherSerializer(serializers.ModelSerializer):
-    department_name = serializers.CharField(source='department.name', read_only=True)
+class TeacherSerializer(EagerLoadingMixin, serializers.ModelSerializer):
+    department_name = serializers.SerializerMethodField()
 
     class Meta:
         model = Teacher
         fields = ['id', 'email', 'full_name', 'phone', 'employee_id', 'department', 'department_name', 'is_active']
 
+    def get_department_name(self, obj):
+        if obj.department_id is None:
+            return None
+        department = get_hierarchy().departments.get(obj.department_id) or obj.department
+        return department.name
 
-class StudentSerializer(serializers.ModelSerializer):
+
+class StudentSerializer(EagerLoadingMixin, serializers.ModelSerializer):
     semester_info = serializers.SerializerMethodField()
 
     class Meta:
@@ -29,6 +37,12 @@ class StudentSerializer(serializers.ModelSerializer):
         fields = ['id', 'email', 'full_name', 'phone', 'roll_number', 'semester', 'semester_info', 'enrollment_year', 'is_active']
 
     def get_semester_info(self, obj):
-        if obj.semester:
-            return f"Semester {obj.semester.semester_number} - {obj.semester.course.name}"
-        return None
+        if obj.semester_id is None:
+            return None
+        hierarchy = get_hierarchy()
+        semester = hierarchy.semesters.get(obj.semester_id)
+        course = semester and hierarchy.courses.get(semester.course_id)
+        if course is None:
+            semester = obj.semester
+            course = semester.course
+        return f"Semester {semester.semester_number} - {course.name}"
@@ -0,0 +1,22 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from .authentication import principal_cache
+from .models import AdminUser, Teacher, Student
+
+
+USER_TYPES = {
+    AdminUser: 'ADMIN',
+    Teacher: 'TEACHER',
+    Student: 'STUDENT',
+}
+
+
+@receiver(post_save, sender=AdminUser)
+@receiver(post_save, sender=Teacher)
+@receiver(post_save, sender=Student)
+@receiver(post_delete, sender=AdminUser)
+@receiver(post_delete, sender=Teacher)
+@receiver(post_delete, sender=Student)
+def invalidate_principal(sender, instance, **kwargs):
+    """Drop the cached principal so is_active and password changes apply immediately."""
+    principal_cache.invalidate(USER_TYPES[sender], instance.pk)
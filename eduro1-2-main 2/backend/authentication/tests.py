@@ -1,3 +1,137 @@
-from django.test import TestCase
+import threading
+from io import StringIO
+from unittest import mock
+from django.contrib.auth.hashers import make_password
+from django.core.management import call_command
+from django.db.models.signals import post_delete
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.tokens import RefreshToken
+from backend.metrics import registry, render_prometheus
+from .authentication import AuthenticatedUser, JWTAuthentication, principal_cache
+from .hashers import PasswordHashOverloaded, PasswordHashPool
+from .models import Student, Teacher
 
-# Create your tests here.
+
+@override_settings(PASSWORD_HASH_ITERATIONS=1000)
+class PasswordHashPoolTests(SimpleTestCase):
+    def samples(self, name):
+        return registry.snapshot()[name]['samples']
+
+    def count(self, outcome):
+        return self.samples('password_hash_requests_total').get(f'[["outcome", "{outcome}"]]', 0)
+
+    def test_verification_latency_is_reported(self):
+        pool = PasswordHashPool(workers=1, queue_size=0)
+        queued = self.count('queued')
+        before = self.samples('password_hash_duration_seconds').get('[]', {'count': 0})['count']
+
+        self.assertEqual(pool.submit('secret', make_password('secret')).result(), (True, None))
+        self.assertEqual(self.count('queued'), queued + 1)
+        self.assertEqual(self.samples('password_hash_duration_seconds')['[]']['count'], before + 1)
+        self.assertIn('password_hash_duration_seconds_count', render_prometheus(registry.snapshot()))
+
+    def test_full_pool_rejects_and_counts(self):
+        pool = PasswordHashPool(workers=1, queue_size=0)
+        release = threading.Event()
+        pool.executor.submit(release.wait)
+        pool.slots.acquire()
+        rejected = self.count('rejected')
+        try:
+            with self.assertRaises(PasswordHashOverloaded):
+                pool.submit('secret', make_password('secret'))
+        finally:
+            release.set()
+            pool.slots.release()
+        self.assertEqual(self.count('rejected'), rejected + 1)
+
+
+def access_token(user_id, user_type):
+    refresh = RefreshToken()
+    refresh['user_id'] = user_id
+    refresh['user_type'] = user_type
+    return str(refresh.access_token)
+
+
+class JWTAuthenticationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.student = Student.objects.create(
+            email='student@sims.edu', full_name='Student', roll_number='R0001', enrollment_year='2024',
+        )
+
+    def setUp(self):
+        principal_cache.clear()
+        self.addCleanup(principal_cache.clear)
+
+    def authenticate(self, user_id=None, user_type='STUDENT', header=None):
+        if header is None:
+            header = f'Bearer {access_token(user_id or self.student.id, user_type)}'
+        request = RequestFactory().get('/api/notifications', HTTP_AUTHORIZATION=header)
+        return JWTAuthentication().authenticate(request)
+
+    def test_valid_token_resolves_to_the_principal(self):
+        user, token = self.authenticate()
+        self.assertEqual(user, AuthenticatedUser(
+            id=self.student.id, user_type='STUDENT', email='student@sims.edu', full_name='Student',
+        ))
+        self.assertEqual(token['user_id'], self.student.id)
+
+    def test_unknown_inactive_and_malformed_are_rejected(self):
+        with self.assertRaisesMessage(AuthenticationFailed, 'User not found or inactive'):
+            self.authenticate(user_id=self.student.id + 100)
+        with self.assertRaisesMessage(AuthenticationFailed, 'User not found or inactive'):
+            self.authenticate(user_type='TEACHER')
+
+        Student.objects.filter(pk=self.student.pk).update(is_active=False)
+        with self.assertRaisesMessage(AuthenticationFailed, 'User not found or inactive'):
+            self.authenticate()
+        with self.assertRaisesMessage(AuthenticationFailed, 'Invalid or expired token'):
+            self.authenticate(header='Bearer not-a-token')
+        self.assertIsNone(self.authenticate(header='Basic abc'))
+
+    def test_warm_cache_needs_no_queries(self):
+        self.authenticate()
+        with self.assertNumQueries(0):
+            user, _ = self.authenticate()
+        self.assertEqual(user.id, self.student.id)
+
+    def test_deactivation_applies_immediately(self):
+        self.authenticate()
+        student = Student.objects.get(pk=self.student.pk)
+        student.is_active = False
+        student.save()
+        with self.assertRaisesMessage(AuthenticationFailed, 'User not found or inactive'):
+            self.authenticate()
+
+    def test_password_change_drops_the_cached_principal(self):
+        self.authenticate()
+        self.assertIn(('STUDENT', self.student.id), principal_cache.entries)
+        student = Student.objects.get(pk=self.student.pk)
+        student.set_password('a-new-password')
+        student.save()
+        self.assertNotIn(('STUDENT', self.student.id), principal_cache.entries)
+        with self.assertNumQueries(1):
+            self.authenticate()
+
+
+class SeedLoadDataTests(TestCase):
+    def seed(self, **options):
+        out = StringIO()
+        call_command('seed_load_data', students=6, teachers=0, semesters=2, subjects_per_semester=2, days=3,
+                     precomputed_hash=True, stdout=out, **options)
+        return out.getvalue()
+
+    def test_reports_the_teachers_actually_created(self):
+        self.assertIn('  1 teachers', self.seed())
+        self.assertEqual(Teacher.objects.count(), 1)
+
+    def test_flush_deletes_students_without_per_row_signals(self):
+        self.seed()
+        receiver = mock.Mock()
+        post_delete.connect(receiver, sender=Student)
+        self.addCleanup(post_delete.disconnect, receiver, sender=Student)
+
+        self.seed(flush=True)
+        receiver.assert_not_called()
+        self.assertEqual(Student.objects.count(), 6)
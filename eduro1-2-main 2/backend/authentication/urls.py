@@ -1,8 +1,14 @@
 from django.urls import path
-from .views import AdminLoginView, TeacherLoginView, StudentLoginView
+from .views import (
+    AdminLoginView, TeacherLoginView, StudentLoginView,
+    AsyncAdminLoginView, AsyncTeacherLoginView, AsyncStudentLoginView,
+)
 
 urlpatterns = [
     path('admin/login', AdminLoginView.as_view(), name='admin-login'),
     path('teacher/login', TeacherLoginView.as_view(), name='teacher-login'),
     path('student/login', StudentLoginView.as_view(), name='student-login'),
+    path('admin/login/async', AsyncAdminLoginView.as_view(), name='admin-login-async'),
+    path('teacher/login/async', AsyncTeacherLoginView.as_view(), name='teacher-login-async'),
+    path('student/login/async', AsyncStudentLoginView.as_view(), name='student-login-async'),
 ]
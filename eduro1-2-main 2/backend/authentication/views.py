@@ -1,12 +1,25 @@
+import json
+from asgiref.sync import sync_to_async
+from django.http import JsonResponse
+from django.utils.decorators import method_decorator
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework_simplejwt.tokens import RefreshToken
+from .hashers import PasswordHashOverloaded, averify_password, verify_password
 from .models import AdminUser, Teacher, Student
 from .serializers import LoginSerializer, AdminUserSerializer, TeacherSerializer, StudentSerializer
 
 
+OVERLOADED_RESPONSE = {'error': 'Too many login attempts right now, please retry shortly'}
+RETRY_AFTER_SECONDS = '2'
+
+
 class AdminLoginView(APIView):
+    authentication_classes = []
+
     def post(self, request):
         serializer = LoginSerializer(data=request.data)
         if not serializer.is_valid():
@@ -17,7 +30,7 @@ class AdminLoginView(APIView):
 
         try:
             user = AdminUser.objects.get(email=email, is_active=True)
-            if user.check_password(password):
+            if verify_password(user, password):
                 refresh = RefreshToken()
                 refresh['user_id'] = user.id
                 refresh['user_type'] = 'ADMIN'
@@ -33,9 +46,14 @@ class AdminLoginView(APIView):
                 return Response({'error': 'Invalid credentials'}, status=status.HTTP_401_UNAUTHORIZED)
         except AdminUser.DoesNotExist:
             return Response({'error': 'Invalid credentials'}, status=status.HTTP_401_UNAUTHORIZED)
+        except PasswordHashOverloaded:
+            return Response(OVERLOADED_RESPONSE, status=status.HTTP_503_SERVICE_UNAVAILABLE,
+                            headers={'Retry-After': RETRY_AFTER_SECONDS})
 
 
 class TeacherLoginView(APIView):
+    authentication_classes = []
+
     def post(self, request):
         serializer = LoginSerializer(data=request.data)
         if not serializer.is_valid():
@@ -46,7 +64,7 @@ class TeacherLoginView(APIView):
 
         try:
             user = Teacher.objects.get(email=email, is_active=True)
-            if user.check_password(password):
+            if verify_password(user, password):
                 refresh = RefreshToken()
                 refresh['user_id'] = user.id
                 refresh['user_type'] = 'TEACHER'
@@ -62,9 +80,14 @@ class TeacherLoginView(APIView):
                 return Response({'error': 'Invalid credentials'}, status=status.HTTP_401_UNAUTHORIZED)
         except Teacher.DoesNotExist:
             return Response({'error': 'Invalid credentials'}, status=status.HTTP_401_UNAUTHORIZED)
+        except PasswordHashOverloaded:
+            return Response(OVERLOADED_RESPONSE, status=status.HTTP_503_SERVICE_UNAVAILABLE,
+                            headers={'Retry-After': RETRY_AFTER_SECONDS})
 
 
 class StudentLoginView(APIView):
+    authentication_classes = []
+
     def post(self, request):
         serializer = LoginSerializer(data=request.data)
         if not serializer.is_valid():
@@ -75,7 +98,7 @@ class StudentLoginView(APIView):
 
         try:
             user = Student.objects.get(email=email, is_active=True)
-            if user.check_password(password):
+            if verify_password(user, password):
                 refresh = RefreshToken()
                 refresh['user_id'] = user.id
                 refresh['user_type'] = 'STUDENT'
@@ -91,3 +114,76 @@ class StudentLoginView(APIView):
                 return Response({'error': 'Invalid credentials'}, status=status.HTTP_401_UNAUTHORIZED)
         except Student.DoesNotExist:
             return Response({'error': 'Invalid credentials'}, status=status.HTTP_401_UNAUTHORIZED)
+        except PasswordHashOverloaded:
+            return Response(OVERLOADED_RESPONSE, status=status.HTTP_503_SERVICE_UNAVAILABLE,
+                            headers={'Retry-After': RETRY_AFTER_SECONDS})
+
+
+@method_decorator(csrf_exempt, name='dispatch')
+class AsyncLoginView(View):
+    """Async login for ASGI deployments.
+
+    The user lookup uses the async ORM and password hashing runs on the
+    bounded hashing pool, so the event loop keeps serving other requests
+    while PBKDF2 runs.
+    """
+    user_model = None
+    user_type = None
+    user_serializer_class = None
+
+    async def post(self, request):
+        try:
+            data = json.loads(request.body or b'{}')
+        except ValueError:
+            return JsonResponse({'error': 'Invalid data'}, status=status.HTTP_400_BAD_REQUEST)
+
+        serializer = LoginSerializer(data=data)
+        if not serializer.is_valid():
+            return JsonResponse({'error': 'Invalid data'}, status=status.HTTP_400_BAD_REQUEST)
+
+        email = serializer.validated_data['email']
+        password = serializer.validated_data['password']
+
+        try:
+            user = await self.user_model.objects.aget(email=email, is_active=True)
+            if not await averify_password(user, password):
+                return JsonResponse({'error': 'Invalid credentials'}, status=status.HTTP_401_UNAUTHORIZED)
+        except self.user_model.DoesNotExist:
+            return JsonResponse({'error': 'Invalid credentials'}, status=status.HTTP_401_UNAUTHORIZED)
+        except PasswordHashOverloaded:
+            response = JsonResponse(OVERLOADED_RESPONSE, status=status.HTTP_503_SERVICE_UNAVAILABLE)
+            response['Retry-After'] = RETRY_AFTER_SECONDS
+            return response
+
+        return JsonResponse(await sync_to_async(self.login_payload)(user))
+
+    def login_payload(self, user):
+        refresh = RefreshToken()
+        refresh['user_id'] = user.id
+        refresh['user_type'] = self.user_type
+        refresh['email'] = user.email
+
+        return {
+            'access_token': str(refresh.access_token),
+            'refresh_token': str(refresh),
+            'user_type': self.user_type,
+            'user': self.user_serializer_class(user).data,
+        }
+
+
+class AsyncAdminLoginView(AsyncLoginView):
+    user_model = AdminUser
+    user_type = 'ADMIN'
+    user_serializer_class = AdminUserSerializer
+
+
+class AsyncTeacherLoginView(AsyncLoginView):
+    user_model = Teacher
+    user_type = 'TEACHER'
+    user_serializer_class = TeacherSerializer
+
+
+class AsyncStudentLoginView(AsyncLoginView):
+    user_model = Student
+    user_type = 'STUDENT'
+    user_serializer_class = StudentSerializer
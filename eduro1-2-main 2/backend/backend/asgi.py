@@ -14,7 +14,7 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend.settings')
 # is populated before importing code that may import ORM models.
 django_asgi_app = get_asgi_application()
 
-# Import notifications routing (will be created later)
+# Import notifications routing
 try:
     from notifications.routing import websocket_urlpatterns
 except ImportError:
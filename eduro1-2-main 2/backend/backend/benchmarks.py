@@ -0,0 +1,225 @@
+import platform
+import statistics
+import time
+import tracemalloc
+from datetime import datetime, time as clock_time
+import django
+from django.contrib.auth.hashers import make_password
+from django.core.cache import cache
+from django.db import connections
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from academic.models import Subject
+from authentication.models import AdminUser, Teacher, Student
+from notifications.counters import reconcile_unread_counters
+from notifications.models import Notification
+from results.models import Result
+
+
+BENCHMARK_PASSWORD = 'password123'
+
+
+class Scenario:
+    """One measured operation. `setup` runs before every iteration, untimed."""
+
+    def __init__(self, name, run, setup=None):
+        self.name = name
+        self.run = run
+        self.setup = setup
+
+
+def _expect(response, status_code=200):
+    if response.status_code != status_code:
+        raise AssertionError(f'{response.request["PATH_INFO"]} returned {response.status_code}: {response.content[:500]!r}')
+    return response
+
+
+def build_scenarios(notifications_per_user=500):
+    """Create the benchmark users on top of a seeded dataset and return the scenarios.
+
+    Expects the dataset from seed_load_data: its first teacher and the first
+    student of that teacher's semester are the actors.
+    """
+    password = make_password(BENCHMARK_PASSWORD)
+    admin = AdminUser.objects.create(email='benchmark.admin@sims.edu', full_name='Benchmark Admin', password=password)
+    teacher = Teacher.objects.order_by('id').first()
+    subject = (
+        Subject.objects.filter(teacher_assignments__teacher=teacher, results__is_published=False)
+        .distinct().order_by('id').first()
+        or Subject.objects.filter(teacher_assignments__teacher=teacher).order_by('id').first()
+    )
+    students = list(
+        Student.objects.filter(semester_id=subject.semester_id, is_active=True).order_by('id').values_list('id', flat=True)
+    )
+    student = Student.objects.get(id=students[0])
+
+    Notification.objects.bulk_create([
+        Notification(
+            recipient_type='STUDENT',
+            recipient_id=student.id,
+            notification_type='SYSTEM',
+            title=f'Benchmark notification {number}',
+            message='Generated for the benchmark suite.',
+            is_read=number % 3 == 0,
+        )
+        for number in range(notifications_per_user)
+    ])
+    reconcile_unread_counters()
+
+    client = Client()
+    tokens = {}
+    for user_type, user in (('admin', admin), ('teacher', teacher), ('student', student)):
+        response = _expect(client.post(
+            f'/api/auth/{user_type}/login', {'email': user.email, 'password': BENCHMARK_PASSWORD},
+            content_type='application/json',
+        ))
+        tokens[user_type] = {'HTTP_AUTHORIZATION': f'Bearer {response.json()["access_token"]}'}
+
+    def login(user_type, user):
+        return lambda: _expect(client.post(
+            f'/api/auth/{user_type}/login', {'email': user.email, 'password': BENCHMARK_PASSWORD},
+            content_type='application/json',
+        ))
+
+    lectures = iter(range(24 * 60))
+
+    def mark_attendance():
+        # Seeded lectures start on the hour, so half-minute slots never collide.
+        minute = next(lectures)
+        _expect(client.post('/api/teacher/attendance/mark', {
+            'subject_id': subject.id,
+            'date': timezone.localdate().isoformat(),
+            'lecture_time': clock_time(minute // 60, minute % 60, 30).isoformat(),
+            'records': [
+                {'student_id': student_id, 'status': 'PRESENT' if index % 4 else 'ABSENT'}
+                for index, student_id in enumerate(students)
+            ],
+        }, content_type='application/json', **tokens['teacher']))
+
+    rounds = iter(range(10 ** 6))
+
+    def enter_results():
+        shift = next(rounds) % 2
+        _expect(client.post('/api/teacher/results/bulk-enter', {
+            'subject_id': subject.id,
+            'results': [
+                {'student_id': student_id, 'internal_marks': 20 + shift, 'external_marks': 50 + index % 20}
+                for index, student_id in enumerate(students)
+            ],
+        }, content_type='application/json', **tokens['teacher']))
+
+    def unpublish():
+        Result.objects.filter(subject=subject).update(is_published=False)
+
+    def publish_results():
+        _expect(client.post('/api/admin/results/publish', {'subject_id': subject.id},
+                            content_type='application/json', **tokens['admin']))
+
+    def get(path, user_type):
+        return lambda: _expect(client.get(path, **tokens[user_type]))
+
+    return [
+        Scenario('login.admin', login('admin', admin)),
+        Scenario('login.teacher', login('teacher', teacher)),
+        Scenario('login.student', login('student', student)),
+        Scenario('attendance.mark_lecture', mark_attendance),
+        Scenario('results.bulk_enter', enter_results),
+        Scenario('results.publish', publish_results, setup=unpublish),
+        Scenario('notifications.list', get('/api/notifications', 'student')),
+        Scenario('notifications.unread_count', get('/api/notifications/unread-count', 'student')),
+        Scenario('dashboard.admin', get('/api/admin/dashboard/stats', 'admin'), setup=cache.clear),
+        Scenario('dashboard.teacher', get('/api/teacher/dashboard/stats', 'teacher'), setup=cache.clear),
+        Scenario('dashboard.student', get('/api/student/dashboard/stats', 'student'), setup=cache.clear),
+        Scenario('dashboard.admin.cached', get('/api/admin/dashboard/stats', 'admin')),
+        Scenario('dashboard.attendance_trends', get('/api/admin/dashboard/attendance-trends?granularity=week', 'admin')),
+    ]
+
+
+def measure(scenario, iterations, using='default'):
+    """Time `iterations` runs, then one more under tracemalloc for peak memory.
+
+    One untimed warm-up run comes first so caches and lazy imports do not
+    skew the numbers. Memory is traced separately because tracemalloc slows
+    every allocation and would distort the wall times.
+    """
+    if scenario.setup:
+        scenario.setup()
+    scenario.run()
+
+    timings = []
+    queries = []
+    for _ in range(iterations):
+        if scenario.setup:
+            scenario.setup()
+        with CaptureQueriesContext(connections[using]) as context:
+            started = time.perf_counter()
+            scenario.run()
+            timings.append(time.perf_counter() - started)
+        queries.append(len(context.captured_queries))
+
+    if scenario.setup:
+        scenario.setup()
+    tracemalloc.start()
+    try:
+        scenario.run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    timings.sort()
+    return {
+        'iterations': iterations,
+        'wall_ms': {
+            'min': round(timings[0] * 1000, 3),
+            'p50': round(statistics.median(timings) * 1000, 3),
+            'p95': round(timings[min(len(timings) - 1, int(len(timings) * 0.95))] * 1000, 3),
+            'max': round(timings[-1] * 1000, 3),
+            'mean': round(statistics.fmean(timings) * 1000, 3),
+        },
+        'queries': max(queries),
+        'peak_memory_kb': round(peak / 1024, 1),
+    }
+
+
+def run_benchmarks(scenarios, iterations, dataset, only=None, log=None):
+    report = {
+        'meta': {
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'django': django.get_version(),
+            'database': connections['default'].vendor,
+            'dataset': dataset,
+        },
+        'scenarios': {},
+    }
+    for scenario in scenarios:
+        if only and not any(scenario.name.startswith(prefix) for prefix in only):
+            continue
+        result = measure(scenario, iterations)
+        report['scenarios'][scenario.name] = result
+        if log:
+            log(scenario.name, result)
+    return report
+
+
+def compare_reports(baseline, current, threshold=0.2):
+    """List the regressions of `current` against `baseline`.
+
+    Median wall time and peak memory regress when they grow by more than
+    `threshold` (a fraction); any extra query is a regression.
+    """
+    regressions = []
+    for name, result in current['scenarios'].items():
+        before = baseline['scenarios'].get(name)
+        if before is None:
+            continue
+        if result['queries'] > before['queries']:
+            regressions.append(f'{name}: queries {before["queries"]} -> {result["queries"]}')
+        for label, old, new in (
+            ('p50 wall ms', before['wall_ms']['p50'], result['wall_ms']['p50']),
+            ('peak memory kb', before['peak_memory_kb'], result['peak_memory_kb']),
+        ):
+            if old and new > old * (1 + threshold):
+                regressions.append(f'{name}: {label} {old} -> {new} (+{(new / old - 1) * 100:.0f}%)')
+    return regressions
@@ -0,0 +1,61 @@
+import hashlib
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import http_date
+
+
+class ConditionalGetMixin:
+    """Generic view mixin that answers unchanged lists and objects with 304 Not Modified.
+
+    The validator is MAX(updated_at) and COUNT(*) over the filtered
+    queryset, taken with one aggregate query before any rows are fetched or
+    serialized. The count catches deletions, which leave the newest
+    updated_at where it was; a client sending only If-Modified-Since can
+    still miss one, so clients should prefer the ETag. The ETag also covers
+    the user and the query string, which pick the rows and page. Writes
+    made with QuerySet.update() must set updated_at themselves.
+    """
+    last_modified_field = 'updated_at'
+
+    def list(self, request, *args, **kwargs):
+        return self.conditional_response(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.conditional_response(super().retrieve, request, *args, **kwargs)
+
+    def get_validator_queryset(self):
+        queryset = self.filter_queryset(self.get_queryset())
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        if lookup_url_kwarg in self.kwargs:
+            queryset = queryset.filter(**{self.lookup_field: self.kwargs[lookup_url_kwarg]})
+        return queryset
+
+    def get_validators(self):
+        """Return (etag, last_modified) for the current request."""
+        state = self.get_validator_queryset().order_by().aggregate(
+            last_modified=Max(self.last_modified_field), count=Count('pk'),
+        )
+        last_modified = state['last_modified']
+        user = self.request.user
+        key = '|'.join([
+            f"{getattr(user, 'user_type', '')}:{getattr(user, 'id', '')}",
+            self.request.get_full_path(),
+            last_modified.isoformat() if last_modified else '',
+            str(state['count']),
+        ])
+        return f'W/"{hashlib.md5(key.encode()).hexdigest()}"', last_modified
+
+    def conditional_response(self, handler, request, *args, **kwargs):
+        etag, last_modified = self.get_validators()
+        timestamp = int(last_modified.timestamp()) if last_modified else None
+        response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+        if response is None:
+            response = handler(request, *args, **kwargs)
+        if response.status_code in (200, 304):
+            response['ETag'] = etag
+            if timestamp is not None:
+                response['Last-Modified'] = http_date(timestamp)
+            # Bodies are per user: let browsers keep them, but always revalidate.
+            patch_cache_control(response, private=True, no_cache=True)
+            patch_vary_headers(response, ['Authorization'])
+        return response
@@ -0,0 +1,185 @@
+import atexit
+import glob
+import json
+import os
+import threading
+import time
+from django.conf import settings
+
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+QUERY_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200, 500)
+
+
+class Registry:
+    """In-process counters and histograms that can be merged across workers.
+
+    Each worker periodically writes its totals to its own file under
+    settings.METRICS_MULTIPROCESS_DIR; /metrics sums the files of workers
+    still running and deletes the rest. Without that setting only the
+    serving process is reported.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.metrics = {}
+        self.started = int(time.time())
+        self.last_flush = 0
+
+    def counter(self, name, help_text):
+        self.metrics[name] = {'type': 'counter', 'help': help_text, 'samples': {}}
+
+    def histogram(self, name, help_text, buckets):
+        self.metrics[name] = {'type': 'histogram', 'help': help_text, 'buckets': list(buckets), 'samples': {}}
+
+    def inc(self, name, labels, amount=1):
+        key = _label_key(labels)
+        with self.lock:
+            samples = self.metrics[name]['samples']
+            samples[key] = samples.get(key, 0) + amount
+
+    def observe(self, name, labels, value):
+        key = _label_key(labels)
+        with self.lock:
+            metric = self.metrics[name]
+            sample = metric['samples'].get(key)
+            if sample is None:
+                sample = metric['samples'][key] = {'buckets': [0] * len(metric['buckets']), 'sum': 0, 'count': 0}
+            for index, bound in enumerate(metric['buckets']):
+                if value <= bound:
+                    sample['buckets'][index] += 1
+            sample['sum'] += value
+            sample['count'] += 1
+
+    def snapshot(self):
+        with self.lock:
+            return json.loads(json.dumps(self.metrics))
+
+    def path(self):
+        directory = getattr(settings, 'METRICS_MULTIPROCESS_DIR', '')
+        if not directory:
+            return None
+        return os.path.join(directory, f'metrics-{os.getpid()}-{self.started}.json')
+
+    def flush(self, force=False):
+        """Write this worker's totals to its file, at most once per flush interval."""
+        path = self.path()
+        now = time.monotonic()
+        if path is None or (not force and now - self.last_flush < settings.METRICS_FLUSH_INTERVAL):
+            return
+        self.last_flush = now
+        temporary = f'{path}.tmp'
+        with open(temporary, 'w') as handle:
+            json.dump(self.snapshot(), handle)
+        os.replace(temporary, path)
+
+    def collect(self):
+        """Totals for every worker, including this one's latest numbers."""
+        directory = getattr(settings, 'METRICS_MULTIPROCESS_DIR', '')
+        if not directory:
+            return self.snapshot()
+
+        self.flush(force=True)
+        merged = {}
+        for path in glob.glob(os.path.join(directory, 'metrics-*.json')):
+            if self.prune(path):
+                continue
+            try:
+                with open(path) as handle:
+                    _merge(merged, json.load(handle))
+            except (OSError, ValueError):
+                continue
+        return merged
+
+    def prune(self, path):
+        """Delete the file of a worker that has exited; returns True if it was removed.
+
+        Its totals drop out of the merged counters, which Prometheus reads
+        as a counter reset, as it would for a restarted single process.
+        """
+        try:
+            pid, started = (int(part) for part in os.path.basename(path)[len('metrics-'):-len('.json')].split('-'))
+        except ValueError:
+            return False
+        if pid == os.getpid():
+            stale = started != self.started
+        else:
+            stale = not _process_exists(pid)
+        if stale:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        return stale
+
+
+def _process_exists(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        # Running, but as another user.
+        pass
+    return True
+
+
+def _label_key(labels):
+    return json.dumps(sorted(labels.items()))
+
+
+def _merge(merged, snapshot):
+    for name, metric in snapshot.items():
+        target = merged.setdefault(name, {**metric, 'samples': {}})
+        for key, value in metric['samples'].items():
+            current = target['samples'].get(key)
+            if current is None:
+                target['samples'][key] = value
+            elif metric['type'] == 'histogram':
+                current['buckets'] = [a + b for a, b in zip(current['buckets'], value['buckets'])]
+                current['sum'] += value['sum']
+                current['count'] += value['count']
+            else:
+                target['samples'][key] = current + value
+
+
+def _format_labels(labels, extra=()):
+    pairs = list(labels) + list(extra)
+    if not pairs:
+        return ''
+    escaped = (str(value).replace('\\', '\\\\').replace('"', '\\"') for _, value in pairs)
+    return '{' + ','.join(f'{name}="{value}"' for (name, _), value in zip(pairs, escaped)) + '}'
+
+
+def render_prometheus(metrics):
+    """Format collected metrics in the Prometheus text exposition format."""
+    lines = []
+    for name in sorted(metrics):
+        metric = metrics[name]
+        lines.append(f'# HELP {name} {metric["help"]}')
+        lines.append(f'# TYPE {name} {metric["type"]}')
+        for key, value in sorted(metric['samples'].items()):
+            labels = [tuple(pair) for pair in json.loads(key)]
+            if metric['type'] == 'histogram':
+                for bound, count in zip(metric['buckets'], value['buckets']):
+                    lines.append(f'{name}_bucket{_format_labels(labels, [("le", bound)])} {count}')
+                lines.append(f'{name}_bucket{_format_labels(labels, [("le", "+Inf")])} {value["count"]}')
+                lines.append(f'{name}_sum{_format_labels(labels)} {value["sum"]}')
+                lines.append(f'{name}_count{_format_labels(labels)} {value["count"]}')
+            else:
+                lines.append(f'{name}{_format_labels(labels)} {value}')
+    return '\n'.join(lines) + '\n'
+
+
+registry = Registry()
+registry.counter('http_requests_total', 'Requests handled, by route, method and status.')
+registry.histogram('http_request_duration_seconds', 'Total time spent handling a request.', LATENCY_BUCKETS)
+registry.histogram('http_request_db_queries', 'Database queries run per request.', QUERY_BUCKETS)
+registry.histogram('http_request_db_duration_seconds', 'Time spent in the database per request.', LATENCY_BUCKETS)
+registry.histogram('http_request_serialize_duration_seconds', 'Time spent in serializer.data per request.', LATENCY_BUCKETS)
+registry.histogram('http_request_render_duration_seconds', 'Time spent rendering the response body.', LATENCY_BUCKETS)
+registry.counter('password_hash_requests_total', 'Password checks by outcome: queued, rejected when the pool is full, or timed_out.')
+registry.histogram('password_hash_queue_seconds', 'Time a password check waited for a hashing thread.', LATENCY_BUCKETS)
+registry.histogram('password_hash_duration_seconds', 'Time spent verifying a password hash.', LATENCY_BUCKETS)
+
+atexit.register(registry.flush, force=True)
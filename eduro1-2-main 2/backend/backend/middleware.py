@@ -0,0 +1,143 @@
+import time
+from contextlib import ExitStack, nullcontext
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connections
+from .metrics import registry
+from .routers import PIN_COOKIE, PIN_HEADER, pin_to_primary, replica_configured
+
+
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+
+class QueryTimer:
+    """Database execute wrapper counting queries and the time spent in them."""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - started
+            self.count += 1
+
+
+class RequestTimingMiddleware:
+    """Time each request's database work, serialization, rendering and total latency.
+
+    The numbers go out as a Server-Timing header and into the process-wide
+    histograms served by /metrics, labelled by URL route so that endpoints
+    with path parameters share one series. Serialization is only measured
+    in views using SerializeTimingViewMixin.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        timer, started = self.start(request)
+        with self.wrap_queries(timer):
+            response = self.get_response(request)
+        return self.finish(request, response, timer, started)
+
+    async def __acall__(self, request):
+        timer, started = self.start(request)
+        with self.wrap_queries(timer):
+            response = await self.get_response(request)
+        return self.finish(request, response, timer, started)
+
+    def start(self, request):
+        request._serialize_duration = 0.0
+        request._render_duration = 0.0
+        return QueryTimer(), time.perf_counter()
+
+    def wrap_queries(self, timer):
+        stack = ExitStack()
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(timer))
+        return stack
+
+    def finish(self, request, response, timer, started):
+        total = time.perf_counter() - started
+        match = getattr(request, 'resolver_match', None)
+        labels = {'route': match.route if match else 'unmatched'}
+        registry.inc('http_requests_total', {**labels, 'method': request.method, 'status': response.status_code})
+        registry.observe('http_request_duration_seconds', labels, total)
+        registry.observe('http_request_db_queries', labels, timer.count)
+        registry.observe('http_request_db_duration_seconds', labels, timer.duration)
+        registry.observe('http_request_serialize_duration_seconds', labels, request._serialize_duration)
+        registry.observe('http_request_render_duration_seconds', labels, request._render_duration)
+        registry.flush()
+
+        response['Server-Timing'] = ', '.join([
+            f'db;dur={timer.duration * 1000:.1f};desc="{timer.count} queries"',
+            f'serialize;dur={request._serialize_duration * 1000:.1f}',
+            f'render;dur={request._render_duration * 1000:.1f}',
+            f'total;dur={total * 1000:.1f}',
+        ])
+        return response
+
+    def process_template_response(self, request, response):
+        # DRF responses are rendered right after this hook returns.
+        started = time.perf_counter()
+
+        def rendered(response):
+            request._render_duration = time.perf_counter() - started
+
+        response.add_post_render_callback(rendered)
+        return response
+
+
+class PrimaryPinMiddleware:
+    """Keep reads on the primary where the replica could be stale.
+
+    Writes pin their own request, and set a short-lived cookie that pins the
+    client's following reads until the replica has caught up. Clients can
+    also pin any request with the X-Pin-Primary header.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        with self.pin(request):
+            response = self.get_response(request)
+        return self.finish(request, response)
+
+    async def __acall__(self, request):
+        # The pin is a context variable, so it follows the request into
+        # sync_to_async threads.
+        with self.pin(request):
+            response = await self.get_response(request)
+        return self.finish(request, response)
+
+    def pin(self, request):
+        pinned = self.writing(request) or PIN_COOKIE in request.COOKIES or PIN_HEADER in request.headers
+        return pin_to_primary() if pinned else nullcontext()
+
+    def writing(self, request):
+        return request.method not in SAFE_METHODS
+
+    def finish(self, request, response):
+        if self.writing(request) and replica_configured() and settings.DATABASE_REPLICA_PIN_SECONDS:
+            response.set_cookie(PIN_COOKIE, '1', max_age=settings.DATABASE_REPLICA_PIN_SECONDS,
+                                httponly=True, samesite='Lax')
+        return response
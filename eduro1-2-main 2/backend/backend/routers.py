@@ -0,0 +1,94 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+
+REPLICA = 'replica'
+PIN_COOKIE = 'pin_primary'
+PIN_HEADER = 'X-Pin-Primary'
+# App label of DatabaseCache's entries; a lagging replica would serve
+# invalidated entries.
+CACHE_APP_LABEL = 'django_cache'
+
+_use_replica = ContextVar('use_replica', default=False)
+_pinned = ContextVar('pin_to_primary', default=False)
+
+
+def replica_configured():
+    return REPLICA in settings.DATABASES
+
+
+@contextmanager
+def use_replica():
+    """Route reads inside the block to the replica, unless pinned to primary."""
+    token = _use_replica.set(True)
+    try:
+        yield
+    finally:
+        _use_replica.reset(token)
+
+
+@contextmanager
+def pin_to_primary():
+    """Force every read inside the block onto the primary, even within use_replica()."""
+    token = _pinned.set(True)
+    try:
+        yield
+    finally:
+        _pinned.reset(token)
+
+
+class PrimaryReplicaRouter:
+    """Send opted-in reads to the replica alias; everything else stays on primary.
+
+    Reads only leave the primary inside use_replica(), when no pin is active
+    and no transaction is open on the primary, so a request always sees its
+    own writes. Database cache entries are always read from the primary.
+    """
+
+    def db_for_read(self, model, **hints):
+        if (
+            model._meta.app_label != CACHE_APP_LABEL
+            and _use_replica.get()
+            and not _pinned.get()
+            and replica_configured()
+            and not connections['default'].in_atomic_block
+        ):
+            return REPLICA
+        return None
+
+    def db_for_write(self, model, **hints):
+        return 'default'
+
+    def allow_relation(self, obj1, obj2, **hints):
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db != REPLICA
+
+
+class ReplicaReadMixin:
+    """Serve a view's GET and HEAD requests from the replica."""
+
+    def dispatch(self, request, *args, **kwargs):
+        if request.method in ('GET', 'HEAD'):
+            with use_replica():
+                return super().dispatch(request, *args, **kwargs)
+        return super().dispatch(request, *args, **kwargs)
+
+
+@receiver(connection_created)
+def enable_sqlite_wal(sender, connection, **kwargs):
+    # In WAL mode SQLite readers do not block the writer, so replica reads
+    # on the same file never hold up attendance marking.
+    if (
+        replica_configured()
+        and connection.vendor == 'sqlite'
+        and connection.alias == 'default'
+        and not connection.is_in_memory_db()
+    ):
+        with connection.cursor() as cursor:
+            cursor.execute('PRAGMA journal_mode=WAL')
@@ -0,0 +1,118 @@
+import time
+from django.core.exceptions import FieldDoesNotExist
+
+
+class EagerLoadingMixin:
+    """Serializer mixin that plans select_related/prefetch_related for its querysets.
+
+    Relations read through dotted `source` paths (e.g. 'department.name') are
+    discovered automatically. Relations used inside SerializerMethodFields
+    cannot be seen, so declare them in `select_related_fields` or
+    `prefetch_related_fields`.
+    """
+    select_related_fields = ()
+    prefetch_related_fields = ()
+
+    @classmethod
+    def get_related_plan(cls):
+        """Return (select_related, prefetch_related) lookups for this serializer."""
+        plan = cls.__dict__.get('_related_plan')
+        if plan is None:
+            plan = cls._build_related_plan()
+            cls._related_plan = plan
+        return plan
+
+    @classmethod
+    def _build_related_plan(cls):
+        select_related = set(cls.select_related_fields)
+        prefetch_related = set(cls.prefetch_related_fields)
+
+        model = getattr(getattr(cls, 'Meta', None), 'model', None)
+        if model is not None:
+            for field in cls().fields.values():
+                source = field.source or ''
+                if '.' not in source:
+                    continue
+                lookup, needs_prefetch = _relation_lookup(model, source.split('.')[:-1])
+                if lookup:
+                    (prefetch_related if needs_prefetch else select_related).add(lookup)
+
+        # A prefetch supersedes a join over the same path.
+        select_related -= prefetch_related
+        return sorted(select_related), sorted(prefetch_related)
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        select_related, prefetch_related = cls.get_related_plan()
+        if select_related:
+            queryset = queryset.select_related(*select_related)
+        if prefetch_related:
+            queryset = queryset.prefetch_related(*prefetch_related)
+        return queryset
+
+
+def _relation_lookup(model, attrs):
+    """Translate attribute hops into an ORM lookup; flag to-many hops for prefetching."""
+    parts = []
+    needs_prefetch = False
+    for attr in attrs:
+        try:
+            field = model._meta.get_field(attr)
+        except FieldDoesNotExist:
+            break
+        if not field.is_relation:
+            break
+        if field.many_to_many or field.one_to_many:
+            needs_prefetch = True
+        parts.append(attr)
+        model = field.related_model
+    return '__'.join(parts), needs_prefetch
+
+
+class EagerLoadingViewMixin:
+    """Generic view mixin that applies the serializer's relation plan to get_queryset()."""
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        serializer_class = self.get_serializer_class()
+        if issubclass(serializer_class, EagerLoadingMixin):
+            queryset = serializer_class.setup_eager_loading(queryset)
+        return queryset
+
+
+class SerializeTimingViewMixin:
+    """Generic view mixin that adds the time spent in serializer.data to the request.
+
+    RequestTimingMiddleware reports the total as its own Server-Timing
+    entry and histogram, separate from rendering the response body.
+    """
+
+    def get_serializer(self, *args, **kwargs):
+        serializer = super().get_serializer(*args, **kwargs)
+        serializer.__class__ = _timed_serializer_class(type(serializer))
+        serializer._timed_request = self.request._request
+        return serializer
+
+
+_timed_serializer_classes = {}
+
+
+def _timed_serializer_class(serializer_class):
+    timed = _timed_serializer_classes.get(serializer_class)
+    if timed is None:
+        class TimedSerializer(serializer_class):
+            @property
+            def data(self):
+                started = time.perf_counter()
+                try:
+                    return super().data
+                finally:
+                    request = self._timed_request
+                    request._serialize_duration = (
+                        getattr(request, '_serialize_duration', 0.0) + time.perf_counter() - started
+                    )
+
+        TimedSerializer.__name__ = serializer_class.__name__
+        TimedSerializer.__qualname__ = serializer_class.__qualname__
+        timed = _timed_serializer_classes[serializer_class] = TimedSerializer
+    return timed
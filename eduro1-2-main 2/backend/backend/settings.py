@@ -4,6 +4,7 @@ Django settings for SIMS (Smart Institute Management System) backend project.
 
 from pathlib import Path
 from decouple import config
+from corsheaders.defaults import default_headers
 import os
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -50,6 +51,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'backend.middleware.RequestTimingMiddleware',
+    'backend.middleware.PrimaryPinMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -91,6 +94,45 @@ DATABASES = {
     }
 }
 
+# Reports, dashboards and admin lists read from a 'replica' alias when one is
+# configured (see backend/routers.py); writes and everything else stay on
+# default. With SQLite, point DATABASE_REPLICA_NAME at the primary file: it is
+# opened read-only on separate connections and WAL keeps reads from blocking
+# writes. After a write, a client's reads stay on primary for
+# DATABASE_REPLICA_PIN_SECONDS to cover replication lag.
+DATABASE_REPLICA_NAME = config('DATABASE_REPLICA_NAME', default='')
+DATABASE_REPLICA_PIN_SECONDS = config('DATABASE_REPLICA_PIN_SECONDS', default=5, cast=int)
+if DATABASE_REPLICA_NAME:
+    DATABASES['replica'] = {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': f'file:{DATABASE_REPLICA_NAME}?mode=ro',
+        'OPTIONS': {'uri': True},
+        'TEST': {'MIRROR': 'default'},
+    }
+
+DATABASE_ROUTERS = ['backend.routers.PrimaryReplicaRouter']
+
+
+# Shared cache for dashboard stats, the academic snapshot's version stamp and
+# the event/announcement feeds. Signals invalidate entries in this cache, so
+# every worker must use the same one: set CACHE_REDIS_URL to use Redis,
+# otherwise entries live in the database (`manage.py createcachetable`).
+CACHE_REDIS_URL = config('CACHE_REDIS_URL', default='')
+if CACHE_REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': CACHE_REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+            'LOCATION': 'django_cache',
+        }
+    }
+
 
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
@@ -114,6 +156,24 @@ AUTH_PASSWORD_VALIDATORS = [
 ]
 
 
+# Password hashing
+# The first hasher is the one passwords are upgraded to on successful login.
+PASSWORD_HASHERS = [
+    'authentication.hashers.ConfiguredPBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.Argon2PasswordHasher',
+    'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+]
+PASSWORD_HASH_ITERATIONS = config('PASSWORD_HASH_ITERATIONS', default=600000, cast=int)
+
+# Login hashing runs on a bounded worker pool; requests beyond
+# workers + queue size are rejected with 503 instead of queueing.
+PASSWORD_HASH_WORKERS = config('PASSWORD_HASH_WORKERS', default=os.cpu_count() or 2, cast=int)
+PASSWORD_HASH_QUEUE_SIZE = config('PASSWORD_HASH_QUEUE_SIZE', default=32, cast=int)
+PASSWORD_HASH_TIMEOUT = config('PASSWORD_HASH_TIMEOUT', default=5, cast=float)
+
+
 # Internationalization
 # https://docs.djangoproject.com/en/4.2/topics/i18n/
 
@@ -147,7 +207,9 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 # Django REST Framework configuration
 REST_FRAMEWORK = {
-    'DEFAULT_AUTHENTICATION_CLASSES': [],
+    'DEFAULT_AUTHENTICATION_CLASSES': [
+        'authentication.authentication.JWTAuthentication',
+    ],
     'DEFAULT_PERMISSION_CLASSES': [],
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 50,
@@ -173,15 +235,92 @@ SIMPLE_JWT = {
     'TOKEN_TYPE_CLAIM': 'token_type',
 }
 
+# Principals resolved from JWTs are cached in-process. Saves and deletes of
+# the user models invalidate locally; the TTL bounds staleness across workers.
+JWT_PRINCIPAL_CACHE_SIZE = config('JWT_PRINCIPAL_CACHE_SIZE', default=10000, cast=int)
+JWT_PRINCIPAL_CACHE_TTL = config('JWT_PRINCIPAL_CACHE_TTL', default=60, cast=int)
+
 
 # CORS configuration
 CORS_ALLOW_ALL_ORIGINS = True
 CORS_ALLOW_CREDENTIALS = True
+CORS_ALLOW_HEADERS = (*default_headers, 'x-pin-primary')
+
+
+# Notification fan-out: announcements and events are delivered in chunks by a
+# background thread after commit; process_notification_fanouts resumes any
+# job left behind by a crashed worker.
+NOTIFICATION_FANOUT_IN_PROCESS = config('NOTIFICATION_FANOUT_IN_PROCESS', default=True, cast=bool)
+NOTIFICATION_FANOUT_CHUNK_SIZE = config('NOTIFICATION_FANOUT_CHUNK_SIZE', default=1000, cast=int)
+NOTIFICATION_FANOUT_LOCK_TIMEOUT = config('NOTIFICATION_FANOUT_LOCK_TIMEOUT', default=300, cast=int)
+NOTIFICATION_FANOUT_MAX_ATTEMPTS = config('NOTIFICATION_FANOUT_MAX_ATTEMPTS', default=5, cast=int)
+
+
+# Result publishing flips and notifies this many students per transaction; a
+# run whose lock is older than the timeout is considered abandoned.
+RESULT_PUBLISH_CHUNK_SIZE = config('RESULT_PUBLISH_CHUNK_SIZE', default=1000, cast=int)
+RESULT_PUBLISH_LOCK_TIMEOUT = config('RESULT_PUBLISH_LOCK_TIMEOUT', default=300, cast=int)
+
+
+# Departments, courses, semesters, subjects and assignments are served from a
+# per-process snapshot; workers check its version stamp in the shared cache at
+# most once per interval, and rebuild it after the max age regardless
+# (seconds). The max age only covers rolled-back writes, which never bump the
+# stamp after commit.
+ACADEMIC_HIERARCHY_CHECK_INTERVAL = config('ACADEMIC_HIERARCHY_CHECK_INTERVAL', default=1.0, cast=float)
+ACADEMIC_HIERARCHY_MAX_AGE = config('ACADEMIC_HIERARCHY_MAX_AGE', default=300, cast=float)
+
+
+# Student bulk imports are read in chunks by a background thread after
+# commit; passwords given in the file are hashed on a process pool.
+# process_student_imports resumes any import left behind by a crashed worker.
+STUDENT_IMPORT_IN_PROCESS = config('STUDENT_IMPORT_IN_PROCESS', default=True, cast=bool)
+STUDENT_IMPORT_CHUNK_SIZE = config('STUDENT_IMPORT_CHUNK_SIZE', default=500, cast=int)
+STUDENT_IMPORT_HASH_WORKERS = config('STUDENT_IMPORT_HASH_WORKERS', default=os.cpu_count() or 2, cast=int)
+STUDENT_IMPORT_LOCK_TIMEOUT = config('STUDENT_IMPORT_LOCK_TIMEOUT', default=300, cast=int)
+
+
+# Dashboard stats are cached per role/user and invalidated by model signals;
+# the timeout is only a backstop.
+DASHBOARD_CACHE_TIMEOUT = config('DASHBOARD_CACHE_TIMEOUT', default=600, cast=int)
+
+
+# Event and announcement feeds are prerendered per audience and page in the
+# shared cache and invalidated by model signals. The timeout (seconds) bounds
+# how long a page rendered from a write that was later rolled back is served.
+COMMUNICATIONS_FEED_PAGE_SIZE = config('COMMUNICATIONS_FEED_PAGE_SIZE', default=20, cast=int)
+COMMUNICATIONS_FEED_TIMEOUT = config('COMMUNICATIONS_FEED_TIMEOUT', default=300, cast=int)
+
+
+# Request metrics: per-route latency, query, serialization and render
+# histograms served on /metrics. Point METRICS_MULTIPROCESS_DIR at a directory
+# shared by all workers on the host to report their merged totals; files left
+# by exited workers are deleted when /metrics is scraped. /metrics answers only
+# requests bearing METRICS_TOKEN and is closed while it is unset.
+METRICS_MULTIPROCESS_DIR = config('METRICS_MULTIPROCESS_DIR', default='')
+METRICS_FLUSH_INTERVAL = config('METRICS_FLUSH_INTERVAL', default=5.0, cast=float)
+METRICS_TOKEN = config('METRICS_TOKEN', default='')
+
+
+# Channels configuration (for WebSocket support). Notifications are pushed
+# from WSGI workers and background threads as well as the ASGI process, so
+# every process must share one Redis channel layer. CHANNEL_REDIS_URL defaults
+# to CACHE_REDIS_URL; the in-memory layer is a fallback for the single-process
+# development server only.
+CHANNEL_REDIS_URL = config('CHANNEL_REDIS_URL', default=CACHE_REDIS_URL)
+if CHANNEL_REDIS_URL:
+    CHANNEL_LAYERS = {
+        'default': {
+            'BACKEND': 'channels_redis.core.RedisChannelLayer',
+            'CONFIG': {'hosts': [CHANNEL_REDIS_URL]},
+        },
+    }
+else:
+    CHANNEL_LAYERS = {
+        'default': {
+            'BACKEND': 'channels.layers.InMemoryChannelLayer',
+        },
+    }
 
-
-# Channels configuration (for WebSocket support)
-CHANNEL_LAYERS = {
-    'default': {
-        'BACKEND': 'channels.layers.InMemoryChannelLayer',
-    },
-}
+# Notification pushes arriving within this many seconds share one WebSocket frame.
+NOTIFICATION_PUSH_FLUSH_INTERVAL = config('NOTIFICATION_PUSH_FLUSH_INTERVAL', default=0.5, cast=float)
@@ -0,0 +1,33 @@
+from contextlib import contextmanager
+from django.db import connections
+from django.test.utils import CaptureQueriesContext
+
+
+class QueryBudgetMixin:
+    """TestCase mixin for asserting how many queries an endpoint may run."""
+
+    @contextmanager
+    def assertMaxQueries(self, budget, using='default'):
+        with CaptureQueriesContext(connections[using]) as context:
+            yield context
+        executed = len(context.captured_queries)
+        if executed > budget:
+            queries = '\n'.join(f"{i}. {query['sql']}" for i, query in enumerate(context.captured_queries, 1))
+            self.fail(f'{executed} queries executed, budget is {budget}:\n{queries}')
+
+    def assertQueryCountStable(self, request, grow, using='default'):
+        """Fail if `request()` runs more queries after `grow()` adds rows.
+
+        Catches N+1 patterns: a list endpoint should cost the same number of
+        queries whether its page holds 5 rows or 50.
+        """
+        with CaptureQueriesContext(connections[using]) as before:
+            request()
+        grow()
+        with CaptureQueriesContext(connections[using]) as after:
+            request()
+        self.assertEqual(
+            len(before.captured_queries), len(after.captured_queries),
+            'Query count grew with the number of rows:\n'
+            + '\n'.join(query['sql'] for query in after.captured_queries),
+        )
@@ -0,0 +1,148 @@
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from unittest import mock
+from asgiref.sync import iscoroutinefunction
+from django.conf import settings
+from django.core.cache import cache
+from django.core.handlers.asgi import ASGIHandler
+from django.db import connections, router, transaction
+from django.http import HttpResponse
+from django.test import AsyncRequestFactory, RequestFactory, SimpleTestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework_simplejwt.tokens import RefreshToken
+from authentication.models import AdminUser, Student
+from .metrics import registry
+from .middleware import PrimaryPinMiddleware, RequestTimingMiddleware
+from .routers import PIN_COOKIE, REPLICA, _pinned, pin_to_primary, use_replica
+
+
+class AsyncMiddlewareTests(SimpleTestCase):
+    @override_settings(DEBUG=True)
+    def test_asgi_chain_is_not_adapted_to_sync(self):
+        # Django logs every middleware it has to wrap in async_to_sync.
+        with self.assertNoLogs('django.request', 'DEBUG'):
+            ASGIHandler()
+
+    async def test_async_requests_are_timed_and_pinned(self):
+        async def view(request):
+            return HttpResponse(str(_pinned.get()))
+
+        middleware = RequestTimingMiddleware(PrimaryPinMiddleware(view))
+        self.assertTrue(iscoroutinefunction(middleware))
+        request = AsyncRequestFactory().post('/api/anything')
+        response = await middleware(request)
+        self.assertEqual(response.content, b'True')
+        self.assertIn('total;dur=', response['Server-Timing'])
+
+    def test_sync_requests_are_timed_and_pinned(self):
+        def view(request):
+            return HttpResponse(str(_pinned.get()))
+
+        middleware = RequestTimingMiddleware(PrimaryPinMiddleware(view))
+        self.assertFalse(iscoroutinefunction(middleware))
+        response = middleware(RequestFactory().get('/api/anything', HTTP_X_PIN_PRIMARY='1'))
+        self.assertEqual(response.content, b'True')
+        self.assertIn('total;dur=', response['Server-Timing'])
+
+
+class MetricsDirectoryTests(SimpleTestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        settings = override_settings(METRICS_MULTIPROCESS_DIR=self.directory)
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+    def write(self, pid, started, requests):
+        snapshot = {'http_requests_total': {'type': 'counter', 'help': '', 'samples': {'[]': requests}}}
+        with open(os.path.join(self.directory, f'metrics-{pid}-{started}.json'), 'w') as handle:
+            json.dump(snapshot, handle)
+
+    def test_files_of_exited_workers_are_pruned(self):
+        exited = subprocess.run([sys.executable, '-c', 'import os; print(os.getpid())'], capture_output=True)
+        self.write(int(exited.stdout), 1, 5)
+        self.write(os.getpid(), registry.started - 1, 7)
+        self.write(os.getppid(), 1, 11)
+
+        self.assertEqual(registry.collect()['http_requests_total']['samples']['[]'], 11)
+        self.assertEqual(sorted(os.listdir(self.directory)), sorted([
+            os.path.basename(registry.path()), f'metrics-{os.getppid()}-1.json',
+        ]))
+
+
+class ReplicaRoutingTests(TransactionTestCase):
+    """Runs against a 'replica' alias that mirrors the default test database.
+
+    A TransactionTestCase, so rows are committed and visible to the replica's
+    own connection. The alias is added after the runner has set up its
+    databases, so it is not listed in `databases`.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        replica = {**connections['default'].settings_dict, 'TEST': {'MIRROR': 'default'}}
+        cls.enterClassContext(mock.patch.dict(settings.DATABASES, {REPLICA: replica}))
+        cls.enterClassContext(mock.patch.dict(connections.settings, {REPLICA: replica}))
+        cls.addClassCleanup(connections.__delitem__, REPLICA)
+        cls.addClassCleanup(lambda: connections[REPLICA].close())
+
+    def setUp(self):
+        self.admin = AdminUser.objects.create(email='admin@sims.edu', full_name='Admin')
+        refresh = RefreshToken()
+        refresh['user_id'] = self.admin.id
+        refresh['user_type'] = 'ADMIN'
+        self.headers = {'HTTP_AUTHORIZATION': f'Bearer {refresh.access_token}'}
+        Student.objects.create(
+            email='student@sims.edu', full_name='Student', roll_number='R0001', enrollment_year='2024',
+        )
+
+    def replica_queries(self, callback):
+        with CaptureQueriesContext(connections[REPLICA]) as queries:
+            result = callback()
+        return result, len(queries)
+
+    def test_router_sends_only_unpinned_reads_to_the_replica(self):
+        self.assertEqual(router.db_for_read(Student), 'default')
+        with use_replica():
+            self.assertEqual(router.db_for_read(Student), REPLICA)
+            self.assertEqual(router.db_for_write(Student), 'default')
+            with pin_to_primary():
+                self.assertEqual(router.db_for_read(Student), 'default')
+            with transaction.atomic():
+                self.assertEqual(router.db_for_read(Student), 'default')
+
+    def test_replica_reads_return_primary_rows(self):
+        with use_replica():
+            roll_numbers, queries = self.replica_queries(lambda: list(Student.objects.values_list('roll_number', flat=True)))
+        self.assertEqual(roll_numbers, ['R0001'])
+        self.assertEqual(queries, 1)
+
+    def test_cache_entries_stay_on_the_primary(self):
+        cache.set('replica-test', 'fresh')
+        self.addCleanup(cache.delete, 'replica-test')
+        with use_replica():
+            value, queries = self.replica_queries(lambda: cache.get('replica-test'))
+        self.assertEqual(value, 'fresh')
+        self.assertEqual(queries, 0)
+
+    def test_list_views_read_from_the_replica(self):
+        response, queries = self.replica_queries(lambda: self.client.get('/api/admin/students', **self.headers))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['count'], 1)
+        self.assertGreater(queries, 0)
+
+    def test_reads_after_a_write_are_pinned_to_the_primary(self):
+        response, queries = self.replica_queries(
+            lambda: self.client.post('/api/admin/students/bulk-upload', **self.headers)
+        )
+        self.assertEqual(queries, 0)
+        self.assertIn(PIN_COOKIE, response.cookies)
+
+        response, queries = self.replica_queries(lambda: self.client.get('/api/admin/students', **self.headers))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(queries, 0)
@@ -16,8 +16,17 @@ Including another URLconf
 """
 from django.contrib import admin
 from django.urls import path, include
+from .views import metrics_view
 
 urlpatterns = [
     path('admin/', admin.site.urls),
+    path('metrics', metrics_view, name='metrics'),
     path('api/auth/', include('authentication.urls')),
+    path('api/', include('academic.urls')),
+    path('api/', include('attendance.urls')),
+    path('api/', include('results.urls')),
+    path('api/', include('admin_management.urls')),
+    path('api/', include('notifications.urls')),
+    path('api/', include('reports.urls')),
+    path('api/', include('communications.urls')),
 ]
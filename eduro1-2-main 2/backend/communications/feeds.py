@@ -0,0 +1,99 @@
+import hashlib
+import json
+import math
+import uuid
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+from rest_framework.utils.encoders import JSONEncoder
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+from .models import AUDIENCE_VISIBILITY, Event, Announcement
+from .serializers import AnnouncementSerializer, EventSerializer
+
+
+def upcoming_events():
+    return Event.objects.filter(event_date__gte=timezone.localdate()).order_by('event_date', 'event_time', 'id')
+
+
+def announcements():
+    return Announcement.objects.order_by('-is_pinned', '-created_at', '-id')
+
+
+# Feed name: (rows, serializer).
+FEEDS = {
+    'events': (upcoming_events, EventSerializer),
+    'announcements': (announcements, AnnouncementSerializer),
+}
+
+
+def _version_key(name):
+    return f'communications:feed:{name}:version'
+
+
+def feed_version(name):
+    version = cache.get(_version_key(name))
+    if version is None:
+        version = uuid.uuid4().hex
+        cache.add(_version_key(name), version, None)
+        version = cache.get(_version_key(name), version)
+    return version
+
+
+def bump_feed_version(name):
+    """Invalidate every cached page of a feed now and again once the write commits."""
+    def bump():
+        cache.set(_version_key(name), uuid.uuid4().hex, None)
+
+    bump()
+    transaction.on_commit(bump)
+
+
+def get_feed_page(name, audience, page, path):
+    """Return (body, etag) for a page of an audience's feed, or None past the last page.
+
+    Every user of a role shares the same feed, so each page is rendered to
+    JSON once per version and served from the shared cache until an event
+    or announcement is written on any worker, or for at most
+    COMMUNICATIONS_FEED_TIMEOUT seconds. Keys also carry the date, so the
+    event feed drops past events each day. Links are relative to `path`
+    because the body is shared between hosts.
+    """
+    # The version is read before the rows, so a write landing mid-build
+    # leaves this page under a version nobody asks for again.
+    prefix = f'communications:feed:{name}:{feed_version(name)}:{audience.lower()}:{timezone.localdate().isoformat()}'
+    page_key = f'{prefix}:{page}'
+    entry = cache.get(page_key)
+    if entry is not None:
+        return entry
+
+    rows, serializer_class = FEEDS[name]
+    queryset = rows().filter(visibility__in=AUDIENCE_VISIBILITY.get(audience, ()))
+    page_size = settings.COMMUNICATIONS_FEED_PAGE_SIZE
+    count_key = f'{prefix}:count'
+    count = cache.get(count_key)
+    if count is None:
+        count = queryset.count()
+        cache.set(count_key, count, settings.COMMUNICATIONS_FEED_TIMEOUT)
+    pages = max(1, math.ceil(count / page_size))
+    if page > pages:
+        return None
+
+    start = (page - 1) * page_size
+    body = json.dumps({
+        'count': count,
+        'next': replace_query_param(path, 'page', page + 1) if page < pages else None,
+        'previous': _previous_link(path, page),
+        'results': serializer_class(queryset[start:start + page_size], many=True).data,
+    }, cls=JSONEncoder).encode()
+    entry = (body, f'W/"{hashlib.md5(body).hexdigest()}"')
+    cache.set(page_key, entry, settings.COMMUNICATIONS_FEED_TIMEOUT)
+    return entry
+
+
+def _previous_link(path, page):
+    if page == 1:
+        return None
+    if page == 2:
+        return remove_query_param(path, 'page')
+    return replace_query_param(path, 'page', page - 1)
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.7 on 2026-10-18 15:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('communications', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='announcement',
+            index=models.Index(fields=['visibility', 'is_pinned', 'created_at'], name='announcemen_visibil_e0450d_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['visibility', 'event_date'], name='events_visibil_9507cb_idx'),
+        ),
+    ]
@@ -1,6 +1,14 @@
 from django.db import models
 
 
+# Visibility values each kind of user may see.
+AUDIENCE_VISIBILITY = {
+    'ADMIN': ('ALL', 'TEACHERS_ONLY', 'STUDENTS_ONLY'),
+    'TEACHER': ('ALL', 'TEACHERS_ONLY'),
+    'STUDENT': ('ALL', 'STUDENTS_ONLY'),
+}
+
+
 class Event(models.Model):
     """Event model for institute events."""
     CATEGORY_CHOICES = [
@@ -35,6 +43,7 @@ class Event(models.Model):
         indexes = [
             models.Index(fields=['event_date']),
             models.Index(fields=['category']),
+            models.Index(fields=['visibility', 'event_date']),
         ]
         ordering = ['event_date', 'event_time']
 
@@ -74,6 +83,7 @@ class Announcement(models.Model):
         indexes = [
             models.Index(fields=['-created_at']),
             models.Index(fields=['is_pinned']),
+            models.Index(fields=['visibility', 'is_pinned', 'created_at']),
         ]
         ordering = ['-is_pinned', '-created_at']
 
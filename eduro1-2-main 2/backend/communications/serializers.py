@@ -0,0 +1,29 @@
+from rest_framework import serializers
+from .models import Event, Announcement
+
+
+class EventSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Event
+        fields = [
+            'id', 'title', 'description', 'event_date', 'event_time', 'category', 'visibility',
+            'created_at', 'updated_at',
+        ]
+
+
+class EventFilterSerializer(serializers.Serializer):
+    category = serializers.ChoiceField(choices=Event.CATEGORY_CHOICES, required=False)
+    upcoming = serializers.BooleanField(required=False, default=False)
+
+
+class AnnouncementSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Announcement
+        fields = [
+            'id', 'title', 'content', 'announcement_type', 'visibility', 'is_pinned',
+            'created_at', 'updated_at',
+        ]
+
+
+class AnnouncementFilterSerializer(serializers.Serializer):
+    announcement_type = serializers.ChoiceField(choices=Announcement.TYPE_CHOICES, required=False)
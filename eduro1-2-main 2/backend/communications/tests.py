@@ -1,3 +1,131 @@
-from django.test import TestCase
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework_simplejwt.tokens import RefreshToken
+from authentication.models import AdminUser, Student
+from .feeds import bump_feed_version
+from .models import Event, Announcement
 
-# Create your tests here.
+
+def auth_header(user, user_type):
+    refresh = RefreshToken()
+    refresh['user_id'] = user.id
+    refresh['user_type'] = user_type
+    return {'HTTP_AUTHORIZATION': f'Bearer {refresh.access_token}'}
+
+
+class ConditionalGetTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = AdminUser.objects.create(email='admin@sims.edu', full_name='Admin')
+        cls.student = Student.objects.create(
+            email='student@sims.edu', full_name='Student', roll_number='R0001', enrollment_year='2024',
+        )
+        cls.event = Event.objects.create(
+            title='Sports Day', description='Annual sports day', event_date=timezone.localdate(),
+            category='SPORTS', created_by_admin=cls.admin,
+        )
+        Event.objects.create(
+            title='Staff Meeting', description='Staff only', event_date=timezone.localdate(),
+            category='OTHER', visibility='TEACHERS_ONLY', created_by_admin=cls.admin,
+        )
+
+    def setUp(self):
+        self.headers = auth_header(self.student, 'STUDENT')
+
+    def test_lists_only_rows_visible_to_the_role(self):
+        response = self.client.get('/api/events', **self.headers)
+        self.assertEqual([event['title'] for event in response.json()['results']], ['Sports Day'])
+
+    def test_unchanged_list_is_not_modified(self):
+        etag = self.client.get('/api/events', **self.headers)['ETag']
+        with self.assertNumQueries(1):
+            response = self.client.get('/api/events', HTTP_IF_NONE_MATCH=etag, **self.headers)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['ETag'], etag)
+
+    def test_writes_and_deletes_change_the_etag(self):
+        etag = self.client.get('/api/events', **self.headers)['ETag']
+        self.event.save()
+        response = self.client.get('/api/events', HTTP_IF_NONE_MATCH=etag, **self.headers)
+        self.assertEqual(response.status_code, 200)
+
+        etag = response['ETag']
+        Announcement.objects.create(
+            title='Notice', content='Hidden from students', announcement_type='NOTICE',
+            visibility='TEACHERS_ONLY', created_by_admin=self.admin,
+        )
+        self.assertEqual(self.client.get('/api/events', HTTP_IF_NONE_MATCH=etag, **self.headers).status_code, 304)
+        self.event.delete()
+        self.assertEqual(self.client.get('/api/events', HTTP_IF_NONE_MATCH=etag, **self.headers).status_code, 200)
+
+
+    def test_serialization_is_timed_apart_from_rendering(self):
+        timing = self.client.get('/api/events', **self.headers)['Server-Timing']
+        self.assertEqual([entry.split(';')[0] for entry in timing.split(', ')][:4], ['db', 'serialize', 'render', 'total'])
+
+
+class MetricsAccessTests(TestCase):
+    @override_settings(METRICS_TOKEN='')
+    def test_closed_without_a_token(self):
+        self.assertEqual(self.client.get('/metrics').status_code, 403)
+
+    @override_settings(METRICS_TOKEN='scrape')
+    def test_open_with_the_token(self):
+        self.assertEqual(self.client.get('/metrics').status_code, 403)
+        response = self.client.get('/metrics', HTTP_AUTHORIZATION='Bearer scrape')
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('http_request_serialize_duration_seconds', response.content.decode())
+
+class FeedCacheTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = AdminUser.objects.create(email='admin@sims.edu', full_name='Admin')
+        cls.students = [
+            Student.objects.create(
+                email=f'student{i}@sims.edu', full_name=f'Student {i}', roll_number=f'R{i:04d}', enrollment_year='2024',
+            )
+            for i in range(2)
+        ]
+        for i in range(3):
+            Announcement.objects.create(
+                title=f'Notice {i}', content='For students', announcement_type='NOTICE',
+                visibility='STUDENTS_ONLY', is_pinned=i == 0, created_by_admin=cls.admin,
+            )
+        Announcement.objects.create(
+            title='Staff notice', content='For teachers', announcement_type='NOTICE',
+            visibility='TEACHERS_ONLY', created_by_admin=cls.admin,
+        )
+
+    def setUp(self):
+        # Writes rolled back by earlier tests never bumped after commit.
+        bump_feed_version('announcements')
+        self.headers = [auth_header(student, 'STUDENT') for student in self.students]
+        # One student builds the feed; the other only warms the principal cache.
+        self.client.get('/api/announcements/feed', **self.headers[1])
+        self.client.get('/api/notifications/unread-count', **self.headers[0])
+
+    def test_audience_shares_one_cached_feed(self):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get('/api/announcements/feed', **self.headers[0])
+        # Only the cache backend may be consulted.
+        self.assertEqual([query['sql'] for query in context if 'django_cache' not in query['sql']], [])
+        titles = [announcement['title'] for announcement in response.json()['results']]
+        self.assertEqual(titles, ['Notice 0', 'Notice 2', 'Notice 1'])
+
+    def test_write_invalidates_feed(self):
+        etag = self.client.get('/api/announcements/feed', **self.headers[0])['ETag']
+        self.assertEqual(
+            self.client.get('/api/announcements/feed', HTTP_IF_NONE_MATCH=etag, **self.headers[0]).status_code, 304,
+        )
+        Announcement.objects.create(
+            title='Exam', content='Timetable out', announcement_type='EXAM_ALERT', created_by_admin=self.admin,
+        )
+        response = self.client.get('/api/announcements/feed', HTTP_IF_NONE_MATCH=etag, **self.headers[0])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['count'], 4)
+
+    def test_pages_past_the_end_are_not_found(self):
+        response = self.client.get('/api/announcements/feed?page=2', **self.headers[0])
+        self.assertEqual(response.status_code, 404)
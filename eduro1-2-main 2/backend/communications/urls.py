@@ -0,0 +1,9 @@
+from django.urls import path
+from .views import EventListView, EventFeedView, AnnouncementListView, AnnouncementFeedView
+
+urlpatterns = [
+    path('events', EventListView.as_view(), name='events'),
+    path('events/feed', EventFeedView.as_view(), name='event-feed'),
+    path('announcements', AnnouncementListView.as_view(), name='announcements'),
+    path('announcements/feed', AnnouncementFeedView.as_view(), name='announcement-feed'),
+]
@@ -1,3 +1,92 @@
-from django.shortcuts import render
+from django.http import HttpResponse
+from django.utils import timezone
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from rest_framework import generics, status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from backend.conditional import ConditionalGetMixin
+from backend.serializers import SerializeTimingViewMixin
+from .feeds import get_feed_page
+from .models import AUDIENCE_VISIBILITY, Event, Announcement
+from .serializers import AnnouncementFilterSerializer, AnnouncementSerializer, EventFilterSerializer, EventSerializer
 
-# Create your views here.
+
+class AudienceListView(ConditionalGetMixin, SerializeTimingViewMixin, generics.ListAPIView):
+    """List of the rows visible to the user's role, filtered by `filter_serializer_class`."""
+    permission_classes = [IsAuthenticated]
+    filter_serializer_class = None
+
+    def list(self, request, *args, **kwargs):
+        filters = self.filter_serializer_class(data=request.query_params)
+        if not filters.is_valid():
+            return Response({'error': 'Invalid filters', 'details': filters.errors}, status=status.HTTP_400_BAD_REQUEST)
+        self.filters = filters.validated_data
+        return super().list(request, *args, **kwargs)
+
+    def get_queryset(self):
+        visibility = AUDIENCE_VISIBILITY.get(self.request.user.user_type, ())
+        return self.get_rows().filter(visibility__in=visibility)
+
+
+class EventListView(AudienceListView):
+    """Events in date order, optionally only upcoming ones or one category."""
+    serializer_class = EventSerializer
+    filter_serializer_class = EventFilterSerializer
+
+    def get_rows(self):
+        events = Event.objects.all()
+        if self.filters.get('category'):
+            events = events.filter(category=self.filters['category'])
+        if self.filters['upcoming']:
+            events = events.filter(event_date__gte=timezone.localdate())
+        return events
+
+
+class AnnouncementListView(AudienceListView):
+    """Announcements, pinned first and then newest first."""
+    serializer_class = AnnouncementSerializer
+    filter_serializer_class = AnnouncementFilterSerializer
+
+    def get_rows(self):
+        announcements = Announcement.objects.all()
+        if self.filters.get('announcement_type'):
+            announcements = announcements.filter(announcement_type=self.filters['announcement_type'])
+        return announcements
+
+
+class FeedView(APIView):
+    """One page of the cached feed shared by every user of the caller's role."""
+    permission_classes = [IsAuthenticated]
+    feed = None
+
+    def get(self, request):
+        try:
+            page = int(request.query_params.get('page', 1))
+        except ValueError:
+            page = 0
+        if page < 1:
+            return Response({'error': 'Invalid page'}, status=status.HTTP_400_BAD_REQUEST)
+
+        entry = get_feed_page(self.feed, request.user.user_type, page, request.path)
+        if entry is None:
+            return Response({'error': 'Page not found'}, status=status.HTTP_404_NOT_FOUND)
+
+        body, etag = entry
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = HttpResponse(body, content_type='application/json')
+        response['ETag'] = etag
+        patch_cache_control(response, private=True, no_cache=True)
+        patch_vary_headers(response, ['Authorization'])
+        return response
+
+
+class EventFeedView(FeedView):
+    """Upcoming events in date order."""
+    feed = 'events'
+
+
+class AnnouncementFeedView(FeedView):
+    """Announcements, pinned first and then newest first."""
+    feed = 'announcements'
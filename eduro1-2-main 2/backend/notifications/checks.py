@@ -0,0 +1,20 @@
+from django.conf import settings
+from django.core.checks import Warning, register
+
+
+@register(deploy=True)
+def check_shared_channel_layer(app_configs, **kwargs):
+    """Warn, under `check --deploy`, when pushes cannot leave the process that sends them."""
+    backend = settings.CHANNEL_LAYERS.get('default', {}).get('BACKEND')
+    if backend != 'channels.layers.InMemoryChannelLayer':
+        return []
+    return [
+        Warning(
+            'The channel layer is not shared between processes.',
+            hint=(
+                'Notifications pushed from WSGI workers, fan-out threads or result '
+                'publishing never reach sockets held by the ASGI process. Set CHANNEL_REDIS_URL.'
+            ),
+            id='notifications.W001',
+        )
+    ]
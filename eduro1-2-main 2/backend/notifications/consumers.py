@@ -0,0 +1,71 @@
+import asyncio
+from urllib.parse import parse_qs
+from channels.db import database_sync_to_async
+from channels.generic.websocket import AsyncJsonWebsocketConsumer
+from django.conf import settings
+from rest_framework.exceptions import AuthenticationFailed
+from authentication.authentication import authenticate_token
+from .push import audience_group, recipient_group
+
+
+class NotificationConsumer(AsyncJsonWebsocketConsumer):
+    """Pushes new notifications to a connected dashboard.
+
+    The socket authenticates with the access token in the `token` query
+    parameter. Pushes that arrive close together are buffered and sent as one
+    frame per NOTIFICATION_PUSH_FLUSH_INTERVAL. Fan-outs to a whole role
+    arrive as a single `refresh` frame asking the client to reload its list.
+    """
+
+    async def connect(self):
+        self.push_groups = []
+        self.pending = []
+        self.refreshes = []
+        self.flush_task = None
+
+        token = parse_qs(self.scope.get('query_string', b'').decode()).get('token', [None])[0]
+        if not token:
+            await self.close(code=4401)
+            return
+        try:
+            principal, _ = await database_sync_to_async(authenticate_token)(token)
+        except AuthenticationFailed:
+            await self.close(code=4401)
+            return
+
+        self.principal = principal
+        self.push_groups = [
+            recipient_group(principal.user_type, principal.id),
+            audience_group(principal.user_type),
+        ]
+        for group in self.push_groups:
+            await self.channel_layer.group_add(group, self.channel_name)
+        await self.accept()
+
+    async def disconnect(self, code):
+        for group in self.push_groups:
+            await self.channel_layer.group_discard(group, self.channel_name)
+        if self.flush_task is not None:
+            self.flush_task.cancel()
+
+    async def notification_push(self, event):
+        self.pending.extend(event['items'])
+        self.schedule_flush()
+
+    async def notification_refresh(self, event):
+        self.refreshes.append({'notification_type': event['notification_type'], 'related_id': event['related_id']})
+        self.schedule_flush()
+
+    def schedule_flush(self):
+        if self.flush_task is None:
+            self.flush_task = asyncio.ensure_future(self.flush_later())
+
+    async def flush_later(self):
+        await asyncio.sleep(settings.NOTIFICATION_PUSH_FLUSH_INTERVAL)
+        items, self.pending = self.pending, []
+        refreshes, self.refreshes = self.refreshes, []
+        self.flush_task = None
+        if items:
+            await self.send_json({'type': 'notifications', 'items': items})
+        if refreshes:
+            await self.send_json({'type': 'refresh', 'items': refreshes})
@@ -0,0 +1,80 @@
+from django.db import transaction
+from django.db.models import Count, F, Value
+from django.db.models.functions import Greatest
+from django.utils import timezone
+from .models import Notification, UnreadNotificationCounter
+
+
+def adjust_unread(recipient_type, recipient_ids, delta):
+    """Add `delta` to the unread counter of every listed recipient in one UPDATE."""
+    if not recipient_ids or not delta:
+        return
+    if delta > 0:
+        UnreadNotificationCounter.objects.bulk_create(
+            [UnreadNotificationCounter(recipient_type=recipient_type, recipient_id=recipient_id)
+             for recipient_id in set(recipient_ids)],
+            ignore_conflicts=True,
+        )
+    UnreadNotificationCounter.objects.filter(
+        recipient_type=recipient_type, recipient_id__in=recipient_ids
+    ).update(unread_count=Greatest(F('unread_count') + delta, Value(0)), updated_at=timezone.now())
+
+
+def get_unread_count(recipient_type, recipient_id):
+    counter = UnreadNotificationCounter.objects.filter(
+        recipient_type=recipient_type, recipient_id=recipient_id
+    ).values_list('unread_count', flat=True).first()
+    return counter or 0
+
+
+def mark_read(recipient_type, recipient_id, notification_id):
+    """Mark one notification read. Returns False if it was missing or already read."""
+    with transaction.atomic():
+        updated = Notification.objects.filter(
+            pk=notification_id, recipient_type=recipient_type, recipient_id=recipient_id, is_read=False
+        ).update(is_read=True, updated_at=timezone.now())
+        if updated:
+            adjust_unread(recipient_type, [recipient_id], -updated)
+    return bool(updated)
+
+
+def mark_all_read(recipient_type, recipient_id):
+    """Mark everything read with a single UPDATE and reset the counter."""
+    now = timezone.now()
+    with transaction.atomic():
+        updated = Notification.objects.filter(
+            recipient_type=recipient_type, recipient_id=recipient_id, is_read=False
+        ).update(is_read=True, updated_at=now)
+        UnreadNotificationCounter.objects.filter(
+            recipient_type=recipient_type, recipient_id=recipient_id
+        ).update(unread_count=0, updated_at=now)
+    return updated
+
+
+def reconcile_unread_counters(batch_size=1000):
+    """Rebuild every counter from the notifications table. Returns rows written."""
+    totals = (
+        Notification.objects.filter(is_read=False)
+        .values('recipient_type', 'recipient_id')
+        .annotate(unread=Count('id'))
+        .order_by()
+    )
+
+    written = 0
+    batch = []
+    with transaction.atomic():
+        UnreadNotificationCounter.objects.all().delete()
+        for row in totals.iterator(chunk_size=batch_size):
+            batch.append(UnreadNotificationCounter(
+                recipient_type=row['recipient_type'],
+                recipient_id=row['recipient_id'],
+                unread_count=row['unread'],
+            ))
+            if len(batch) >= batch_size:
+                UnreadNotificationCounter.objects.bulk_create(batch)
+                written += len(batch)
+                batch = []
+        if batch:
+            UnreadNotificationCounter.objects.bulk_create(batch)
+            written += len(batch)
+    return written
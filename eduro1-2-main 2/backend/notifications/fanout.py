@@ -0,0 +1,159 @@
+import logging
+import threading
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+from datetime import timedelta
+from authentication.models import Teacher, Student
+from .counters import adjust_unread
+from .models import Notification, NotificationFanout
+from .push import push_refresh_to_audience
+
+
+logger = logging.getLogger(__name__)
+
+RECIPIENT_MODELS = {
+    'TEACHER': Teacher,
+    'STUDENT': Student,
+}
+
+AUDIENCE_RECIPIENTS = {
+    'ALL': ['TEACHER', 'STUDENT'],
+    'TEACHERS_ONLY': ['TEACHER'],
+    'STUDENTS_ONLY': ['STUDENT'],
+}
+
+
+class FanoutClaimLost(Exception):
+    """Raised when a job's lock went stale and another worker re-claimed it."""
+
+
+def enqueue_fanout(audience, notification_type, title, message, related_id=None):
+    """Record a fan-out job; delivery happens after commit, off the request path."""
+    job = NotificationFanout.objects.create(
+        audience=audience,
+        notification_type=notification_type,
+        title=title,
+        message=message,
+        related_id=related_id,
+    )
+    if settings.NOTIFICATION_FANOUT_IN_PROCESS:
+        transaction.on_commit(lambda: start_fanout_thread(job.pk))
+    return job
+
+
+def start_fanout_thread(job_id):
+    thread = threading.Thread(target=_process_in_thread, args=(job_id,), name=f'fanout-{job_id}', daemon=True)
+    thread.start()
+    return thread
+
+
+def _process_in_thread(job_id):
+    try:
+        process_fanout(job_id)
+    finally:
+        connection.close()
+
+
+def claim_fanout(job_id):
+    """Atomically take ownership of a pending (or abandoned) job."""
+    now = timezone.now()
+    stale = now - timedelta(seconds=settings.NOTIFICATION_FANOUT_LOCK_TIMEOUT)
+    claimed = NotificationFanout.objects.filter(pk=job_id).filter(
+        Q(status='PENDING') | Q(status='RUNNING', locked_at__lt=stale)
+    ).update(status='RUNNING', locked_at=now, attempts=F('attempts') + 1, updated_at=now)
+    if not claimed:
+        return None
+    return NotificationFanout.objects.get(pk=job_id)
+
+
+def run_fanout(job, chunk_size):
+    """Deliver a claimed job chunk by chunk, advancing its cursor with each insert.
+
+    Every cursor advance is conditional on the lock this worker set, and
+    runs before the chunk's inserts in the same transaction. If the lock
+    went stale and another worker re-claimed the job, the advance matches
+    no row and the chunk is rolled back instead of being delivered twice.
+    """
+    phases = AUDIENCE_RECIPIENTS[job.audience]
+    start = phases.index(job.cursor_recipient_type) if job.cursor_recipient_type else 0
+
+    for recipient_type in phases[start:]:
+        last_id = job.cursor_id if recipient_type == job.cursor_recipient_type else 0
+        recipients = RECIPIENT_MODELS[recipient_type].objects.filter(is_active=True).order_by('id')
+
+        while True:
+            ids = list(recipients.filter(id__gt=last_id).values_list('id', flat=True)[:chunk_size])
+            if not ids:
+                break
+
+            with transaction.atomic():
+                now = timezone.now()
+                advanced = NotificationFanout.objects.filter(pk=job.pk, locked_at=job.locked_at).update(
+                    cursor_recipient_type=recipient_type,
+                    cursor_id=ids[-1],
+                    delivered_count=F('delivered_count') + len(ids),
+                    locked_at=now,
+                    updated_at=now,
+                )
+                if not advanced:
+                    raise FanoutClaimLost(job.pk)
+
+                Notification.objects.bulk_create([
+                    Notification(
+                        recipient_type=recipient_type,
+                        recipient_id=recipient_id,
+                        notification_type=job.notification_type,
+                        title=job.title,
+                        message=job.message,
+                        related_id=job.related_id,
+                    )
+                    for recipient_id in ids
+                ])
+                adjust_unread(recipient_type, ids, 1)
+            job.locked_at = now
+            last_id = ids[-1]
+
+        push_refresh_to_audience(recipient_type, job.notification_type, job.related_id)
+
+    finished = NotificationFanout.objects.filter(pk=job.pk, locked_at=job.locked_at).update(
+        status='DONE', locked_at=None, updated_at=timezone.now(),
+    )
+    if not finished:
+        raise FanoutClaimLost(job.pk)
+
+
+def process_fanout(job_id, chunk_size=None):
+    """Claim and run one job. Returns False if another worker already owns it."""
+    job = claim_fanout(job_id)
+    if job is None:
+        return False
+
+    try:
+        run_fanout(job, chunk_size or settings.NOTIFICATION_FANOUT_CHUNK_SIZE)
+    except FanoutClaimLost:
+        logger.warning('Notification fan-out %s was taken over by another worker', job_id)
+        return False
+    except Exception as exc:
+        logger.exception('Notification fan-out %s failed', job_id)
+        failed = job.attempts >= settings.NOTIFICATION_FANOUT_MAX_ATTEMPTS
+        NotificationFanout.objects.filter(pk=job_id, locked_at=job.locked_at).update(
+            status='FAILED' if failed else 'PENDING',
+            last_error=str(exc),
+            locked_at=None,
+            updated_at=timezone.now(),
+        )
+        return False
+    return True
+
+
+def process_pending_fanouts(chunk_size=None):
+    """Run every pending or abandoned job, oldest first. Returns jobs completed."""
+    stale = timezone.now() - timedelta(seconds=settings.NOTIFICATION_FANOUT_LOCK_TIMEOUT)
+    job_ids = list(
+        NotificationFanout.objects.filter(Q(status='PENDING') | Q(status='RUNNING', locked_at__lt=stale))
+        .order_by('created_at')
+        .values_list('id', flat=True)
+    )
+    return sum(1 for job_id in job_ids if process_fanout(job_id, chunk_size))
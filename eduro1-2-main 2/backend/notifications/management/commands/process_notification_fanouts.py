@@ -0,0 +1,21 @@
+import time
+from django.core.management.base import BaseCommand
+from notifications.fanout import process_pending_fanouts
+
+
+class Command(BaseCommand):
+    help = 'Deliver pending notification fan-outs, resuming any that were interrupted'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=None)
+        parser.add_argument('--loop', action='store_true', help='Keep polling for new jobs')
+        parser.add_argument('--interval', type=float, default=5, help='Seconds between polls with --loop')
+
+    def handle(self, *args, **options):
+        while True:
+            completed = process_pending_fanouts(options['chunk_size'])
+            if completed:
+                self.stdout.write(self.style.SUCCESS(f'Completed {completed} notification fan-outs.'))
+            if not options['loop']:
+                break
+            time.sleep(options['interval'])
@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+from notifications.counters import reconcile_unread_counters
+
+
+class Command(BaseCommand):
+    help = 'Recompute unread notification counters from the notifications table'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        written = reconcile_unread_counters(options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'Reconciled {written} unread counters.'))
@@ -0,0 +1,39 @@
+# Generated by Django 4.2.7 on 2026-10-18 14:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NotificationFanout',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('audience', models.CharField(choices=[('ALL', 'All Users'), ('TEACHERS_ONLY', 'Teachers Only'), ('STUDENTS_ONLY', 'Students Only')], max_length=20)),
+                ('notification_type', models.CharField(choices=[('EVENT_REMINDER', 'Event Reminder'), ('RESULT_PUBLISHED', 'Result Published'), ('ATTENDANCE_LOW', 'Low Attendance Warning'), ('ANNOUNCEMENT', 'Announcement'), ('SYSTEM', 'System Notification')], max_length=20)),
+                ('title', models.CharField(max_length=255)),
+                ('message', models.TextField()),
+                ('related_id', models.IntegerField(blank=True, null=True)),
+                ('status', models.CharField(choices=[('PENDING', 'Pending'), ('RUNNING', 'Running'), ('DONE', 'Done'), ('FAILED', 'Failed')], default='PENDING', max_length=10)),
+                ('cursor_recipient_type', models.CharField(blank=True, max_length=10)),
+                ('cursor_id', models.BigIntegerField(default=0)),
+                ('delivered_count', models.IntegerField(default=0)),
+                ('attempts', models.IntegerField(default=0)),
+                ('last_error', models.TextField(blank=True, null=True)),
+                ('locked_at', models.DateTimeField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Notification Fan-out',
+                'verbose_name_plural': 'Notification Fan-outs',
+                'db_table': 'notification_fanouts',
+                'indexes': [models.Index(fields=['status', 'created_at'], name='notificatio_status_60ab5f_idx')],
+            },
+        ),
+    ]
@@ -33,9 +33,80 @@ class Notification(models.Model):
         verbose_name_plural = 'Notifications'
         indexes = [
             models.Index(fields=['recipient_type', 'recipient_id', 'is_read']),
+            models.Index(fields=['recipient_type', 'recipient_id', '-created_at']),
             models.Index(fields=['-created_at']),
         ]
         ordering = ['-created_at']
 
     def __str__(self):
         return f"{self.recipient_type} {self.recipient_id} - {self.title}"
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the stored read flag so saves can adjust the unread counter.
+        instance._loaded_is_read = instance.__dict__.get('is_read')
+        return instance
+
+
+class UnreadNotificationCounter(models.Model):
+    """Unread notification count per recipient, maintained alongside Notification."""
+    recipient_type = models.CharField(max_length=10, choices=Notification.RECIPIENT_TYPE_CHOICES)
+    recipient_id = models.IntegerField()
+    unread_count = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'unread_notification_counters'
+        verbose_name = 'Unread Notification Counter'
+        verbose_name_plural = 'Unread Notification Counters'
+        unique_together = [['recipient_type', 'recipient_id']]
+
+    def __str__(self):
+        return f"{self.recipient_type} {self.recipient_id} - {self.unread_count} unread"
+
+
+class NotificationFanout(models.Model):
+    """A notification waiting to be delivered to a whole audience in chunks.
+
+    The cursor records the last recipient written, so a crashed or restarted
+    worker resumes where it stopped instead of starting over.
+    """
+    AUDIENCE_CHOICES = [
+        ('ALL', 'All Users'),
+        ('TEACHERS_ONLY', 'Teachers Only'),
+        ('STUDENTS_ONLY', 'Students Only'),
+    ]
+
+    STATUS_CHOICES = [
+        ('PENDING', 'Pending'),
+        ('RUNNING', 'Running'),
+        ('DONE', 'Done'),
+        ('FAILED', 'Failed'),
+    ]
+
+    audience = models.CharField(max_length=20, choices=AUDIENCE_CHOICES)
+    notification_type = models.CharField(max_length=20, choices=Notification.NOTIFICATION_TYPE_CHOICES)
+    title = models.CharField(max_length=255)
+    message = models.TextField()
+    related_id = models.IntegerField(blank=True, null=True)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='PENDING')
+    cursor_recipient_type = models.CharField(max_length=10, blank=True)
+    cursor_id = models.BigIntegerField(default=0)
+    delivered_count = models.IntegerField(default=0)
+    attempts = models.IntegerField(default=0)
+    last_error = models.TextField(blank=True, null=True)
+    locked_at = models.DateTimeField(blank=True, null=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'notification_fanouts'
+        verbose_name = 'Notification Fan-out'
+        verbose_name_plural = 'Notification Fan-outs'
+        indexes = [
+            models.Index(fields=['status', 'created_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.audience} - {self.title} ({self.status})"
@@ -0,0 +1,55 @@
+from collections import defaultdict
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+from .serializers import NotificationSerializer
+
+
+def recipient_group(recipient_type, recipient_id):
+    """Channels group for one user, e.g. notifications.STUDENT.812."""
+    return f'notifications.{recipient_type}.{recipient_id}'
+
+
+def audience_group(recipient_type):
+    """Channels group shared by every connected user of one role."""
+    return f'notifications.{recipient_type}'
+
+
+def push_notifications(notifications):
+    """Send freshly created notifications to their recipients' sockets.
+
+    Notifications for the same recipient go out as a single group message.
+    """
+    channel_layer = get_channel_layer()
+    if channel_layer is None:
+        return
+
+    # One list serializer builds its fields once instead of once per row.
+    items = NotificationSerializer(notifications, many=True).data
+    grouped = defaultdict(list)
+    for notification, item in zip(notifications, items):
+        grouped[recipient_group(notification.recipient_type, notification.recipient_id)].append(dict(item))
+
+    async def send_all():
+        for group, items in grouped.items():
+            await channel_layer.group_send(group, {'type': 'notification.push', 'items': items})
+
+    # A single trip into the event loop; async_to_sync per group is far slower.
+    async_to_sync(send_all)()
+
+
+def push_refresh_to_audience(recipient_type, notification_type, related_id=None):
+    """Tell every connected user of a role to refetch their notifications.
+
+    Used by fan-out, which writes thousands of identical rows: one group
+    message replaces a send per recipient. Each recipient's row has its own
+    id, so the frame names what changed and clients reload their list,
+    which gives them the same fields as any other push.
+    """
+    channel_layer = get_channel_layer()
+    if channel_layer is None:
+        return
+    async_to_sync(channel_layer.group_send)(audience_group(recipient_type), {
+        'type': 'notification.refresh',
+        'notification_type': notification_type,
+        'related_id': related_id,
+    })
@@ -0,0 +1,56 @@
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from communications.models import Event, Announcement
+from .counters import adjust_unread
+from .fanout import enqueue_fanout
+from .models import Notification
+from .push import push_notifications
+
+
+@receiver(post_save, sender=Event)
+def event_created(sender, instance, created, raw=False, **kwargs):
+    if not created or raw:
+        return
+    enqueue_fanout(
+        audience=instance.visibility,
+        notification_type='EVENT_REMINDER',
+        title=instance.title,
+        message=f"{instance.title} on {instance.event_date}",
+        related_id=instance.id,
+    )
+
+
+@receiver(post_save, sender=Announcement)
+def announcement_created(sender, instance, created, raw=False, **kwargs):
+    if not created or raw:
+        return
+    enqueue_fanout(
+        audience=instance.visibility,
+        notification_type='ANNOUNCEMENT',
+        title=instance.title,
+        message=instance.content,
+        related_id=instance.id,
+    )
+
+
+@receiver(post_save, sender=Notification)
+def notification_saved(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+
+    if created:
+        if not instance.is_read:
+            adjust_unread(instance.recipient_type, [instance.recipient_id], 1)
+        transaction.on_commit(lambda: push_notifications([instance]))
+    else:
+        previous = getattr(instance, '_loaded_is_read', None)
+        if previous is not None and previous != instance.is_read:
+            adjust_unread(instance.recipient_type, [instance.recipient_id], -1 if instance.is_read else 1)
+    instance._loaded_is_read = instance.is_read
+
+
+@receiver(post_delete, sender=Notification)
+def notification_deleted(sender, instance, **kwargs):
+    if not instance.is_read:
+        adjust_unread(instance.recipient_type, [instance.recipient_id], -1)
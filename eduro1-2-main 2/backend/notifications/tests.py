@@ -1,3 +1,225 @@
-from django.test import TestCase
+from datetime import timedelta
+from unittest import mock
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+from rest_framework_simplejwt.tokens import RefreshToken
+from academic.models import Department
+from authentication.models import Teacher, Student
+from .checks import check_shared_channel_layer
+from .counters import adjust_unread, get_unread_count, mark_all_read, mark_read, reconcile_unread_counters
+from .fanout import FanoutClaimLost, claim_fanout, enqueue_fanout, process_fanout, run_fanout
+from .models import Notification, NotificationFanout, UnreadNotificationCounter
+from .push import audience_group
 
-# Create your tests here.
+
+def auth_header(user, user_type):
+    refresh = RefreshToken()
+    refresh['user_id'] = user.id
+    refresh['user_type'] = user_type
+    return {'HTTP_AUTHORIZATION': f'Bearer {refresh.access_token}'}
+
+
+class NotificationTestData:
+    @classmethod
+    def setUpTestData(cls):
+        department = Department.objects.create(name='Computer Science', code='CS')
+        cls.teachers = [
+            Teacher.objects.create(
+                email=f'teacher{i}@sims.edu', full_name=f'Teacher {i}', employee_id=f'T{i:04d}', department=department,
+            )
+            for i in range(3)
+        ]
+        cls.students = [
+            Student.objects.create(
+                email=f'student{i}@sims.edu', full_name=f'Student {i}', roll_number=f'R{i:04d}', enrollment_year='2024',
+            )
+            for i in range(5)
+        ]
+        Student.objects.filter(pk=cls.students[-1].pk).update(is_active=False)
+
+
+class FanoutTests(NotificationTestData, TestCase):
+    def enqueue(self, audience='ALL'):
+        return enqueue_fanout(audience, 'ANNOUNCEMENT', 'Exam timetable', 'The exam timetable is out.')
+
+    def delivered(self):
+        return sorted(Notification.objects.values_list('recipient_type', 'recipient_id'))
+
+    def expected(self):
+        return sorted(
+            [('TEACHER', teacher.id) for teacher in self.teachers]
+            + [('STUDENT', student.id) for student in self.students[:-1]]
+        )
+
+    def test_delivers_once_to_every_active_recipient(self):
+        job = self.enqueue()
+        self.assertTrue(process_fanout(job.pk, chunk_size=2))
+
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.delivered_count), ('DONE', 7))
+        self.assertEqual(self.delivered(), self.expected())
+
+    def test_audience_limits_recipients(self):
+        process_fanout(self.enqueue('TEACHERS_ONLY').pk, chunk_size=2)
+        self.assertEqual(self.delivered(), sorted(('TEACHER', teacher.id) for teacher in self.teachers))
+
+    def test_failed_chunk_resumes_from_cursor(self):
+        job = self.enqueue()
+        with mock.patch('notifications.fanout.adjust_unread', side_effect=[None, RuntimeError('boom')]):
+            with self.assertLogs('notifications.fanout', 'ERROR'):
+                self.assertFalse(process_fanout(job.pk, chunk_size=2))
+
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.cursor_recipient_type, job.cursor_id), ('PENDING', 'TEACHER', self.teachers[1].id))
+        self.assertEqual(Notification.objects.count(), 2)
+
+        self.assertTrue(process_fanout(job.pk, chunk_size=2))
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.delivered_count), ('DONE', 7))
+        self.assertEqual(self.delivered(), self.expected())
+
+    def test_finished_job_is_not_run_again(self):
+        job = self.enqueue()
+        process_fanout(job.pk)
+        self.assertFalse(process_fanout(job.pk))
+        self.assertEqual(Notification.objects.count(), 7)
+        self.assertEqual(NotificationFanout.objects.get(pk=job.pk).attempts, 1)
+
+    def test_worker_whose_claim_went_stale_stops_delivering(self):
+        job = self.enqueue()
+        first = claim_fanout(job.pk)
+        NotificationFanout.objects.filter(pk=job.pk).update(locked_at=first.locked_at - timedelta(hours=1))
+        second = claim_fanout(job.pk)
+        self.assertIsNotNone(second)
+
+        with self.assertRaises(FanoutClaimLost):
+            run_fanout(first, chunk_size=2)
+        self.assertEqual(Notification.objects.count(), 0)
+
+        run_fanout(second, chunk_size=2)
+        self.assertEqual(self.delivered(), self.expected())
+        self.assertEqual(NotificationFanout.objects.get(pk=job.pk).delivered_count, 7)
+
+    def test_pushes_one_refresh_frame_per_role(self):
+        layer = get_channel_layer()
+        channel = async_to_sync(layer.new_channel)()
+        async_to_sync(layer.group_add)(audience_group('STUDENT'), channel)
+        job = enqueue_fanout('STUDENTS_ONLY', 'EVENT_REMINDER', 'Sports day', 'Sports day on Friday', related_id=7)
+        process_fanout(job.pk, chunk_size=2)
+
+        message = async_to_sync(layer.receive)(channel)
+        self.assertEqual(message, {'type': 'notification.refresh', 'notification_type': 'EVENT_REMINDER', 'related_id': 7})
+        async_to_sync(layer.group_discard)(audience_group('STUDENT'), channel)
+
+
+class UnreadCounterTests(NotificationTestData, TestCase):
+    def notify(self, student, count=1):
+        return [
+            Notification.objects.create(
+                recipient_type='STUDENT', recipient_id=student.id, notification_type='SYSTEM',
+                title=f'Notice {i}', message='Hello',
+            )
+            for i in range(count)
+        ]
+
+    def unread(self, student):
+        return get_unread_count('STUDENT', student.id)
+
+    def test_counter_follows_creates_reads_and_deletes(self):
+        student = self.students[0]
+        first, second, third = self.notify(student, 3)
+        self.assertEqual(self.unread(student), 3)
+
+        self.assertTrue(mark_read('STUDENT', student.id, first.id))
+        self.assertFalse(mark_read('STUDENT', student.id, first.id))
+        self.assertEqual(self.unread(student), 2)
+
+        second = Notification.objects.get(pk=second.pk)
+        second.is_read = True
+        second.save()
+        third.delete()
+        self.assertEqual(self.unread(student), 0)
+
+    def test_other_recipients_cannot_mark_read(self):
+        notification = self.notify(self.students[0])[0]
+        self.assertFalse(mark_read('STUDENT', self.students[1].id, notification.id))
+        self.assertEqual(self.unread(self.students[0]), 1)
+
+    def test_counter_never_goes_below_zero(self):
+        student = self.students[0]
+        self.notify(student)
+        adjust_unread('STUDENT', [student.id], -5)
+        self.assertEqual(self.unread(student), 0)
+
+        self.notify(student, 2)
+        self.assertEqual(mark_all_read('STUDENT', student.id), 3)
+        self.assertEqual(self.unread(student), 0)
+
+    def test_fanout_counts_and_reconcile_agree(self):
+        process_fanout(enqueue_fanout('STUDENTS_ONLY', 'ANNOUNCEMENT', 'Notice', 'Hello').pk, chunk_size=2)
+        self.notify(self.students[0], 2)
+        counts = dict(UnreadNotificationCounter.objects.values_list('recipient_id', 'unread_count'))
+        self.assertEqual(counts[self.students[0].id], 3)
+
+        reconcile_unread_counters()
+        self.assertEqual(dict(UnreadNotificationCounter.objects.values_list('recipient_id', 'unread_count')), counts)
+
+
+class NotificationPaginationTests(NotificationTestData, TestCase):
+    def setUp(self):
+        self.student = self.students[0]
+        self.headers = auth_header(self.student, 'STUDENT')
+        for i in range(5):
+            Notification.objects.create(
+                recipient_type='STUDENT', recipient_id=self.student.id, notification_type='SYSTEM',
+                title=f'Notice {i}', message='Hello',
+            )
+        # Same timestamp everywhere, so only the id tie-breaker orders the rows.
+        Notification.objects.update(created_at=timezone.now())
+        self.expected = list(Notification.objects.order_by('-id').values_list('id', flat=True))
+
+    def page(self, url):
+        response = self.client.get(url, **self.headers)
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        return [row['id'] for row in body['results']], body['next'], body['previous']
+
+    def test_cursors_walk_forward_and_back_without_gaps(self):
+        pages = []
+        url = '/api/notifications?page_size=2'
+        while url:
+            ids, url, previous = self.page(url)
+            pages.append(ids)
+        self.assertEqual(pages, [self.expected[0:2], self.expected[2:4], self.expected[4:]])
+
+        ids, following, previous = self.page(previous)
+        self.assertEqual(ids, self.expected[2:4])
+        self.assertIsNotNone(following)
+        ids, following, previous = self.page(previous)
+        self.assertEqual((ids, previous), (self.expected[0:2], None))
+
+    def test_rows_created_after_the_cursor_are_not_repeated(self):
+        ids, following, _ = self.page('/api/notifications?page_size=2')
+        Notification.objects.create(
+            recipient_type='STUDENT', recipient_id=self.student.id, notification_type='SYSTEM',
+            title='Late notice', message='Hello',
+        )
+        self.assertEqual(self.page(following)[0], self.expected[2:4])
+
+    def test_tampered_cursor_is_not_found(self):
+        response = self.client.get('/api/notifications?cursor=not-a-cursor', **self.headers)
+        self.assertEqual(response.status_code, 404)
+
+
+class ChannelLayerCheckTests(SimpleTestCase):
+    @override_settings(CHANNEL_LAYERS={'default': {'BACKEND': 'channels.layers.InMemoryChannelLayer'}})
+    def test_in_memory_layer_is_flagged(self):
+        self.assertEqual([warning.id for warning in check_shared_channel_layer(None)], ['notifications.W001'])
+
+    @override_settings(CHANNEL_LAYERS={'default': {
+        'BACKEND': 'channels_redis.core.RedisChannelLayer', 'CONFIG': {'hosts': ['redis://localhost:6379/1']},
+    }})
+    def test_redis_layer_is_shared(self):
+        self.assertEqual(check_shared_channel_layer(None), [])
@@ -0,0 +1,12 @@
+from django.urls import path
+from .views import (
+    NotificationListView, UnreadNotificationCountView,
+    MarkNotificationReadView, MarkAllNotificationsReadView,
+)
+
+urlpatterns = [
+    path('notifications', NotificationListView.as_view(), name='notification-list'),
+    path('notifications/unread-count', UnreadNotificationCountView.as_view(), name='notification-unread-count'),
+    path('notifications/<int:notification_id>/mark-read', MarkNotificationReadView.as_view(), name='notification-mark-read'),
+    path('notifications/mark-all-read', MarkAllNotificationsReadView.as_view(), name='notification-mark-all-read'),
+]
@@ -1,3 +1,56 @@
-from django.shortcuts import render
+from rest_framework import generics
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+from backend.conditional import ConditionalGetMixin
+from backend.pagination import KeysetPagination
+from backend.serializers import SerializeTimingViewMixin
+from .counters import get_unread_count, mark_all_read, mark_read
+from .models import Notification
+from .serializers import NotificationSerializer
 
-# Create your views here.
+
+class NotificationPagination(KeysetPagination):
+    ordering = ('-created_at', '-id')
+
+
+class NotificationListView(ConditionalGetMixin, SerializeTimingViewMixin, generics.ListAPIView):
+    permission_classes = [IsAuthenticated]
+    serializer_class = NotificationSerializer
+    pagination_class = NotificationPagination
+
+    def get_queryset(self):
+        user = self.request.user
+        return Notification.objects.filter(recipient_type=user.user_type, recipient_id=user.id)
+
+
+class UnreadNotificationCountView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        user = request.user
+        return Response({'unread_count': get_unread_count(user.user_type, user.id)})
+
+
+class MarkNotificationReadView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, notification_id):
+        user = request.user
+        if not mark_read(user.user_type, user.id, notification_id):
+            exists = Notification.objects.filter(
+                pk=notification_id, recipient_type=user.user_type, recipient_id=user.id
+            ).exists()
+            if not exists:
+                return Response({'error': 'Notification not found'}, status=status.HTTP_404_NOT_FOUND)
+        return Response({'unread_count': get_unread_count(user.user_type, user.id)})
+
+
+class MarkAllNotificationsReadView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        user = request.user
+        marked = mark_all_read(user.user_type, user.id)
+        return Response({'marked_read': marked, 'unread_count': 0})
@@ -0,0 +1,254 @@
+from dataclasses import asdict
+from datetime import timedelta
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, Q, Sum
+from django.db.models.functions import TruncDay, TruncMonth, TruncWeek
+from django.utils import timezone
+from academic.hierarchy import get_hierarchy
+from academic.models import TeacherSubjectAssignment
+from attendance.models import Attendance, AttendanceDailyRollup, AttendanceSummary
+from authentication.models import Teacher, Student
+from communications.models import Event
+from results.models import Result, grade_for_percentage
+
+
+ADMIN_CACHE_KEY = 'dashboard:admin'
+TREND_DAYS = 7
+TREND_PERIODS = {'day': TruncDay, 'week': TruncWeek, 'month': TruncMonth}
+
+
+def user_cache_key(user_type, user_id):
+    return f'dashboard:{user_type.lower()}:{user_id}'
+
+
+def _percentage(part, whole):
+    return round(part / whole * 100, 1) if whole else 0
+
+
+def _cached(key, build):
+    stats = cache.get(key)
+    if stats is None:
+        stats = build()
+        cache.set(key, stats, settings.DASHBOARD_CACHE_TIMEOUT)
+    return stats
+
+
+def build_admin_stats():
+    today = timezone.localdate()
+    attendance = AttendanceSummary.objects.aggregate(present=Sum('present_count'), total=Sum('total_count'))
+    results = Result.objects.filter(is_published=True).aggregate(
+        passed=Count('id', filter=~Q(grade='F')),
+        failed=Count('id', filter=Q(grade='F')),
+    )
+    trend = attendance_trend(today - timedelta(days=TREND_DAYS - 1), today)
+
+    return {
+        'total_students': Student.objects.filter(is_active=True).count(),
+        'total_teachers': Teacher.objects.filter(is_active=True).count(),
+        'avg_attendance': _percentage(attendance['present'] or 0, attendance['total'] or 0),
+        'upcoming_events': Event.objects.filter(event_date__gte=today).count(),
+        'attendance_trends': {
+            'dates': [row['period'].strftime('%a') for row in trend],
+            'percentages': [row['percentage'] for row in trend],
+        },
+        'result_distribution': {
+            'pass_count': results['passed'],
+            'fail_count': results['failed'],
+        },
+    }
+
+
+def attendance_trend(date_from, date_to, granularity='day', department_id=None, semester_id=None, subject_id=None):
+    """Attendance per day, week or month, read from the daily rollup.
+
+    Weeks start on Monday and months on the 1st; each period is labelled by
+    its first day. Days without any attendance are left out.
+    """
+    rollups = AttendanceDailyRollup.objects.filter(date__gte=date_from, date__lte=date_to)
+    if department_id:
+        rollups = rollups.filter(semester__course__department_id=department_id)
+    if semester_id:
+        rollups = rollups.filter(semester_id=semester_id)
+    if subject_id:
+        rollups = rollups.filter(subject_id=subject_id)
+
+    rows = (
+        rollups.annotate(period=TREND_PERIODS[granularity]('date'))
+        .values('period')
+        .annotate(present=Sum('present_count'), total=Sum('total_count'))
+        .filter(total__gt=0)
+        .order_by('period')
+    )
+    return [
+        {
+            'period': row['period'],
+            'present': row['present'],
+            'total': row['total'],
+            'percentage': _percentage(row['present'], row['total']),
+        }
+        for row in rows
+    ]
+
+
+def build_teacher_stats(teacher_id):
+    hierarchy = get_hierarchy()
+    subjects = sorted(
+        (
+            {'id': subject.id, 'code': subject.code, 'name': subject.name, 'semester_id': subject.semester_id}
+            for subject in map(hierarchy.subjects.get, hierarchy.subjects_by_teacher.get(teacher_id, ()))
+            if subject is not None
+        ),
+        key=lambda subject: subject['code'],
+    )
+    subject_ids = [subject['id'] for subject in subjects]
+
+    attendance = {
+        row['subject_id']: row
+        for row in AttendanceSummary.objects.filter(subject_id__in=subject_ids)
+        .values('subject_id')
+        .annotate(present=Sum('present_count'), total=Sum('total_count'))
+        .order_by()
+    }
+    results = {
+        row['subject_id']: row
+        for row in Result.objects.filter(subject_id__in=subject_ids)
+        .values('subject_id')
+        .annotate(entered=Count('id'), pending=Count('id', filter=Q(is_published=False)))
+        .order_by()
+    }
+    total_students = Student.objects.filter(
+        is_active=True, semester_id__in={subject['semester_id'] for subject in subjects}
+    ).count()
+
+    present = sum(row['present'] or 0 for row in attendance.values())
+    total = sum(row['total'] or 0 for row in attendance.values())
+    for subject in subjects:
+        subject_attendance = attendance.get(subject['id'], {})
+        subject_results = results.get(subject['id'], {})
+        subject['avg_attendance'] = _percentage(subject_attendance.get('present') or 0, subject_attendance.get('total') or 0)
+        subject['results_entered'] = subject_results.get('entered', 0)
+        subject['pending_results'] = subject_results.get('pending', 0)
+        del subject['semester_id']
+
+    return {
+        'total_students': total_students,
+        'avg_attendance': _percentage(present, total),
+        'pending_results': sum(subject['pending_results'] for subject in subjects),
+        'subjects': subjects,
+    }
+
+
+def build_student_stats(student_id):
+    subjects = [
+        {
+            'subject_name': row['subject__name'],
+            'present_count': row['present_count'],
+            'total_count': row['total_count'],
+            'percentage': _percentage(row['present_count'], row['total_count']),
+        }
+        for row in AttendanceSummary.objects.filter(student_id=student_id)
+        .order_by('subject__code')
+        .values('subject__name', 'present_count', 'total_count')
+    ]
+    results = [
+        {
+            'subject_name': row['subject__name'],
+            'internal_marks': row['internal_marks'],
+            'external_marks': row['external_marks'],
+            'total_marks': row['total_marks'],
+            'percentage': row['percentage'],
+            'grade': row['grade'],
+        }
+        for row in Result.objects.filter(student_id=student_id, is_published=True)
+        .order_by('subject__code')
+        .values('subject__name', 'internal_marks', 'external_marks', 'total_marks', 'percentage', 'grade')
+    ]
+
+    present = sum(subject['present_count'] for subject in subjects)
+    total = sum(subject['total_count'] for subject in subjects)
+    avg_percentage = round(sum(result['percentage'] for result in results) / len(results), 1) if results else 0
+
+    return {
+        'overall_attendance': _percentage(present, total),
+        'avg_percentage': avg_percentage,
+        'overall_grade': grade_for_percentage(avg_percentage) if results else None,
+        'subjects': subjects,
+        'results': results,
+    }
+
+
+def build_today_schedule(teacher_id, now=None):
+    """A teacher's lectures for today from the timetable snapshot.
+
+    Each lecture is flagged as completed, ongoing or upcoming, and whether
+    attendance has been marked for it; only the latter reads the database.
+    """
+    now = timezone.localtime(now)
+    today, moment = now.date(), now.time()
+    entries = get_hierarchy().schedule('teacher', teacher_id, today.weekday())
+
+    marked = set()
+    if entries:
+        marked = set(
+            Attendance.objects.filter(
+                date=today,
+                subject_id__in={entry.subject_id for entry in entries},
+                lecture_time__in={entry.start_time for entry in entries},
+            ).values_list('subject_id', 'lecture_time').distinct()
+        )
+
+    lectures = []
+    for entry in entries:
+        if entry.end_time <= moment:
+            state = 'completed'
+        elif entry.start_time <= moment:
+            state = 'ongoing'
+        else:
+            state = 'upcoming'
+        lectures.append({
+            **asdict(entry),
+            'status': state,
+            'attendance_marked': (entry.subject_id, entry.start_time) in marked,
+        })
+    return {'date': today, 'weekday': today.strftime('%A'), 'lectures': lectures}
+
+
+def get_admin_stats():
+    return _cached(ADMIN_CACHE_KEY, build_admin_stats)
+
+
+def get_teacher_stats(teacher_id):
+    return _cached(user_cache_key('TEACHER', teacher_id), lambda: build_teacher_stats(teacher_id))
+
+
+def get_student_stats(student_id):
+    return _cached(user_cache_key('STUDENT', student_id), lambda: build_student_stats(student_id))
+
+
+def invalidate_dashboards(student_ids=(), teacher_ids=(), subject_ids=(), semester_ids=()):
+    """Drop the admin dashboard and every affected user's dashboard after commit.
+
+    Teachers assigned to any of `subject_ids`, or to a subject in
+    `semester_ids`, are looked up when the transaction commits.
+    """
+    student_ids = list(student_ids)
+    teacher_ids = list(teacher_ids)
+    subject_ids = list(subject_ids)
+    semester_ids = list(semester_ids)
+
+    def delete():
+        teachers = set(teacher_ids)
+        if subject_ids or semester_ids:
+            teachers.update(
+                TeacherSubjectAssignment.objects.filter(
+                    Q(subject_id__in=subject_ids) | Q(subject__semester_id__in=semester_ids)
+                ).values_list('teacher_id', flat=True)
+            )
+        keys = [ADMIN_CACHE_KEY]
+        keys += [user_cache_key('STUDENT', student_id) for student_id in student_ids]
+        keys += [user_cache_key('TEACHER', teacher_id) for teacher_id in teachers]
+        cache.delete_many(keys)
+
+    transaction.on_commit(delete)
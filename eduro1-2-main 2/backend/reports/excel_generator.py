@@ -0,0 +1,258 @@
+import zipfile
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from xml.sax.saxutils import escape
+from django.db import router
+from django.utils import timezone
+from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+from openpyxl.utils import get_column_letter
+from attendance.models import Attendance
+from results.models import Result
+
+
+# Rows fetched from the database per round trip, and written per response chunk.
+CHUNK_SIZE = 2000
+# Excel's hard limit is 1,048,576 rows per sheet; leave room for the header.
+MAX_ROWS_PER_SHEET = 1_000_000
+
+ATTENDANCE_HEADERS = [
+    'Date', 'Lecture Time', 'Roll Number', 'Student', 'Subject Code', 'Subject', 'Status', 'Marked By',
+]
+
+RESULT_HEADERS = [
+    'Roll Number', 'Student', 'Subject Code', 'Subject', 'Internal', 'External', 'Total',
+    'Percentage', 'Grade', 'Published',
+]
+
+
+def filter_attendance(filters):
+    queryset = Attendance.objects.all()
+    if filters.get('date_from'):
+        queryset = queryset.filter(date__gte=filters['date_from'])
+    if filters.get('date_to'):
+        queryset = queryset.filter(date__lte=filters['date_to'])
+    if filters.get('subject_id'):
+        queryset = queryset.filter(subject_id=filters['subject_id'])
+    if filters.get('semester_id'):
+        queryset = queryset.filter(subject__semester_id=filters['semester_id'])
+    if filters.get('department_id'):
+        queryset = queryset.filter(subject__semester__course__department_id=filters['department_id'])
+    if filters.get('student_id'):
+        queryset = queryset.filter(student_id=filters['student_id'])
+    return queryset
+
+
+def filter_results(filters):
+    queryset = Result.objects.all()
+    if filters.get('subject_id'):
+        queryset = queryset.filter(subject_id=filters['subject_id'])
+    if filters.get('semester_id'):
+        queryset = queryset.filter(subject__semester_id=filters['semester_id'])
+    if filters.get('department_id'):
+        queryset = queryset.filter(subject__semester__course__department_id=filters['department_id'])
+    if filters.get('student_id'):
+        queryset = queryset.filter(student_id=filters['student_id'])
+    if filters.get('is_published') is not None:
+        queryset = queryset.filter(is_published=filters['is_published'])
+    return queryset
+
+
+class _Pipe:
+    """Write-only sink collecting what zipfile writes until the response takes it."""
+
+    def __init__(self):
+        self.chunks = []
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def take(self):
+        chunks, self.chunks = [chunk for chunk in self.chunks if chunk], []
+        return chunks
+
+
+def stream_rows(title, headers, rows):
+    """Yield an .xlsx workbook of `rows` chunk by chunk while the rows are read.
+
+    Sheets are written as XML straight into a zip stream, so the first bytes
+    go out before the query has fetched its second chunk, and neither memory
+    nor disk grows with the export. A new sheet is started whenever the
+    current one reaches MAX_ROWS_PER_SHEET; the workbook part listing the
+    sheets is written last.
+    """
+    pipe = _Pipe()
+    rows = iter(rows)
+    with zipfile.ZipFile(pipe, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr('_rels/.rels', ROOT_RELS)
+        archive.writestr('xl/styles.xml', STYLES)
+        yield from pipe.take()
+
+        sheet_count = 0
+        pending = next(rows, None)
+        while not sheet_count or pending is not None:
+            sheet_count += 1
+            with archive.open(f'xl/worksheets/sheet{sheet_count}.xml', 'w') as sheet:
+                sheet.write(SHEET_START)
+                sheet.write(_row_xml(1, headers, header=True))
+                number = 1
+                while pending is not None and number <= MAX_ROWS_PER_SHEET:
+                    number += 1
+                    sheet.write(_row_xml(number, pending))
+                    pending = next(rows, None)
+                    if number % CHUNK_SIZE == 0:
+                        yield from pipe.take()
+                sheet.write(SHEET_END)
+
+        names = [title if index == 1 else f'{title} {index}' for index in range(1, sheet_count + 1)]
+        archive.writestr('[Content_Types].xml', _content_types(sheet_count))
+        archive.writestr('xl/workbook.xml', _workbook(names))
+        archive.writestr('xl/_rels/workbook.xml.rels', _workbook_rels(sheet_count))
+    yield from pipe.take()
+
+
+ROOT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="xl/workbook.xml"/></Relationships>'
+)
+
+# Cell styles, by index: 0 plain, 1 date, 2 time, 3 date and time, 4 bold header.
+STYLES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    '<fonts count="2"><font><sz val="11"/><name val="Calibri"/></font>'
+    '<font><b/><sz val="11"/><name val="Calibri"/></font></fonts>'
+    '<fills count="2"><fill><patternFill patternType="none"/></fill><fill><patternFill patternType="gray125"/></fill></fills>'
+    '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+    '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+    '<cellXfs count="5">'
+    '<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+    '<xf numFmtId="14" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/>'
+    '<xf numFmtId="21" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/>'
+    '<xf numFmtId="22" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/>'
+    '<xf numFmtId="0" fontId="1" fillId="0" borderId="0" xfId="0" applyFont="1"/>'
+    '</cellXfs><cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles></styleSheet>'
+)
+
+SHEET_START = (
+    b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    b'<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+)
+SHEET_END = b'</sheetData></worksheet>'
+
+EXCEL_EPOCH = datetime(1899, 12, 30)
+
+
+def _row_xml(number, values, header=False):
+    cells = []
+    for index, value in enumerate(values):
+        if value is None:
+            continue
+        reference = f'{get_column_letter(index + 1)}{number}'
+        if header:
+            cells.append(f'<c r="{reference}" s="4" t="inlineStr"><is><t>{_text(value)}</t></is></c>')
+        elif isinstance(value, bool):
+            cells.append(f'<c r="{reference}" t="b"><v>{int(value)}</v></c>')
+        elif isinstance(value, (int, float, Decimal)):
+            cells.append(f'<c r="{reference}"><v>{value}</v></c>')
+        elif isinstance(value, datetime):
+            if timezone.is_aware(value):
+                value = timezone.make_naive(value)
+            cells.append(f'<c r="{reference}" s="3"><v>{(value - EXCEL_EPOCH) / timedelta(days=1)}</v></c>')
+        elif isinstance(value, date):
+            cells.append(f'<c r="{reference}" s="1"><v>{(value - EXCEL_EPOCH.date()).days}</v></c>')
+        elif isinstance(value, time):
+            seconds = value.hour * 3600 + value.minute * 60 + value.second + value.microsecond / 1e6
+            cells.append(f'<c r="{reference}" s="2"><v>{seconds / 86400}</v></c>')
+        else:
+            cells.append(f'<c r="{reference}" t="inlineStr"><is><t xml:space="preserve">{_text(value)}</t></is></c>')
+    return f'<row r="{number}">{"".join(cells)}</row>'.encode()
+
+
+def _text(value):
+    return escape(ILLEGAL_CHARACTERS_RE.sub('', str(value)))
+
+
+def _content_types(sheet_count):
+    sheets = ''.join(
+        f'<Override PartName="/xl/worksheets/sheet{index}.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        for index in range(1, sheet_count + 1)
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/styles.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+        f'{sheets}</Types>'
+    )
+
+
+def _workbook(names):
+    sheets = ''.join(
+        f'<sheet name="{escape(name[:31], {chr(34): "&quot;"})}" sheetId="{index}" r:id="rId{index}"/>'
+        for index, name in enumerate(names, start=1)
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+        'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+        f'<sheets>{sheets}</sheets></workbook>'
+    )
+
+
+def _workbook_rels(sheet_count):
+    sheets = ''.join(
+        f'<Relationship Id="rId{index}" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+        f'Target="worksheets/sheet{index}.xml"/>'
+        for index in range(1, sheet_count + 1)
+    )
+    styles = (
+        f'<Relationship Id="rId{sheet_count + 1}" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" Target="styles.xml"/>'
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        f'{sheets}{styles}</Relationships>'
+    )
+
+
+def generate_attendance_excel(filters):
+    # The alias is picked now, while the view's replica routing is active;
+    # the rows are only read as the response is sent.
+    rows = (
+        filter_attendance(filters)
+        .using(router.db_for_read(Attendance))
+        .order_by('date', 'lecture_time', 'id')
+        .values_list(
+            'date', 'lecture_time', 'student__roll_number', 'student__full_name',
+            'subject__code', 'subject__name', 'status', 'teacher__full_name',
+        )
+        .iterator(chunk_size=CHUNK_SIZE)
+    )
+    return stream_rows('Attendance', ATTENDANCE_HEADERS, rows)
+
+
+def generate_results_excel(filters):
+    rows = (
+        filter_results(filters)
+        .using(router.db_for_read(Result))
+        .order_by('subject__code', 'student__roll_number', 'id')
+        .values_list(
+            'student__roll_number', 'student__full_name', 'subject__code', 'subject__name',
+            'internal_marks', 'external_marks', 'total_marks', 'percentage', 'grade', 'is_published',
+        )
+        .iterator(chunk_size=CHUNK_SIZE)
+    )
+    return stream_rows('Results', RESULT_HEADERS, rows)
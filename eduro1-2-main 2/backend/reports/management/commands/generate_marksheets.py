@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+from reports.pdf_generator import generate_semester_marksheets
+
+
+class Command(BaseCommand):
+    help = 'Pre-render marksheet PDFs for every student in a semester'
+
+    def add_arguments(self, parser):
+        parser.add_argument('semester_id', type=int)
+        parser.add_argument('--workers', type=int, default=None)
+
+    def handle(self, *args, **options):
+        self.stdout.write('Generating marksheets...')
+        stats = generate_semester_marksheets(options['semester_id'], options['workers'])
+        self.stdout.write(self.style.SUCCESS(
+            f"Rendered {stats['rendered']} marksheets, {stats['cached']} already up to date, "
+            f"{stats['removed']} outdated removed."
+        ))
@@ -0,0 +1,219 @@
+import hashlib
+import io
+import json
+import multiprocessing
+import os
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+import django
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.styles import getSampleStyleSheet
+from reportlab.lib.units import mm
+from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+from academic.hierarchy import get_hierarchy
+from academic.models import Semester
+from authentication.models import Student
+from results.models import Result, grade_for_percentage
+
+
+# Bump when the layout changes so cached marksheets are re-rendered.
+MARKSHEET_LAYOUT_VERSION = 1
+MARKSHEET_DIR = 'marksheets'
+INSTITUTE_NAME = 'Smart Institute Management System'
+
+
+def collect_marksheet_data(semester_id, student_ids=None):
+    """Load everything the marksheets of a semester need in one query.
+
+    Returns {student_id: data} where data is plain JSON-serializable values,
+    so rendering can happen in another process without database access.
+    """
+    label = get_hierarchy().semester_label(semester_id)
+    if label is None:
+        label = str(Semester.objects.select_related('course').get(pk=semester_id))
+    semester_info = {'id': semester_id, 'label': label}
+
+    results = Result.objects.filter(subject__semester_id=semester_id, is_published=True)
+    if student_ids is not None:
+        results = results.filter(student_id__in=student_ids)
+
+    marksheets = {}
+    rows = defaultdict(list)
+    for row in results.order_by('student_id', 'subject__code').values(
+        'student_id', 'student__full_name', 'student__roll_number',
+        'subject__code', 'subject__name', 'subject__credits',
+        'internal_marks', 'external_marks', 'total_marks', 'max_total', 'grade',
+    ):
+        student_id = row['student_id']
+        if student_id not in marksheets:
+            marksheets[student_id] = {
+                'student': {
+                    'id': student_id,
+                    'full_name': row['student__full_name'],
+                    'roll_number': row['student__roll_number'],
+                },
+                'semester': semester_info,
+            }
+        rows[student_id].append({
+            'code': row['subject__code'],
+            'name': row['subject__name'],
+            'credits': row['subject__credits'],
+            'internal': row['internal_marks'],
+            'external': row['external_marks'],
+            'total': row['total_marks'],
+            'max_total': row['max_total'],
+            'grade': row['grade'],
+        })
+
+    for student_id, data in marksheets.items():
+        data['results'] = rows[student_id]
+    return marksheets
+
+
+def marksheet_digest(data):
+    """Content hash of a marksheet's inputs; unchanged results mean an unchanged PDF."""
+    payload = json.dumps({'layout': MARKSHEET_LAYOUT_VERSION, 'data': data}, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()[:20]
+
+
+def marksheet_path(data, digest):
+    return f"{MARKSHEET_DIR}/{data['semester']['id']}/{data['student']['id']}-{digest}.pdf"
+
+
+def render_marksheet(data):
+    """Render one marksheet to PDF bytes. Pure function: safe to run in a worker process."""
+    buffer = io.BytesIO()
+    document = SimpleDocTemplate(buffer, pagesize=A4, leftMargin=18 * mm, rightMargin=18 * mm)
+    styles = getSampleStyleSheet()
+
+    student = data['student']
+    results = data['results']
+    obtained = sum(result['total'] for result in results)
+    maximum = sum(result['max_total'] for result in results)
+    percentage = obtained / maximum * 100 if maximum else 0
+
+    table_rows = [['Code', 'Subject', 'Credits', 'Internal', 'External', 'Total', 'Grade']]
+    for result in results:
+        table_rows.append([
+            result['code'], result['name'], result['credits'],
+            f"{result['internal']:g}", f"{result['external']:g}", f"{result['total']:g}", result['grade'],
+        ])
+    table_rows.append(['', 'Overall', '', '', '', f"{obtained:g} / {maximum}", grade_for_percentage(percentage)])
+
+    table = Table(table_rows, repeatRows=1)
+    table.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1f3b73')),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
+        ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+        ('ALIGN', (2, 0), (-1, -1), 'CENTER'),
+    ]))
+
+    document.build([
+        Paragraph(INSTITUTE_NAME, styles['Title']),
+        Paragraph('Statement of Marks', styles['Heading2']),
+        Paragraph(f"Name: {student['full_name']}", styles['Normal']),
+        Paragraph(f"Roll Number: {student['roll_number']}", styles['Normal']),
+        Paragraph(data['semester']['label'], styles['Normal']),
+        Spacer(1, 8 * mm),
+        table,
+        Spacer(1, 6 * mm),
+        Paragraph(f"Percentage: {percentage:.2f}%", styles['Normal']),
+    ])
+    return buffer.getvalue()
+
+
+def _store_marksheet(data, digest, pdf):
+    """Save a rendered marksheet under its content path and return that path.
+
+    The path only depends on the content, so when a concurrent request
+    stored the same marksheet first, the copy the storage saved under a
+    new name is dropped and the existing file is used.
+    """
+    path = marksheet_path(data, digest)
+    saved = default_storage.save(path, ContentFile(pdf))
+    if saved != path:
+        default_storage.delete(saved)
+    return path
+
+
+def remove_stale_marksheets(semester_id, current_paths):
+    """Delete a semester's marksheets that no longer match their results.
+
+    Lists the semester directory once. Only files of students in
+    `current_paths` ({student_id: path}) are considered, and their current
+    file is always kept. Returns the number of files deleted.
+    """
+    directory = f"{MARKSHEET_DIR}/{semester_id}"
+    try:
+        _, files = default_storage.listdir(directory)
+    except FileNotFoundError:
+        return 0
+
+    removed = 0
+    for name in files:
+        student_id, _, _ = name.partition('-')
+        path = f"{directory}/{name}"
+        current = current_paths.get(int(student_id)) if student_id.isdigit() else None
+        if current is not None and path != current:
+            default_storage.delete(path)
+            removed += 1
+    return removed
+
+
+def generate_marksheet_pdf(student_id, semester_id):
+    """Return the storage path of a student's marksheet, rendering it only if its results changed.
+
+    Returns None when the student has no published results in the semester.
+    Outdated copies are left for generate_semester_marksheets to prune, so
+    a concurrent download never loses the file it is about to open.
+    """
+    data = collect_marksheet_data(semester_id, student_ids=[student_id]).get(student_id)
+    if data is None:
+        return None
+
+    digest = marksheet_digest(data)
+    path = marksheet_path(data, digest)
+    if default_storage.exists(path):
+        return path
+    return _store_marksheet(data, digest, render_marksheet(data))
+
+
+def generate_semester_marksheets(semester_id, workers=None):
+    """Render every outdated marksheet of a semester on a process pool.
+
+    Data is loaded once in this process; workers only turn plain data into
+    PDF bytes. Outdated files are pruned afterwards with a single directory
+    listing. Returns counts of rendered, already-cached and removed
+    marksheets.
+    """
+    pending = []
+    current_paths = {}
+    cached = 0
+    for student_id, data in collect_marksheet_data(semester_id).items():
+        digest = marksheet_digest(data)
+        current_paths[student_id] = marksheet_path(data, digest)
+        if default_storage.exists(current_paths[student_id]):
+            cached += 1
+        else:
+            pending.append((data, digest))
+
+    if pending:
+        workers = workers or os.cpu_count() or 1
+        # Spawned rather than forked, as with password hashing: forking a
+        # process with other threads running can deadlock. Each worker
+        # sets Django up before unpickling its first task.
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context('spawn'), initializer=django.setup,
+        ) as executor:
+            chunksize = max(1, len(pending) // (workers * 4))
+            rendered = executor.map(render_marksheet, [data for data, _ in pending], chunksize=chunksize)
+            for (data, digest), pdf in zip(pending, rendered):
+                _store_marksheet(data, digest, pdf)
+
+    removed = remove_stale_marksheets(semester_id, current_paths)
+    return {'rendered': len(pending), 'cached': cached, 'removed': removed}
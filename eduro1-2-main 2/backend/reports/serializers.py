@@ -0,0 +1,27 @@
+from rest_framework import serializers
+
+
+class ReportFilterSerializer(serializers.Serializer):
+    date_from = serializers.DateField(required=False)
+    date_to = serializers.DateField(required=False)
+    department_id = serializers.IntegerField(required=False)
+    semester_id = serializers.IntegerField(required=False)
+    subject_id = serializers.IntegerField(required=False)
+    student_id = serializers.IntegerField(required=False)
+    is_published = serializers.BooleanField(required=False, allow_null=True, default=None)
+
+
+class AttendanceTrendSerializer(serializers.Serializer):
+    GRANULARITY_CHOICES = ['day', 'week', 'month']
+
+    date_from = serializers.DateField(required=False)
+    date_to = serializers.DateField(required=False)
+    granularity = serializers.ChoiceField(choices=GRANULARITY_CHOICES, default='day')
+    department_id = serializers.IntegerField(required=False)
+    semester_id = serializers.IntegerField(required=False)
+    subject_id = serializers.IntegerField(required=False)
+
+    def validate(self, data):
+        if data.get('date_from') and data.get('date_to') and data['date_from'] > data['date_to']:
+            raise serializers.ValidationError('date_from must not be after date_to.')
+        return data
@@ -0,0 +1,57 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from academic.models import TeacherSubjectAssignment
+from attendance.models import Attendance
+from attendance.utils import attendance_marked
+from authentication.models import Teacher, Student
+from communications.models import Event
+from results.models import Result
+from results.utils import results_entered, results_published
+from .dashboards import invalidate_dashboards
+
+
+@receiver(post_save, sender=Attendance)
+@receiver(post_delete, sender=Attendance)
+@receiver(post_save, sender=Result)
+@receiver(post_delete, sender=Result)
+def record_changed(sender, instance, **kwargs):
+    invalidate_dashboards(student_ids=[instance.student_id], subject_ids=[instance.subject_id])
+
+
+@receiver(attendance_marked)
+@receiver(results_entered)
+def records_bulk_written(sender, subject_id, student_ids, **kwargs):
+    invalidate_dashboards(student_ids=student_ids, subject_ids=[subject_id])
+
+
+@receiver(results_published)
+def results_published_changed(sender, subject_ids, semester_id, student_ids, **kwargs):
+    # Marksheets are cached under a digest of their published results, so
+    # they re-render on the next download without being deleted here.
+    invalidate_dashboards(student_ids=student_ids, subject_ids=subject_ids)
+
+
+@receiver(post_save, sender=Event)
+@receiver(post_delete, sender=Event)
+def event_changed(sender, instance, **kwargs):
+    invalidate_dashboards()
+
+
+@receiver(post_save, sender=Teacher)
+@receiver(post_delete, sender=Teacher)
+def teacher_changed(sender, instance, **kwargs):
+    invalidate_dashboards(teacher_ids=[instance.pk])
+
+
+@receiver(post_save, sender=Student)
+@receiver(post_delete, sender=Student)
+def student_changed(sender, instance, **kwargs):
+    # Teachers of the student's semester count its students.
+    semester_ids = [instance.semester_id] if instance.semester_id else []
+    invalidate_dashboards(student_ids=[instance.pk], semester_ids=semester_ids)
+
+
+@receiver(post_save, sender=TeacherSubjectAssignment)
+@receiver(post_delete, sender=TeacherSubjectAssignment)
+def assignment_changed(sender, instance, **kwargs):
+    invalidate_dashboards(teacher_ids=[instance.teacher_id])
@@ -1,3 +1,130 @@
-from django.test import TestCase
+import io
+import shutil
+import tempfile
+from datetime import date, datetime, time
+from unittest import mock
+from django.core.files.storage import default_storage
+from django.test import SimpleTestCase, TestCase, override_settings
+from openpyxl import load_workbook
+from rest_framework_simplejwt.tokens import RefreshToken
+from academic.models import Department, Course, Semester, Subject
+from attendance.models import Attendance
+from authentication.models import AdminUser, Teacher, Student
+from .excel_generator import stream_rows
+from .pdf_generator import _store_marksheet, marksheet_path, remove_stale_marksheets
 
-# Create your tests here.
+
+def auth_header(user, user_type):
+    refresh = RefreshToken()
+    refresh['user_id'] = user.id
+    refresh['user_type'] = user_type
+    return {'HTTP_AUTHORIZATION': f'Bearer {refresh.access_token}'}
+
+
+def marksheet_data(student_id, semester_id=3):
+    return {
+        'student': {'id': student_id, 'full_name': f'Student {student_id}', 'roll_number': f'R{student_id:04d}'},
+        'semester': {'id': semester_id, 'label': 'Semester 3'},
+        'results': [],
+    }
+
+
+class MarksheetStorageTests(SimpleTestCase):
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root)
+        settings = override_settings(MEDIA_ROOT=self.media_root)
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+    def files(self, semester_id=3):
+        return sorted(default_storage.listdir(f'marksheets/{semester_id}')[1])
+
+    def test_concurrent_stores_of_one_marksheet_share_a_file(self):
+        data = marksheet_data(7)
+        first = _store_marksheet(data, 'aaaa', b'%PDF-first')
+        second = _store_marksheet(data, 'aaaa', b'%PDF-second')
+
+        self.assertEqual(first, second)
+        self.assertEqual(first, marksheet_path(data, 'aaaa'))
+        self.assertEqual(self.files(), ['7-aaaa.pdf'])
+
+    def test_prune_keeps_current_files_and_unlisted_students(self):
+        for student_id, digest in [(7, 'old'), (7, 'new'), (8, 'old'), (70, 'old')]:
+            _store_marksheet(marksheet_data(student_id), digest, b'%PDF')
+
+        removed = remove_stale_marksheets(3, {
+            7: marksheet_path(marksheet_data(7), 'new'),
+            8: marksheet_path(marksheet_data(8), 'new'),
+        })
+        self.assertEqual(removed, 2)
+        self.assertEqual(self.files(), ['7-new.pdf', '70-old.pdf'])
+
+
+class ExcelExportTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = AdminUser.objects.create(email='admin@sims.edu', full_name='Admin')
+        department = Department.objects.create(name='Computer Science', code='CS')
+        course = Course.objects.create(department=department, name='B.Tech', duration_years=4)
+        semester = Semester.objects.create(course=course, semester_number=3, academic_year='2024-2025')
+        subject = Subject.objects.create(semester=semester, name='Data Structures', code='CS301')
+        teacher = Teacher.objects.create(
+            email='teacher@sims.edu', full_name='Teacher', employee_id='T0001', department=department,
+        )
+        for i in range(3):
+            student = Student.objects.create(
+                email=f'student{i}@sims.edu', full_name=f'Student {i}', roll_number=f'R{i:04d}',
+                semester=semester, enrollment_year='2024',
+            )
+            Attendance.objects.create(
+                student=student, subject=subject, teacher=teacher, date=date(2024, 9, 2),
+                lecture_time=time(9), status='PRESENT' if i else 'ABSENT',
+            )
+
+    def download(self):
+        response = self.client.get('/api/admin/reports/attendance-excel', **auth_header(self.admin, 'ADMIN'))
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        return load_workbook(io.BytesIO(b''.join(response.streaming_content)))
+
+    def test_export_has_typed_rows(self):
+        sheet = self.download().active
+        rows = list(sheet.iter_rows(values_only=True))
+        self.assertEqual(rows[0][:3], ('Date', 'Lecture Time', 'Roll Number'))
+        # openpyxl reads every date cell back as a datetime.
+        self.assertEqual(rows[1], (
+            datetime(2024, 9, 2), time(9), 'R0000', 'Student 0', 'CS301', 'Data Structures', 'ABSENT', 'Teacher',
+        ))
+        self.assertEqual(len(rows), 4)
+        self.assertTrue(sheet['A1'].font.b)
+
+    @mock.patch('reports.excel_generator.MAX_ROWS_PER_SHEET', 2)
+    def test_full_sheets_continue_on_a_new_one(self):
+        workbook = self.download()
+        self.assertEqual(workbook.sheetnames, ['Attendance', 'Attendance 2'])
+        self.assertEqual([sheet.max_row for sheet in workbook], [3, 2])
+
+
+class StreamRowsTests(SimpleTestCase):
+    @mock.patch('reports.excel_generator.CHUNK_SIZE', 10)
+    def test_bytes_are_sent_while_rows_are_still_read(self):
+        read = []
+
+        def rows():
+            for i in range(100):
+                read.append(i)
+                yield (i, f'Row {i}')
+
+        chunks = stream_rows('Rows', ['Number', 'Name'], rows())
+        sent = [next(chunks), next(chunks)]
+        self.assertTrue(sent[0].startswith(b'PK'))
+        self.assertLess(len(read), 100)
+
+        sheet = load_workbook(io.BytesIO(b''.join(sent + list(chunks)))).active
+        self.assertEqual(sheet.max_row, 101)
+        self.assertEqual(sheet['B101'].value, 'Row 99')
+
+    def test_empty_export_has_a_header_row(self):
+        workbook = load_workbook(io.BytesIO(b''.join(stream_rows('Results', ['Roll Number', 'Grade'], []))))
+        self.assertEqual(list(workbook.active.values), [('Roll Number', 'Grade')])
@@ -0,0 +1,16 @@
+from django.urls import path
+from .views import (
+    DownloadAttendanceExcelView, DownloadResultsExcelView, DownloadMarksheetView,
+    AdminDashboardView, AttendanceTrendView, TeacherDashboardView, TeacherTodayScheduleView, StudentDashboardView,
+)
+
+urlpatterns = [
+    path('admin/reports/attendance-excel', DownloadAttendanceExcelView.as_view(), name='attendance-excel'),
+    path('admin/reports/results-excel', DownloadResultsExcelView.as_view(), name='results-excel'),
+    path('student/reports/marksheet', DownloadMarksheetView.as_view(), name='student-marksheet'),
+    path('admin/dashboard/stats', AdminDashboardView.as_view(), name='admin-dashboard-stats'),
+    path('admin/dashboard/attendance-trends', AttendanceTrendView.as_view(), name='admin-attendance-trends'),
+    path('teacher/dashboard/stats', TeacherDashboardView.as_view(), name='teacher-dashboard-stats'),
+    path('teacher/dashboard/today-schedule', TeacherTodayScheduleView.as_view(), name='teacher-today-schedule'),
+    path('student/dashboard/stats', StudentDashboardView.as_view(), name='student-dashboard-stats'),
+]
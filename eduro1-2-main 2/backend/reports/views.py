@@ -1,3 +1,128 @@
-from django.shortcuts import render
+from datetime import timedelta
+from django.core.files.storage import default_storage
+from django.http import FileResponse, StreamingHttpResponse
+from django.utils import timezone
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+from academic.models import Semester
+from authentication.permissions import IsAdmin, IsTeacher, IsStudent
+from backend.routers import ReplicaReadMixin
+from .dashboards import attendance_trend, build_today_schedule, get_admin_stats, get_teacher_stats, get_student_stats
+from .excel_generator import generate_attendance_excel, generate_results_excel
+from .pdf_generator import generate_marksheet_pdf
+from .serializers import AttendanceTrendSerializer, ReportFilterSerializer
 
-# Create your views here.
+
+XLSX_CONTENT_TYPE = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+
+
+class ExcelExportView(ReplicaReadMixin, APIView):
+    """Streams a workbook to the client while its rows are still being read.
+
+    The generator yields the zip container piece by piece, so the first
+    bytes leave before the query has finished and nothing is buffered in
+    memory or on disk.
+    """
+    permission_classes = [IsAdmin]
+    generator = None
+    filename_prefix = None
+
+    def get(self, request):
+        serializer = ReportFilterSerializer(data=request.query_params)
+        if not serializer.is_valid():
+            return Response({'error': 'Invalid filters', 'details': serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
+
+        filename = f"{self.filename_prefix}-{timezone.now():%Y%m%d-%H%M%S}.xlsx"
+        response = StreamingHttpResponse(self.generator(serializer.validated_data), content_type=XLSX_CONTENT_TYPE)
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+        return response
+
+
+class DownloadAttendanceExcelView(ExcelExportView):
+    generator = staticmethod(generate_attendance_excel)
+    filename_prefix = 'attendance'
+
+
+class DownloadResultsExcelView(ExcelExportView):
+    generator = staticmethod(generate_results_excel)
+    filename_prefix = 'results'
+
+
+class DownloadMarksheetView(ReplicaReadMixin, APIView):
+    permission_classes = [IsStudent]
+
+    def get(self, request):
+        semester_id = request.query_params.get('semester_id')
+        if not semester_id:
+            student = request.user.get_user()
+            semester_id = student.semester_id
+        try:
+            semester_id = int(semester_id)
+        except (TypeError, ValueError):
+            return Response({'error': 'semester_id is required'}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            path = generate_marksheet_pdf(request.user.id, semester_id)
+        except Semester.DoesNotExist:
+            return Response({'error': 'Semester not found'}, status=status.HTTP_404_NOT_FOUND)
+        if path is None:
+            return Response({'error': 'No published results for this semester'}, status=status.HTTP_404_NOT_FOUND)
+
+        return FileResponse(
+            default_storage.open(path, 'rb'), as_attachment=True,
+            filename=f'marksheet-semester-{semester_id}.pdf', content_type='application/pdf',
+        )
+
+
+class AdminDashboardView(ReplicaReadMixin, APIView):
+    permission_classes = [IsAdmin]
+
+    def get(self, request):
+        return Response(get_admin_stats())
+
+
+class AttendanceTrendView(ReplicaReadMixin, APIView):
+    permission_classes = [IsAdmin]
+    default_range = timedelta(days=30)
+
+    def get(self, request):
+        serializer = AttendanceTrendSerializer(data=request.query_params)
+        if not serializer.is_valid():
+            return Response({'error': 'Invalid filters', 'details': serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
+
+        filters = serializer.validated_data
+        date_to = filters.pop('date_to', None) or timezone.localdate()
+        date_from = filters.pop('date_from', None) or date_to - self.default_range
+        trend = attendance_trend(date_from, date_to, **filters)
+
+        return Response({
+            'granularity': filters['granularity'],
+            'date_from': date_from,
+            'date_to': date_to,
+            'dates': [row['period'] for row in trend],
+            'percentages': [row['percentage'] for row in trend],
+            'present': [row['present'] for row in trend],
+            'total': [row['total'] for row in trend],
+        })
+
+
+class TeacherDashboardView(ReplicaReadMixin, APIView):
+    permission_classes = [IsTeacher]
+
+    def get(self, request):
+        return Response(get_teacher_stats(request.user.id))
+
+
+class TeacherTodayScheduleView(ReplicaReadMixin, APIView):
+    permission_classes = [IsTeacher]
+
+    def get(self, request):
+        return Response(build_today_schedule(request.user.id))
+
+
+class StudentDashboardView(ReplicaReadMixin, APIView):
+    permission_classes = [IsStudent]
+
+    def get(self, request):
+        return Response(get_student_stats(request.user.id))
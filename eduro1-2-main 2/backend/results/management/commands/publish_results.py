@@ -0,0 +1,39 @@
+from django.core.management.base import BaseCommand, CommandError
+from academic.models import Semester, Subject
+from results.utils import claim_publication, run_publication, start_publication
+
+
+class Command(BaseCommand):
+    help = 'Publish every pending result of a subject or semester, resuming an interrupted run'
+
+    def add_arguments(self, parser):
+        scope = parser.add_mutually_exclusive_group(required=True)
+        scope.add_argument('--subject', type=int, help='Subject id to publish')
+        scope.add_argument('--semester', type=int, help='Semester id to publish')
+        parser.add_argument('--admin', type=int, default=None, help='Admin id recorded as approver')
+        parser.add_argument('--chunk-size', type=int, default=None)
+
+    def handle(self, *args, **options):
+        try:
+            subject = Subject.objects.get(pk=options['subject']) if options['subject'] else None
+            semester = Semester.objects.get(pk=options['semester']) if options['semester'] else None
+        except (Subject.DoesNotExist, Semester.DoesNotExist):
+            raise CommandError('Subject or semester not found.')
+
+        publication = start_publication(options['admin'], subject=subject, semester=semester)
+        if publication is None:
+            self.stdout.write(self.style.SUCCESS('No pending results to publish.'))
+            return
+
+        claimed = claim_publication(publication.pk)
+        if claimed is None:
+            raise CommandError(f'Publication {publication.pk} is already running elsewhere.')
+
+        self.stdout.write(f'Publishing results for {claimed.total_students} students...')
+        publication = run_publication(claimed, options['chunk_size'], progress=self.report)
+        self.stdout.write(self.style.SUCCESS(
+            f'Published {publication.published_count} results for {publication.processed_students} students.'
+        ))
+
+    def report(self, publication):
+        self.stdout.write(f'  {publication.processed_students}/{publication.total_students} students ({publication.progress}%)')
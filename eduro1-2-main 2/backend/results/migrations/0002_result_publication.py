@@ -0,0 +1,41 @@
+# Generated by Django 4.2.7 on 2026-10-18 15:03
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0001_initial'),
+        ('academic', '0002_initial'),
+        ('results', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ResultPublication',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('PENDING', 'Pending'), ('RUNNING', 'Running'), ('DONE', 'Done'), ('FAILED', 'Failed')], default='PENDING', max_length=10)),
+                ('total_students', models.IntegerField(default=0)),
+                ('processed_students', models.IntegerField(default=0)),
+                ('published_count', models.IntegerField(default=0)),
+                ('cursor_student_id', models.BigIntegerField(default=0)),
+                ('last_error', models.TextField(blank=True, null=True)),
+                ('locked_at', models.DateTimeField(blank=True, null=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('approved_by_admin', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='result_publications', to='authentication.adminuser')),
+                ('semester', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='result_publications', to='academic.semester')),
+                ('subject', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='result_publications', to='academic.subject')),
+            ],
+            options={
+                'verbose_name': 'Result Publication',
+                'verbose_name_plural': 'Result Publications',
+                'db_table': 'result_publications',
+                'indexes': [models.Index(fields=['status', 'created_at'], name='result_publ_status_46119f_idx')],
+            },
+        ),
+    ]
@@ -1,6 +1,17 @@
+from bisect import bisect_right
 from django.db import models
 
 
+# Lower percentage bound of each grade above F, in ascending order.
+GRADE_CUTOFFS = [40, 50, 60, 70, 80, 90]
+GRADES = ['F', 'D', 'C', 'B', 'B+', 'A', 'A+']
+
+
+def grade_for_percentage(percentage):
+    """Map a percentage onto the 10-point grading scale."""
+    return GRADES[bisect_right(GRADE_CUTOFFS, percentage)]
+
+
 class Result(models.Model):
     """Result model for storing student marks and grades."""
     GRADE_CHOICES = [
@@ -45,20 +56,7 @@ class Result(models.Model):
 
     def calculate_grade(self):
         """Calculate grade based on percentage using standard 10-point grading scale."""
-        if self.percentage >= 90:
-            return 'A+'
-        elif self.percentage >= 80:
-            return 'A'
-        elif self.percentage >= 70:
-            return 'B+'
-        elif self.percentage >= 60:
-            return 'B'
-        elif self.percentage >= 50:
-            return 'C'
-        elif self.percentage >= 40:
-            return 'D'
-        else:
-            return 'F'
+        return grade_for_percentage(self.percentage)
 
     def save(self, *args, **kwargs):
         """Override save to automatically calculate total, percentage, and grade."""
@@ -66,3 +64,50 @@ class Result(models.Model):
         self.percentage = (self.total_marks / self.max_total) * 100
         self.grade = self.calculate_grade()
         super().save(*args, **kwargs)
+
+
+class ResultPublication(models.Model):
+    """A run publishing every pending result of a subject or a semester.
+
+    Students are processed in id order and the cursor records the last one
+    done, so a retried or interrupted run resumes instead of starting over.
+    """
+    STATUS_CHOICES = [
+        ('PENDING', 'Pending'),
+        ('RUNNING', 'Running'),
+        ('DONE', 'Done'),
+        ('FAILED', 'Failed'),
+    ]
+
+    subject = models.ForeignKey('academic.Subject', on_delete=models.CASCADE, null=True, blank=True, related_name='result_publications')
+    semester = models.ForeignKey('academic.Semester', on_delete=models.CASCADE, null=True, blank=True, related_name='result_publications')
+    approved_by_admin = models.ForeignKey('authentication.AdminUser', on_delete=models.SET_NULL, null=True, blank=True, related_name='result_publications')
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='PENDING')
+    total_students = models.IntegerField(default=0)
+    processed_students = models.IntegerField(default=0)
+    published_count = models.IntegerField(default=0)
+    cursor_student_id = models.BigIntegerField(default=0)
+    last_error = models.TextField(blank=True, null=True)
+    locked_at = models.DateTimeField(blank=True, null=True)
+    finished_at = models.DateTimeField(blank=True, null=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'result_publications'
+        verbose_name = 'Result Publication'
+        verbose_name_plural = 'Result Publications'
+        indexes = [
+            models.Index(fields=['status', 'created_at']),
+        ]
+
+    def __str__(self):
+        scope = f"subject {self.subject_id}" if self.subject_id else f"semester {self.semester_id}"
+        return f"Publish {scope} - {self.status}"
+
+    @property
+    def progress(self):
+        """Percentage of the cohort processed so far."""
+        if not self.total_students:
+            return 100 if self.status == 'DONE' else 0
+        return round(self.processed_students / self.total_students * 100, 1)
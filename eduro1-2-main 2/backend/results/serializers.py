@@ -0,0 +1,73 @@
+from rest_framework import serializers
+from academic.hierarchy import get_hierarchy
+from backend.serializers import EagerLoadingMixin
+from .models import Result, ResultPublication
+
+
+MAX_INTERNAL = Result._meta.get_field('max_internal').default
+MAX_EXTERNAL = Result._meta.get_field('max_external').default
+
+
+class ResultEntrySerializer(serializers.Serializer):
+    student_id = serializers.IntegerField()
+    internal_marks = serializers.FloatField(min_value=0, max_value=MAX_INTERNAL)
+    external_marks = serializers.FloatField(min_value=0, max_value=MAX_EXTERNAL)
+    remarks = serializers.CharField(required=False, allow_blank=True, allow_null=True)
+
+
+class BulkResultEntrySerializer(serializers.Serializer):
+    subject_id = serializers.IntegerField()
+    results = ResultEntrySerializer(many=True, allow_empty=False)
+
+    def validate_results(self, value):
+        student_ids = [entry['student_id'] for entry in value]
+        if len(student_ids) != len(set(student_ids)):
+            raise serializers.ValidationError('Each student can only have one result per subject.')
+        return value
+
+
+class ResultPublishSerializer(serializers.Serializer):
+    subject_id = serializers.IntegerField(required=False)
+    semester_id = serializers.IntegerField(required=False)
+
+    def validate(self, data):
+        if ('subject_id' in data) == ('semester_id' in data):
+            raise serializers.ValidationError('Provide exactly one of subject_id or semester_id.')
+        return data
+
+
+class ResultPublicationSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = ResultPublication
+        fields = [
+            'id', 'subject', 'semester', 'status', 'total_students', 'processed_students',
+            'published_count', 'progress', 'last_error', 'created_at', 'finished_at',
+        ]
+
+
+class ResultSerializer(EagerLoadingMixin, serializers.ModelSerializer):
+    roll_number = serializers.CharField(source='student.roll_number', read_only=True)
+    student_name = serializers.CharField(source='student.full_name', read_only=True)
+    subject_code = serializers.SerializerMethodField()
+    subject_name = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Result
+        fields = [
+            'id', 'student', 'roll_number', 'student_name', 'subject', 'subject_code', 'subject_name',
+            'internal_marks', 'external_marks', 'total_marks', 'max_total', 'percentage', 'grade',
+            'is_published', 'remarks', 'updated_at',
+        ]
+
+    def get_subject_code(self, obj):
+        return self._subject(obj).code
+
+    def get_subject_name(self, obj):
+        return self._subject(obj).name
+
+    def _subject(self, obj):
+        return get_hierarchy().subjects.get(obj.subject_id) or obj.subject
+
+
+class ResultListFilterSerializer(serializers.Serializer):
+    semester_id = serializers.IntegerField(required=False)
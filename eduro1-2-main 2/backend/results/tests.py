@@ -1,3 +1,130 @@
+from unittest import mock
 from django.test import TestCase
+from academic.models import Department, Course, Semester, Subject
+from authentication.models import AdminUser, Teacher, Student
+from notifications.models import Notification
+from .models import Result, ResultPublication
+from .utils import claim_publication, enter_subject_results, run_publication, start_publication
 
-# Create your tests here.
+
+class ResultTestData:
+    @classmethod
+    def setUpTestData(cls):
+        department = Department.objects.create(name='Computer Science', code='CS')
+        course = Course.objects.create(department=department, name='B.Tech', duration_years=4)
+        cls.semester = Semester.objects.create(course=course, semester_number=3, academic_year='2024-2025')
+        other_semester = Semester.objects.create(course=course, semester_number=5, academic_year='2024-2025')
+        cls.subject = Subject.objects.create(semester=cls.semester, name='Data Structures', code='CS301')
+        cls.teacher = Teacher.objects.create(
+            email='teacher@sims.edu', full_name='Teacher', employee_id='T0001', department=department,
+        )
+        cls.students = [
+            Student.objects.create(
+                email=f'student{i}@sims.edu', full_name=f'Student {i}', roll_number=f'R{i:04d}',
+                semester=cls.semester, enrollment_year='2024',
+            )
+            for i in range(3)
+        ]
+        cls.outsider = Student.objects.create(
+            email='outsider@sims.edu', full_name='Outsider', roll_number='R9999',
+            semester=other_semester, enrollment_year='2022',
+        )
+
+
+class EnterSubjectResultsTests(ResultTestData, TestCase):
+    def enter(self, marks):
+        entries = [
+            {'student_id': student_id, 'internal_marks': internal, 'external_marks': external}
+            for student_id, (internal, external) in marks.items()
+        ]
+        outcomes = enter_subject_results(self.teacher.id, self.subject, entries)
+        return {outcome['student_id']: outcome['outcome'] for outcome in outcomes}
+
+    def test_batch_is_graded_like_single_saves(self):
+        first, second, _ = self.students
+        self.assertEqual(self.enter({first.id: (25, 60), second.id: (10, 20)}), {first.id: 'created', second.id: 'created'})
+
+        result = Result.objects.get(student=first, subject=self.subject)
+        self.assertEqual((result.total_marks, result.percentage, result.grade), (85, 85, 'A'))
+        result.save()
+        self.assertEqual(Result.objects.get(pk=result.pk).grade, 'A')
+        self.assertEqual(Result.objects.get(student=second, subject=self.subject).grade, 'F')
+
+    def test_reentry_updates_unpublished_and_keeps_published(self):
+        first, second, _ = self.students
+        self.enter({first.id: (25, 60), second.id: (10, 20)})
+        Result.objects.filter(student=second).update(is_published=True)
+
+        self.assertEqual(self.enter({first.id: (30, 70), second.id: (30, 70)}), {first.id: 'updated', second.id: 'published'})
+        self.assertEqual(Result.objects.get(student=first).grade, 'A+')
+        self.assertEqual(Result.objects.get(student=second).grade, 'F')
+
+    def test_reentry_grades_out_of_the_stored_max_total(self):
+        first, second, _ = self.students
+        self.enter({first.id: (5, 5)})
+        Result.objects.filter(student=first).update(max_total=50)
+
+        self.enter({first.id: (10, 20), second.id: (10, 20)})
+        result = Result.objects.get(student=first)
+        self.assertEqual((result.max_total, result.percentage, result.grade), (50, 60, 'B'))
+        result.save()
+        self.assertEqual(Result.objects.get(pk=result.pk).grade, 'B')
+        self.assertEqual(Result.objects.get(student=second).grade, 'F')
+
+    def test_students_outside_the_semester_are_rejected(self):
+        first = self.students[0]
+        self.assertEqual(self.enter({first.id: (20, 50), self.outsider.id: (20, 50)}), {
+            first.id: 'created', self.outsider.id: 'invalid_student',
+        })
+        self.assertFalse(Result.objects.filter(student=self.outsider).exists())
+
+
+class PublicationTests(ResultTestData, TestCase):
+    def setUp(self):
+        self.admin = AdminUser.objects.create(email='admin@sims.edu', full_name='Admin')
+        enter_subject_results(self.teacher.id, self.subject, [
+            {'student_id': student.id, 'internal_marks': 20, 'external_marks': 50} for student in self.students
+        ])
+
+    def publish(self, chunk_size=1):
+        publication = start_publication(self.admin.id, subject=self.subject)
+        return run_publication(claim_publication(publication.pk), chunk_size=chunk_size)
+
+    def notified(self):
+        return sorted(Notification.objects.filter(notification_type='RESULT_PUBLISHED').values_list('recipient_id', flat=True))
+
+    def test_publishes_every_pending_result_once(self):
+        publication = self.publish()
+        self.assertEqual(
+            (publication.status, publication.total_students, publication.published_count, publication.progress),
+            ('DONE', 3, 3, 100),
+        )
+        self.assertFalse(Result.objects.filter(is_published=False).exists())
+        self.assertEqual(set(Result.objects.values_list('approved_by_admin', flat=True)), {self.admin.id})
+        self.assertEqual(self.notified(), sorted(student.id for student in self.students))
+
+    def test_failed_chunk_resumes_from_cursor(self):
+        first = self.students[0]
+        with mock.patch('results.utils.adjust_unread', side_effect=[None, RuntimeError('boom')]):
+            with self.assertRaises(RuntimeError):
+                self.publish()
+
+        publication = ResultPublication.objects.get()
+        self.assertEqual((publication.status, publication.cursor_student_id, publication.last_error), ('FAILED', first.id, 'boom'))
+        self.assertEqual(list(Result.objects.filter(is_published=True).values_list('student', flat=True)), [first.id])
+
+        self.assertEqual(start_publication(self.admin.id, subject=self.subject), publication)
+        publication = self.publish()
+        self.assertEqual((publication.status, publication.processed_students, publication.published_count), ('DONE', 3, 3))
+        self.assertEqual(self.notified(), sorted(student.id for student in self.students))
+
+    def test_rerun_after_success_is_a_no_op(self):
+        self.publish()
+        self.assertIsNone(start_publication(self.admin.id, subject=self.subject))
+        self.assertEqual(ResultPublication.objects.count(), 1)
+        self.assertEqual(len(self.notified()), 3)
+
+    def test_running_publication_is_not_claimed_twice(self):
+        publication = start_publication(self.admin.id, subject=self.subject)
+        self.assertIsNotNone(claim_publication(publication.pk))
+        self.assertIsNone(claim_publication(publication.pk))
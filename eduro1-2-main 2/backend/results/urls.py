@@ -0,0 +1,12 @@
+from django.urls import path
+from .views import (
+    BulkEnterResultView, PublishResultsView, ResultPublicationStatusView, StudentResultsView, SubjectResultsView,
+)
+
+urlpatterns = [
+    path('teacher/results/bulk-enter', BulkEnterResultView.as_view(), name='bulk-enter-results'),
+    path('teacher/results/subject/<int:subject_id>', SubjectResultsView.as_view(), name='subject-results'),
+    path('student/results/my-results', StudentResultsView.as_view(), name='my-results'),
+    path('admin/results/publish', PublishResultsView.as_view(), name='publish-results'),
+    path('admin/results/publish/<int:publication_id>', ResultPublicationStatusView.as_view(), name='result-publication-status'),
+]
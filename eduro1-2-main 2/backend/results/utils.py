@@ -0,0 +1,254 @@
+from datetime import timedelta
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, Q
+from django.dispatch import Signal
+from django.utils import timezone
+from academic.models import Subject
+from authentication.models import Student
+from notifications.counters import adjust_unread
+from notifications.models import Notification
+from notifications.push import push_notifications
+from .models import Result, ResultPublication, grade_for_percentage
+
+
+# Sent after a subject's results are written in bulk, since bulk writes skip
+# post_save. Receives subject_id and student_ids (those created or updated).
+results_entered = Signal()
+
+# Sent once when a publication finishes. Receives subject_ids, semester_id
+# (None for a single subject) and student_ids (the whole cohort in scope).
+results_published = Signal()
+
+MAX_TOTAL = Result._meta.get_field('max_total').default
+
+RESULT_UPSERT_FIELDS = [
+    'internal_marks', 'external_marks', 'total_marks', 'percentage', 'grade',
+    'remarks', 'entered_by_teacher', 'updated_at',
+]
+
+
+def compute_result_fields(entries):
+    """Fill total_marks, percentage and grade for a whole batch of entries.
+
+    Bulk writes skip Result.save(), so the batch path computes the derived
+    columns here in one pass with the same grading scale. Each entry is
+    graded out of its own max_total, which defaults to the model's.
+    """
+    for entry in entries:
+        max_total = entry.setdefault('max_total', MAX_TOTAL)
+        total = entry['internal_marks'] + entry['external_marks']
+        percentage = total / max_total * 100
+        entry['total_marks'] = total
+        entry['percentage'] = percentage
+        entry['grade'] = grade_for_percentage(percentage)
+    return entries
+
+
+def enter_subject_results(teacher_id, subject, entries, batch_size=1000):
+    """Validate and upsert a subject's marks in one bulk statement per batch.
+
+    Returns one outcome per entry: created, updated, published (already
+    published, left untouched) or invalid_student; only active students of
+    the subject's semester are valid.
+    """
+    student_ids = [entry['student_id'] for entry in entries]
+    valid_ids = set(
+        Student.objects.filter(
+            id__in=student_ids, is_active=True, semester_id=subject.semester_id
+        ).values_list('id', flat=True)
+    )
+    outcomes = []
+    to_write = []
+    with transaction.atomic():
+        # Classify against a stable view of the subject's results, as
+        # mark_lecture_attendance does.
+        list(Subject.objects.select_for_update().filter(pk=subject.pk).values_list('pk'))
+        existing = {}
+        max_totals = {}
+        for student_id, is_published, max_total in (
+            Result.objects.filter(subject=subject).values_list('student_id', 'is_published', 'max_total')
+        ):
+            existing[student_id] = is_published
+            max_totals[student_id] = max_total
+
+        # Re-entered marks are graded out of the stored row's max_total,
+        # which the upsert leaves in place.
+        for entry in entries:
+            if entry['student_id'] in max_totals:
+                entry['max_total'] = max_totals[entry['student_id']]
+        compute_result_fields(entries)
+
+        for entry in entries:
+            student_id = entry['student_id']
+            if student_id not in valid_ids:
+                outcome = 'invalid_student'
+            elif existing.get(student_id):
+                outcome = 'published'
+            elif student_id in existing:
+                outcome = 'updated'
+            else:
+                outcome = 'created'
+
+            if outcome in ('created', 'updated'):
+                to_write.append(Result(
+                    student_id=student_id,
+                    subject=subject,
+                    internal_marks=entry['internal_marks'],
+                    external_marks=entry['external_marks'],
+                    total_marks=entry['total_marks'],
+                    max_total=entry['max_total'],
+                    percentage=entry['percentage'],
+                    grade=entry['grade'],
+                    remarks=entry.get('remarks'),
+                    entered_by_teacher_id=teacher_id,
+                ))
+            outcomes.append({
+                'student_id': student_id,
+                'total_marks': entry['total_marks'],
+                'percentage': round(entry['percentage'], 2),
+                'grade': entry['grade'],
+                'outcome': outcome,
+            })
+
+        if to_write:
+            Result.objects.bulk_create(
+                to_write,
+                batch_size=batch_size,
+                update_conflicts=True,
+                unique_fields=['student', 'subject'],
+                update_fields=RESULT_UPSERT_FIELDS,
+            )
+            results_entered.send(
+                sender=Result, subject_id=subject.id,
+                student_ids=[result.student_id for result in to_write],
+            )
+
+    return outcomes
+
+
+def publication_scope(publication):
+    """All results a publication covers, published or not."""
+    if publication.subject_id:
+        return Result.objects.filter(subject_id=publication.subject_id)
+    return Result.objects.filter(subject__semester_id=publication.semester_id)
+
+
+def start_publication(admin_id, subject=None, semester=None):
+    """Return the unfinished publication for this scope, or a new one.
+
+    Returns None when nothing in scope is waiting to be published, so a
+    retried request after success is a no-op.
+    """
+    scope = Q(subject=subject) if subject else Q(semester=semester, subject__isnull=True)
+    publication = (
+        ResultPublication.objects.filter(scope, status__in=['PENDING', 'RUNNING', 'FAILED'])
+        .order_by('created_at').first()
+    )
+    if publication is not None:
+        if publication.approved_by_admin_id is None and admin_id:
+            publication.approved_by_admin_id = admin_id
+            ResultPublication.objects.filter(pk=publication.pk).update(approved_by_admin_id=admin_id)
+        return publication
+
+    publication = ResultPublication(subject=subject, semester=semester, approved_by_admin_id=admin_id)
+    pending = publication_scope(publication).filter(is_published=False)
+    total = pending.values('student_id').distinct().count()
+    if not total:
+        return None
+    publication.total_students = total
+    publication.save()
+    return publication
+
+
+def claim_publication(publication_id):
+    """Atomically take ownership of a publication that is not already running."""
+    now = timezone.now()
+    stale = now - timedelta(seconds=settings.RESULT_PUBLISH_LOCK_TIMEOUT)
+    claimed = ResultPublication.objects.filter(pk=publication_id).filter(
+        Q(status__in=['PENDING', 'FAILED']) | Q(status='RUNNING', locked_at__lt=stale)
+    ).update(status='RUNNING', locked_at=now, updated_at=now)
+    if not claimed:
+        return None
+    return ResultPublication.objects.select_related('subject', 'semester').get(pk=publication_id)
+
+
+def _publication_message(publication):
+    if publication.subject_id:
+        subject = publication.subject
+        return publication.subject_id, f"Your result for {subject.code} - {subject.name} has been published."
+    semester = publication.semester
+    return publication.semester_id, (
+        f"Your results for Semester {semester.semester_number} ({semester.academic_year}) have been published."
+    )
+
+
+def run_publication(publication, chunk_size=None, progress=None):
+    """Publish a claimed publication's pending results, one chunk of students at a time.
+
+    Each chunk flips its results with a single UPDATE and inserts one
+    RESULT_PUBLISHED notification per student in the same transaction as
+    the cursor advance. `progress(publication)` is called after every chunk.
+    """
+    chunk_size = chunk_size or settings.RESULT_PUBLISH_CHUNK_SIZE
+    scope = publication_scope(publication)
+    pending = scope.filter(is_published=False)
+    related_id, message = _publication_message(publication)
+
+    try:
+        while True:
+            student_ids = list(
+                pending.filter(student_id__gt=publication.cursor_student_id)
+                .order_by('student_id').values_list('student_id', flat=True).distinct()[:chunk_size]
+            )
+            if not student_ids:
+                break
+
+            with transaction.atomic():
+                now = timezone.now()
+                published = pending.filter(student_id__in=student_ids).update(
+                    is_published=True, approved_by_admin_id=publication.approved_by_admin_id, updated_at=now,
+                )
+                notifications = Notification.objects.bulk_create([
+                    Notification(
+                        recipient_type='STUDENT',
+                        recipient_id=student_id,
+                        notification_type='RESULT_PUBLISHED',
+                        title='Results Published',
+                        message=message,
+                        related_id=related_id,
+                    )
+                    for student_id in student_ids
+                ])
+                adjust_unread('STUDENT', student_ids, 1)
+                ResultPublication.objects.filter(pk=publication.pk).update(
+                    cursor_student_id=student_ids[-1],
+                    processed_students=F('processed_students') + len(student_ids),
+                    published_count=F('published_count') + published,
+                    locked_at=now,
+                    updated_at=now,
+                )
+                transaction.on_commit(lambda notifications=notifications: push_notifications(notifications))
+
+            publication.refresh_from_db()
+            if progress:
+                progress(publication)
+    except Exception as exc:
+        ResultPublication.objects.filter(pk=publication.pk).update(
+            status='FAILED', last_error=str(exc), locked_at=None, updated_at=timezone.now(),
+        )
+        raise
+
+    now = timezone.now()
+    ResultPublication.objects.filter(pk=publication.pk).update(
+        status='DONE', last_error=None, locked_at=None, finished_at=now, updated_at=now,
+    )
+    publication.refresh_from_db()
+
+    results_published.send(
+        sender=Result,
+        subject_ids=list(scope.values_list('subject_id', flat=True).distinct()),
+        semester_id=publication.semester_id,
+        student_ids=list(scope.values_list('student_id', flat=True).distinct()),
+    )
+    return publication
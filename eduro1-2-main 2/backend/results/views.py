@@ -1,3 +1,128 @@
-from django.shortcuts import render
+from collections import Counter
+from rest_framework import generics
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+from authentication.permissions import IsAdmin, IsStudent, IsTeacher
+from academic.models import Semester, Subject, TeacherSubjectAssignment
+from backend.conditional import ConditionalGetMixin
+from backend.serializers import SerializeTimingViewMixin
+from .models import Result, ResultPublication
+from .serializers import (
+    BulkResultEntrySerializer, ResultListFilterSerializer, ResultPublicationSerializer, ResultPublishSerializer,
+    ResultSerializer,
+)
+from .utils import claim_publication, enter_subject_results, run_publication, start_publication
 
-# Create your views here.
+
+class BulkEnterResultView(APIView):
+    permission_classes = [IsTeacher]
+
+    def post(self, request):
+        serializer = BulkResultEntrySerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response({'error': 'Invalid data', 'details': serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
+
+        data = serializer.validated_data
+
+        try:
+            subject = Subject.objects.get(id=data['subject_id'])
+        except Subject.DoesNotExist:
+            return Response({'error': 'Subject not found'}, status=status.HTTP_404_NOT_FOUND)
+
+        teacher_id = request.user.id
+        if not TeacherSubjectAssignment.objects.filter(teacher_id=teacher_id, subject=subject).exists():
+            return Response({'error': 'Subject is not assigned to this teacher'}, status=status.HTTP_403_FORBIDDEN)
+
+        outcomes = enter_subject_results(teacher_id, subject, data['results'])
+
+        return Response({
+            'subject_id': subject.id,
+            'summary': Counter(outcome['outcome'] for outcome in outcomes),
+            'results': outcomes,
+        })
+
+
+class PublishResultsView(APIView):
+    """Publish every pending result of a subject or a semester.
+
+    Retrying is safe: an interrupted run is resumed, a run still in progress
+    elsewhere is reported with 202, and nothing left to publish is a no-op.
+    """
+    permission_classes = [IsAdmin]
+
+    def post(self, request):
+        serializer = ResultPublishSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response({'error': 'Invalid data', 'details': serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
+
+        data = serializer.validated_data
+        subject = semester = None
+        if 'subject_id' in data:
+            subject = Subject.objects.filter(id=data['subject_id']).first()
+            if subject is None:
+                return Response({'error': 'Subject not found'}, status=status.HTTP_404_NOT_FOUND)
+        else:
+            semester = Semester.objects.filter(id=data['semester_id']).first()
+            if semester is None:
+                return Response({'error': 'Semester not found'}, status=status.HTTP_404_NOT_FOUND)
+
+        publication = start_publication(request.user.id, subject=subject, semester=semester)
+        if publication is None:
+            return Response({'message': 'No pending results to publish', 'published_count': 0})
+
+        claimed = claim_publication(publication.pk)
+        if claimed is None:
+            publication.refresh_from_db()
+            return Response(ResultPublicationSerializer(publication).data, status=status.HTTP_202_ACCEPTED)
+
+        publication = run_publication(claimed)
+        return Response(ResultPublicationSerializer(publication).data)
+
+
+class ResultPublicationStatusView(APIView):
+    permission_classes = [IsAdmin]
+
+    def get(self, request, publication_id):
+        try:
+            publication = ResultPublication.objects.get(id=publication_id)
+        except ResultPublication.DoesNotExist:
+            return Response({'error': 'Publication not found'}, status=status.HTTP_404_NOT_FOUND)
+        return Response(ResultPublicationSerializer(publication).data)
+
+
+class ResultListView(ConditionalGetMixin, SerializeTimingViewMixin, generics.ListAPIView):
+    """Results by subject, optionally filtered by semester_id."""
+    serializer_class = ResultSerializer
+
+    def list(self, request, *args, **kwargs):
+        filters = ResultListFilterSerializer(data=request.query_params)
+        if not filters.is_valid():
+            return Response({'error': 'Invalid filters', 'details': filters.errors}, status=status.HTTP_400_BAD_REQUEST)
+        self.filters = filters.validated_data
+        return super().list(request, *args, **kwargs)
+
+    def get_queryset(self):
+        queryset = self.get_records()
+        if 'semester_id' in self.filters:
+            queryset = queryset.filter(subject__semester_id=self.filters['semester_id'])
+        return self.get_serializer_class().setup_eager_loading(queryset.order_by('subject_id', 'student_id'))
+
+
+class StudentResultsView(ResultListView):
+    permission_classes = [IsStudent]
+
+    def get_records(self):
+        return Result.objects.filter(student_id=self.request.user.id, is_published=True)
+
+
+class SubjectResultsView(ResultListView):
+    permission_classes = [IsTeacher]
+
+    def list(self, request, subject_id):
+        if not TeacherSubjectAssignment.objects.filter(teacher_id=request.user.id, subject_id=subject_id).exists():
+            return Response({'error': 'Subject is not assigned to this teacher'}, status=status.HTTP_403_FORBIDDEN)
+        return super().list(request, subject_id)
+
+    def get_records(self):
+        return Result.objects.filter(subject_id=self.kwargs['subject_id'])